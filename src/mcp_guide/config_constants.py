@@ -9,3 +9,10 @@ CONTEXT_DIR = "_context"
 # Pattern matching safety limits
 MAX_GLOB_DEPTH = 8
 MAX_DOCUMENTS_PER_GLOB = 100
+
+# Content gathering and rendering concurrency
+MAX_CONCURRENT_DISCOVERIES = 8
+MAX_CONCURRENT_FILE_RENDERS = 8
+
+# Worker threads for renders offloaded from the event loop (see render.offload)
+MAX_RENDER_WORKERS = 4
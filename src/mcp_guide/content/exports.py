@@ -0,0 +1,184 @@
+"""Staleness tracking for content exports.
+
+list_exports compares the metadata hash of the files an export currently covers
+with the hash recorded when it was exported. Gathering those files means a full
+discovery per export, so the tracker remembers, for each export, the files and
+category directories of its last gather together with their hash. Docroot change
+events then mark an export stale when one of its files changes, or unverified
+when a file is added or removed below one of its directories, and only those
+exports are gathered again. Exports are also re-verified periodically in the
+background, which covers changes the events cannot report.
+
+Entries are only trusted while every directory they cover is watched (see
+watchers.docroot_watcher), and only for the category configuration and document
+store generation they were recorded with.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from mcp_guide.watchers.docroot_watcher import add_docroot_listener, get_docroot_generation, is_watched
+
+# Seconds after which a tracked export is gathered again in the background
+EXPORT_VERIFY_INTERVAL = 300.0
+
+
+@dataclass
+class TrackedExport:
+    """The files an export covered at its last gather."""
+
+    # Metadata hash of the gathered files (None when nothing matched)
+    metadata_hash: Optional[str]
+    # Absolute paths of the gathered filesystem files
+    files: frozenset[str]
+    # Category directories searched by the gather
+    directories: frozenset[str]
+    # Fingerprint of the category and collection configuration gathered with
+    config: Hashable
+    store_generation: int
+    verified_at: float = field(default_factory=time.monotonic)
+    # A gathered file has changed since, so the hash no longer matches
+    changed: bool = False
+    # A file was added or removed below a directory; the export must be gathered again
+    dirty: bool = False
+
+
+class ExportTracker:
+    """Tracked exports by (docroot, project, expression, pattern)."""
+
+    def __init__(self, verify_interval: float = EXPORT_VERIFY_INTERVAL) -> None:
+        self.verify_interval = verify_interval
+        self._entries: dict[Hashable, TrackedExport] = {}
+        self._stats = {"hits": 0, "misses": 0, "invalidated": 0}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        key: Hashable,
+        *,
+        metadata_hash: Optional[str],
+        files: Iterable[str],
+        directories: Iterable[str],
+        config: Hashable,
+        store_generation: int,
+        docroot_generation: int,
+    ) -> bool:
+        """Remember the result of gathering an export's files.
+
+        Args:
+            store_generation: Store generation read before gathering
+            docroot_generation: Docroot generation read before gathering; if files changed
+                while gathering, the export is tracked but gathered again on next use
+
+        Returns:
+            False if the export was not tracked because a directory is not watched
+        """
+        directories = frozenset(d.rstrip(os.sep) or os.sep for d in directories)
+        if not all(is_watched(directory) for directory in directories):
+            self.forget(key)
+            return False
+        entry = TrackedExport(
+            metadata_hash=metadata_hash,
+            files=frozenset(files),
+            directories=directories,
+            config=config,
+            store_generation=store_generation,
+            dirty=docroot_generation != get_docroot_generation(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+        return True
+
+    def lookup(self, key: Hashable, config: Hashable, store_generation: int) -> Optional[TrackedExport]:
+        """Return the tracked export if it can still answer without gathering.
+
+        Args:
+            store_generation: Current document store generation (see get_store_generation)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            usable = (
+                entry is not None
+                and not entry.dirty
+                and entry.config == config
+                and entry.store_generation == store_generation
+            )
+        if entry is None or not usable or not all(is_watched(directory) for directory in entry.directories):
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        with self._lock:
+            self._stats["hits"] += 1
+        return entry
+
+    def claim_due(self, keys: Iterable[Hashable]) -> list[Hashable]:
+        """Return the keys due for re-verification, restarting their interval."""
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and now - entry.verified_at >= self.verify_interval:
+                    entry.verified_at = now
+                    due.append(key)
+        return due
+
+    def forget(self, key: Hashable) -> None:
+        """Stop tracking an export."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def retain(self, scope: Hashable, keys: Iterable[Hashable]) -> None:
+        """Forget tracked exports of scope (the key prefix before expression and pattern) not in keys."""
+        keep = set(keys)
+        with self._lock:
+            for key in [k for k in self._entries if isinstance(k, tuple) and k[:-2] == scope and k not in keep]:
+                del self._entries[key]
+
+    def files_changed(self, paths: frozenset[str]) -> None:
+        """Docroot listener marking exports affected by changed files (all of them if paths is empty)."""
+        with self._lock:
+            invalidated = 0
+            for entry in self._entries.values():
+                if entry.changed or entry.dirty:
+                    continue
+                if not paths or any(self._below(path, entry.directories) for path in paths):
+                    if paths and not entry.files.isdisjoint(paths):
+                        entry.changed = True
+                    else:
+                        entry.dirty = True
+                    invalidated += 1
+            self._stats["invalidated"] += invalidated
+
+    @staticmethod
+    def _below(path: str, directories: frozenset[str]) -> bool:
+        return any(path.startswith(os.path.join(directory, "")) for directory in directories)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return lookup hits and misses, invalidations and the number of tracked exports."""
+        with self._lock:
+            return {**self._stats, "tracked": len(self._entries)}
+
+    def clear(self) -> None:
+        """Forget every tracked export."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.update(hits=0, misses=0, invalidated=0)
+
+
+_tracker: Optional[ExportTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_export_tracker() -> ExportTracker:
+    """Return the process-wide export tracker, subscribed to docroot file changes."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = ExportTracker()
+            add_docroot_listener(_tracker.files_changed)
+        return _tracker
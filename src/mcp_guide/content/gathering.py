@@ -1,8 +1,14 @@
 """Common content gathering and rendering functions."""
 
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import anyio
+
+from mcp_guide.config_constants import MAX_CONCURRENT_DISCOVERIES
 from mcp_guide.content.utils import resolve_patterns
 from mcp_guide.discovery.files import FileInfo, discover_documents
 from mcp_guide.models import (
@@ -11,7 +17,20 @@ from mcp_guide.models import (
     ExpressionParseError,
     Project,
 )
+from mcp_guide.render.memo import fingerprint
 from mcp_guide.session import Session
+from mcp_guide.store.document_store import get_documents, get_store_generation
+from mcp_guide.watchers.docroot_watcher import add_docroot_listener, get_docroot_generation, is_watched
+
+# Maximum number of gathered file sets kept (one per expression and configuration)
+GATHER_CACHE_SIZE = 128
+
+# Gathered files by (docroot, configuration, expression, visited collections,
+# docroot generation, store generation). Entries hold clones and are handed out as
+# clones, since callers load content into and change the files they are given.
+_gathered: OrderedDict[Hashable, tuple[FileInfo, ...]] = OrderedDict()
+_gather_stats = {"hits": 0, "misses": 0, "bypassed": 0}
+_gather_lock = threading.Lock()
 
 
 def parse_expression(expression: str) -> list[DocumentExpression]:
@@ -72,38 +91,22 @@ def parse_expression(expression: str) -> list[DocumentExpression]:
     return expressions
 
 
-async def gather_content(
-    session: Session,
+def _plan_discovery(
     project: Project,
     expression: str,
-    visited_collections: Optional[set[str]] = None,
-) -> list[FileInfo]:
-    """Process expression and return unified FileInfo list.
-
-    Args:
-        session: Current session
-        project: Project configuration
-        expression: User expression to process
-        visited_collections: Set of collection names already visited (for circular reference prevention)
+    visited_collections: set[str],
+    processed_combinations: set[tuple[str, Optional[tuple[str, ...]]]],
+    plan: list[tuple[str, Optional[list[str]]]],
+) -> None:
+    """Expand an expression into (category_name, patterns) discovery jobs, in gather order.
 
-    Returns:
-        List of FileInfo objects from all matched categories/collections
+    Collections are expanded recursively; each (category, patterns) combination is planned once.
 
     Raises:
         ExpressionParseError: If expression parsing fails
         CategoryNotFoundError: If a referenced category doesn't exist
-        CollectionNotFoundError: If a referenced collection doesn't exist
     """
-    # Initialize visited collections set if not provided
-    if visited_collections is None:
-        visited_collections = set()
-
-    expressions = parse_expression(expression)
-    all_files = []
-    # Track processed (category_name, patterns) combinations to allow multiple pattern sets per category
-    processed_combinations = set()
-
-    for expr in expressions:
+    for expr in parse_expression(expression):
         if expr.name in project.collections:
             # Check for circular reference
             if expr.name in visited_collections:
@@ -119,47 +122,178 @@ async def gather_content(
                 # If it's both a collection and category, treat it as a category
                 if category_expr in project.collections and category_expr not in project.categories:
                     # Recursively resolve nested collection
-                    nested_files = await gather_content(session, project, category_expr, visited_collections)
-                    all_files.extend(nested_files)
-                else:
-                    # Parse category expression (e.g., "review/commit")
-                    cat_expressions = parse_expression(category_expr)
-                    for cat_expr in cat_expressions:
-                        # Merge patterns from collection-level expression with category expression
-                        merged_patterns = cat_expr.patterns or expr.patterns
-                        patterns_key = tuple(sorted(merged_patterns)) if merged_patterns else None
-                        combination_key = (cat_expr.name, patterns_key)
-
-                        if combination_key not in processed_combinations:
-                            try:
-                                files = await gather_category_fileinfos(
-                                    session, project, cat_expr.name, merged_patterns
-                                )
-                                all_files.extend(files)
-                                processed_combinations.add(combination_key)
-                            except CategoryNotFoundError as e:
-                                # Re-raise with context about which collection referenced the missing category
-                                raise CategoryNotFoundError(
-                                    f"{cat_expr.name} (referenced by collection '{expr.name}')"
-                                ) from e
+                    _plan_discovery(project, category_expr, visited_collections, processed_combinations, plan)
+                    continue
+
+                # Parse category expression (e.g., "review/commit")
+                for cat_expr in parse_expression(category_expr):
+                    if cat_expr.name not in project.categories:
+                        # Report which collection referenced the missing category
+                        raise CategoryNotFoundError(f"{cat_expr.name} (referenced by collection '{expr.name}')")
+
+                    # Merge patterns from collection-level expression with category expression
+                    merged_patterns = cat_expr.patterns or expr.patterns
+                    patterns_key = tuple(sorted(merged_patterns)) if merged_patterns else None
+                    combination_key = (cat_expr.name, patterns_key)
+                    if combination_key not in processed_combinations:
+                        processed_combinations.add(combination_key)
+                        plan.append((cat_expr.name, merged_patterns))
 
         elif expr.name in project.categories:
-            # Handle category - use gather_category_fileinfos
             patterns_key = tuple(sorted(expr.patterns)) if expr.patterns else None
             combination_key = (expr.name, patterns_key)
-
             if combination_key not in processed_combinations:
-                files = await gather_category_fileinfos(session, project, expr.name, expr.patterns)
-                all_files.extend(files)
                 processed_combinations.add(combination_key)
+                plan.append((expr.name, expr.patterns))
         else:
             raise CategoryNotFoundError(expr.name)
 
+
+def expression_categories(project: Project, expression: str) -> list[str]:
+    """Return the names of the categories gather_content discovers for expression, in gather order.
+
+    Raises:
+        ExpressionParseError: If expression parsing fails
+        CategoryNotFoundError: If a referenced category doesn't exist
+    """
+    plan: list[tuple[str, Optional[list[str]]]] = []
+    _plan_discovery(project, expression, set(), set(), plan)
+    return list(dict.fromkeys(category_name for category_name, _patterns in plan))
+
+
+async def _gather_cache_key(
+    project: Project,
+    docroot: Path,
+    expression: str,
+    visited_collections: frozenset[str],
+    plan: list[tuple[str, Optional[list[str]]]],
+) -> Optional[Hashable]:
+    """Return the cache key for a gather, or None if a category directory is not watched.
+
+    Without a watcher the docroot generation does not move when files change, so
+    unwatched directories are discovered on every call. Stored documents are covered
+    by the store generation, which moves on writes from any process.
+    """
+    if not all(is_watched(str(docroot / project.categories[name].dir)) for name, _patterns in plan):
+        return None
+    return (
+        str(docroot),
+        fingerprint((project.categories, project.collections)),
+        expression,
+        visited_collections,
+        get_docroot_generation(),
+        await get_store_generation(),
+    )
+
+
+def _drop_gathered(paths: frozenset[str]) -> None:
+    """Docroot listener dropping gathered file sets, all of which belong to an earlier generation now."""
+    with _gather_lock:
+        _gathered.clear()
+
+
+def get_gather_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters and current size of the gathered file-set cache."""
+    with _gather_lock:
+        return {**_gather_stats, "entries": len(_gathered), "max_entries": GATHER_CACHE_SIZE}
+
+
+def clear_gather_cache() -> None:
+    """Drop all gathered file sets."""
+    with _gather_lock:
+        _gathered.clear()
+        _gather_stats.update(hits=0, misses=0, bypassed=0)
+
+
+add_docroot_listener(_drop_gathered)
+
+
+async def gather_content(
+    session: Session,
+    project: Project,
+    expression: str,
+    visited_collections: Optional[set[str]] = None,
+    prefetch: bool = True,
+    concurrency: int = MAX_CONCURRENT_DISCOVERIES,
+) -> list[FileInfo]:
+    """Process expression and return unified FileInfo list.
+
+    Every category the expression names, directly or through collections, is
+    discovered concurrently (at most `concurrency` at a time); results are then
+    combined in expression order and de-duplicated across categories.
+
+    Args:
+        session: Current session
+        project: Project configuration
+        expression: User expression to process
+        visited_collections: Set of collection names already visited (for circular reference prevention)
+        prefetch: Load stored document content for the whole selection in one query per category.
+            Callers that only need file metadata (e.g. staleness hashing) should pass False.
+        concurrency: Maximum number of categories discovered at once
+
+    Returns:
+        List of FileInfo objects from all matched categories/collections
+
+    Raises:
+        ExpressionParseError: If expression parsing fails
+        CategoryNotFoundError: If a referenced category doesn't exist
+        CollectionNotFoundError: If a referenced collection doesn't exist
+    """
+    # Initialize visited collections set if not provided
+    if visited_collections is None:
+        visited_collections = set()
+    initially_visited = frozenset(visited_collections)
+
+    # Expand the expression up front so unknown names fail before any discovery runs
+    plan: list[tuple[str, Optional[list[str]]]] = []
+    _plan_discovery(project, expression, visited_collections, set(), plan)
+
+    docroot = Path(await session.get_docroot())
+    cache_key = await _gather_cache_key(project, docroot, expression, initially_visited, plan)
+    with _gather_lock:
+        if cache_key is None:
+            _gather_stats["bypassed"] += 1
+            cached = None
+        else:
+            cached = _gathered.get(cache_key)
+            if cached is not None:
+                _gathered.move_to_end(cache_key)
+                _gather_stats["hits"] += 1
+            else:
+                _gather_stats["misses"] += 1
+    if cached is not None:
+        files = [file.clone() for file in cached]
+        if prefetch:
+            await prefetch_stored_content(files)
+        return files
+
+    # Each job's files and failure land in its own slot, keeping expression order
+    discovered: list[list[FileInfo]] = [[] for _ in plan]
+    failures: list[Optional[Exception]] = [None] * len(plan)
+    limiter = anyio.CapacityLimiter(max(1, concurrency))
+
+    async def _discover(index: int, category_name: str, patterns: Optional[list[str]]) -> None:
+        async with limiter:
+            try:
+                discovered[index] = await gather_category_fileinfos(session, project, category_name, patterns)
+            except Exception as e:
+                failures[index] = e
+
+    async with anyio.create_task_group() as tg:
+        for index, (category_name, patterns) in enumerate(plan):
+            tg.start_soon(_discover, index, category_name, patterns)
+
+    # Surface the first failure in expression order, as sequential discovery would
+    for failure in failures:
+        if failure is not None:
+            raise failure
+
+    all_files = [file for files in discovered for file in files]
+
     # De-duplicate: filesystem files by absolute path, stored documents by (category, name)
     seen_paths: set[Path] = set()
     seen_docs: set[tuple[str, str]] = set()
     unique_files = []
-    docroot = Path(await session.get_docroot())
 
     for file in all_files:
         if not file.category or file.category.name not in project.categories:
@@ -176,9 +310,41 @@ async def gather_content(
                 seen_paths.add(absolute_path)
                 unique_files.append(file)
 
+    if cache_key is not None:
+        with _gather_lock:
+            _gathered[cache_key] = tuple(file.clone() for file in unique_files)
+            _gathered.move_to_end(cache_key)
+            while len(_gathered) > GATHER_CACHE_SIZE:
+                _gathered.popitem(last=False)
+
+    if prefetch:
+        await prefetch_stored_content(unique_files)
+
     return unique_files
 
 
+async def prefetch_stored_content(files: list[FileInfo]) -> None:
+    """Load content for stored documents in one batched query per category.
+
+    Files whose content is already available are skipped, as are documents that
+    no longer exist (their content_loader reports them missing when read).
+
+    Args:
+        files: FileInfo objects with category set, as returned by gather_content
+    """
+    pending: dict[str, list[FileInfo]] = {}
+    for file in files:
+        if file.source == "store" and file.category is not None and file.content_pending:
+            pending.setdefault(file.category.name, []).append(file)
+
+    for category_name, category_files in pending.items():
+        records = await get_documents(category_name, [f.name for f in category_files])
+        for file in category_files:
+            record = records.get(file.name)
+            if record is not None and record.content is not None:
+                file.prime_content(record.content)
+
+
 async def gather_category_fileinfos(
     session: Session,
     project: Project,
@@ -0,0 +1,125 @@
+"""Response size budget and continuation cursors for get_content.
+
+When the content-budget flag is set, get_content returns the gathered files one
+page at a time. Files keep the order they are gathered in (category by category),
+a page holds as many files as fit the budget and at least one, and only the files
+of the current page are rendered. A response with more content to follow carries
+an opaque cursor; passing it back returns the next page.
+
+A cursor records the position of the next page and the metadata hash of the files
+it was issued for, so a cursor is refused once files are added, removed or
+changed, instead of silently skipping or repeating content.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Optional
+
+from mcp_guide.discovery.files import FileInfo
+from mcp_guide.feature_flags.types import FeatureValue, FeatureValueLike
+
+# Budgets given in tokens are converted to bytes with this estimate
+BYTES_PER_TOKEN = 4
+
+# Smallest accepted budget in bytes
+MIN_CONTENT_BUDGET = 256
+
+# Stored documents are only sized once loaded; this many are loaded per query
+# while a page is selected
+PAGE_PREFETCH_BATCH = 16
+
+CURSOR_VERSION = 1
+
+_BUDGET_REGEX = re.compile(r"^\s*(\d+)\s*(bytes?|tokens?)?\s*$", re.IGNORECASE)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a continuation cursor is malformed or no longer matches the content."""
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position of the next page of a get_content response."""
+
+    # Index of the first gathered file of the page
+    offset: int
+    # Metadata hash of the gathered files the cursor was issued for
+    files_hash: Optional[str]
+    # Hash of the expression and pattern the cursor was issued for
+    scope: str
+
+
+def parse_content_budget(value: Optional[FeatureValueLike]) -> Optional[int]:
+    """Convert a content-budget flag value to a budget in bytes.
+
+    Accepts a number of bytes ("48000", "48000 bytes") or tokens ("12000 tokens").
+
+    Returns:
+        The budget in bytes, or None if unset or invalid (no budget)
+    """
+    if value is None:
+        return None
+    raw = value.to_raw() if isinstance(value, FeatureValue) else value
+    if not isinstance(raw, str):
+        return None
+    match = _BUDGET_REGEX.match(raw)
+    if not match:
+        return None
+    budget = int(match.group(1))
+    if match.group(2) and match.group(2).lower().startswith("token"):
+        budget *= BYTES_PER_TOKEN
+    return budget if budget >= MIN_CONTENT_BUDGET else None
+
+
+def cursor_scope(expression: str, pattern: Optional[str]) -> str:
+    """Return the hash identifying the request a cursor belongs to."""
+    return hashlib.sha256(f"{expression}\0{pattern or ''}".encode()).hexdigest()[:12]
+
+
+def encode_cursor(cursor: PageCursor) -> str:
+    """Return the opaque string form of a cursor."""
+    payload = json.dumps([CURSOR_VERSION, cursor.offset, cursor.files_hash, cursor.scope], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> PageCursor:
+    """Parse a cursor returned by encode_cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor was not produced by encode_cursor
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'") from e
+    if (
+        not isinstance(payload, list)
+        or len(payload) != 4
+        or payload[0] != CURSOR_VERSION
+        or not isinstance(payload[1], int)
+        or isinstance(payload[1], bool)
+        or payload[1] < 0
+        or not isinstance(payload[2], (str, type(None)))
+        or not isinstance(payload[3], str)
+    ):
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'")
+    return PageCursor(offset=payload[1], files_hash=payload[2], scope=payload[3])
+
+
+def select_page(files: Sequence[FileInfo], offset: int, budget: int) -> int:
+    """Return the end index of the page of files starting at offset.
+
+    Files are estimated by their size (zero for stored documents not yet loaded);
+    the page holds at least one file.
+    """
+    end = offset + 1
+    total = files[offset].size
+    while end < len(files) and total + files[end].size <= budget:
+        total += files[end].size
+        end += 1
+    return end
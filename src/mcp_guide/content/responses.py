@@ -0,0 +1,194 @@
+"""Whole-response cache and content ETags for get_content.
+
+A rendered get_content response is identified by an ETag computed from the
+metadata hash of its gathered files, the resolved feature flags and the
+rendered response itself. Agents pass the ETag back as if_none_match and get a
+short "unchanged" reply instead of the full content.
+
+Responses are also kept, so an unchanged request is answered without rendering
+again. An entry is reused only while its gathered files hash the same, the flags
+and the document store generation are unchanged, and the context values its
+templates read still fingerprint equally. It is registered in the dependency
+graph with everything the render read, so editing a partial or policy drops it.
+Responses reading an impure lambda, or depending on a file outside a watched
+docroot, are not kept.
+"""
+
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from mcp_guide.render.dependencies import DependencyRecord, get_dependency_graph
+from mcp_guide.render.memo import fingerprint, is_impure
+from mcp_guide.result import Result
+from mcp_guide.store.document_store import get_store_generation
+from mcp_guide.watchers.docroot_watcher import get_docroot_generation, is_watched
+
+# Maximum number of get_content responses kept; least recently used are evicted
+RESPONSE_CACHE_SIZE = 64
+
+_RESPONSE_GRAPH_KEY = "response"
+_MISSING = ("missing",)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A rendered get_content response and what it was rendered from."""
+
+    result: Result[str]
+    etag: str
+    files_hash: Optional[str]
+    flags: Hashable
+    store_generation: int
+    # Categories whose template context was rendered with, and the names read from it
+    categories: tuple[str, ...]
+    context_keys: frozenset[str]
+    context: Hashable
+
+
+_responses: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "bypassed": 0}
+_lock = threading.Lock()
+
+
+def compute_etag(files_hash: Optional[str], flags: Hashable, result: Result[str]) -> str:
+    """Return the ETag of a response from its file set, the flags and the rendered content."""
+    digest = hashlib.sha256()
+    for part in (files_hash or "", repr(flags), result.value or "", result.instruction or "", result.disposition or ""):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+async def context_fingerprint(categories: Iterable[str], keys: frozenset[str]) -> Optional[Hashable]:
+    """Fingerprint the values of keys in each category's template context.
+
+    Returns:
+        The fingerprint, or None if a value is an impure lambda
+    """
+    from mcp_guide.render.cache import get_template_contexts
+
+    names = sorted(keys)
+    values = []
+    for category in categories:
+        context = await get_template_contexts(category)
+        await context.resolve_lazy(names)
+        for name in names:
+            value = context[name] if name in context else _MISSING
+            if is_impure(value):
+                return None
+            values.append(fingerprint(value))
+    return tuple(values)
+
+
+async def lookup_response(key: Hashable, files_hash: Optional[str], flags: Hashable) -> Optional[CachedResponse]:
+    """Return the cached response for key if nothing it was rendered from has changed.
+
+    The result is a copy, so callers may change it.
+    """
+    with _lock:
+        entry = _responses.get(key)
+    usable = (
+        entry is not None
+        and entry.files_hash == files_hash
+        and entry.flags == flags
+        and entry.store_generation == await get_store_generation()
+    )
+    if entry is None or not usable or await context_fingerprint(entry.categories, entry.context_keys) != entry.context:
+        with _lock:
+            _stats["misses"] += 1
+        return None
+    with _lock:
+        _responses.move_to_end(key)
+        _stats["hits"] += 1
+    return dataclasses.replace(entry, result=dataclasses.replace(entry.result))
+
+
+async def store_response(
+    key: Hashable,
+    result: Result[str],
+    etag: str,
+    *,
+    files_hash: Optional[str],
+    flags: Hashable,
+    store_generation: int,
+    docroot_generation: int,
+    categories: Iterable[str],
+    dependencies: DependencyRecord,
+) -> bool:
+    """Keep a rendered response unless it cannot be validated later.
+
+    Args:
+        store_generation: Store generation read before gathering
+        docroot_generation: Docroot generation read before gathering; if files changed
+            while rendering, the response is not kept
+        dependencies: Everything the render read, including the category directories
+
+    Returns:
+        True if the response was kept
+    """
+    categories = tuple(categories)
+    watched = all(is_watched(path) for path in dependencies.files | dependencies.directories)
+    unchanged = docroot_generation == get_docroot_generation()
+    context = await context_fingerprint(categories, dependencies.context_keys) if watched and unchanged else None
+    if context is None:
+        with _lock:
+            _stats["bypassed"] += 1
+        return False
+
+    entry = CachedResponse(
+        result=dataclasses.replace(result),
+        etag=etag,
+        files_hash=files_hash,
+        flags=flags,
+        store_generation=store_generation,
+        categories=categories,
+        context_keys=dependencies.context_keys,
+        context=context,
+    )
+    graph = get_dependency_graph()
+    graph.subscribe(_drop_responses)
+    with _lock:
+        _responses[key] = entry
+        _responses.move_to_end(key)
+        evicted = []
+        while len(_responses) > RESPONSE_CACHE_SIZE:
+            evicted.append(_responses.popitem(last=False)[0])
+    graph.record((_RESPONSE_GRAPH_KEY, key), dependencies)
+    for evicted_key in evicted:
+        graph.forget((_RESPONSE_GRAPH_KEY, evicted_key))
+    if docroot_generation != get_docroot_generation():
+        # A change arrived before the entry was registered in the graph
+        _drop_responses(frozenset({(_RESPONSE_GRAPH_KEY, key)}))
+        graph.forget((_RESPONSE_GRAPH_KEY, key))
+        return False
+    return True
+
+
+def _drop_responses(keys: frozenset[Hashable]) -> None:
+    """Dependency graph callback dropping responses whose dependencies changed."""
+    with _lock:
+        for key in keys:
+            if isinstance(key, tuple) and len(key) == 2 and key[0] == _RESPONSE_GRAPH_KEY:
+                _responses.pop(key[1], None)
+
+
+def get_response_cache_stats() -> dict[str, Any]:
+    """Return hit/miss/bypass counters and current size of the response cache."""
+    with _lock:
+        return {**_stats, "entries": len(_responses), "max_entries": RESPONSE_CACHE_SIZE}
+
+
+def clear_response_cache() -> None:
+    """Drop all cached responses."""
+    with _lock:
+        keys = list(_responses)
+        _responses.clear()
+        _stats.update(hits=0, misses=0, bypassed=0)
+    graph = get_dependency_graph()
+    for key in keys:
+        graph.forget((_RESPONSE_GRAPH_KEY, key))
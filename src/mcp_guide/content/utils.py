@@ -1,23 +1,43 @@
 """Shared utilities for content retrieval tools."""
 
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
+import anyio
 import yaml
 
+from mcp_guide.config_constants import MAX_CONCURRENT_FILE_RENDERS
 from mcp_guide.core.mcp_log import get_logger
 from mcp_guide.discovery.files import FileInfo
+from mcp_guide.models import Project
 from mcp_guide.models.exceptions import CategoryNotFoundError, NoProjectError
 from mcp_guide.render import render_template
+from mcp_guide.render.cache import get_template_contexts
+from mcp_guide.render.content import FM_INCLUDES
 from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.dependencies import (
+    DependencyRecord,
+    collect_dependencies,
+    get_dependency_graph,
+    note_dependencies,
+    note_record,
+)
+from mcp_guide.render.environment import TEMPLATE_LAMBDAS, WORKFLOW_LAMBDAS
 from mcp_guide.render.frontmatter import (
     get_frontmatter_type,
     parse_content_with_frontmatter,
     process_file,
     resolve_instruction,
 )
+from mcp_guide.render.functions import TemplateFunctions
+from mcp_guide.render.memo import fingerprint, is_impure
 from mcp_guide.render.renderer import is_template_file
 from mcp_guide.render.rendering import render_content
+from mcp_guide.render.requires import FlagState
 from mcp_guide.result import Result
 from mcp_guide.result_constants import (
     AGENT_INFO,
@@ -26,9 +46,19 @@ from mcp_guide.result_constants import (
     USER_INFO,
 )
 from mcp_guide.session import get_active_session
+from mcp_guide.watchers.docroot_watcher import is_watched
+
+if TYPE_CHECKING:
+    from mcp_guide.session import Session
 
 logger = get_logger(__name__)
 
+# Maximum number of rendered policy topics kept; least recently used are evicted
+POLICY_CACHE_SIZE = 128
+
+# Context names set per policy file; they follow from the topic and the files found
+_POLICY_FILE_VARS = frozenset({"policy_topic", "policy_category", "policy_path"})
+
 # Precedence for content disposition: higher value wins
 _TYPE_PRECEDENCE = {
     USER_INFO: 0,
@@ -190,12 +220,14 @@ async def _gather_policy_partials(
     per-policy-file render context. Session and project are fetched directly via
     `get_active_session()` and `session.get_project()`.
 
+    Rendered topics are cached on the topic, the policies category and the requirement
+    flags, and reused while the context values the policy templates look up are unchanged.
+    The dependency graph drops a topic when a file it was rendered from, or its topic
+    directory, changes. Only docroots with a running watcher are cached.
+
     Returns an empty dict when the template has no `policies:` key, or when no active
     session or project is available.
     """
-    # Deferred import to avoid circular dependency (content.gathering imports content.utils)
-    from mcp_guide.content.gathering import gather_category_fileinfos
-
     # Quick-parse frontmatter to detect `policies:` key
     try:
         raw = await file_info.read_raw()
@@ -234,64 +266,220 @@ async def _gather_policy_partials(
         "_gather_policy_partials: policies base dir=%s, patterns=%s", policy_base_dir, policies_category.patterns
     )
 
+    # Rendered topics are reused only while the docroot watcher can report edits
+    base_key: Optional[tuple[Hashable, ...]] = None
+    lookup_context = template_context
+    if is_watched(str(policy_base_dir)):
+        base_key = (str(policy_base_dir), tuple(policies_category.patterns), fingerprint(project_flags))
+        # Policy files render on top of the base context, so their names resolve here
+        lookup_context = (await get_template_contexts()).new_child(template_context)
+
     pre_partials: dict[str, str] = {}
 
     for topic in policy_topics:
         if not isinstance(topic, str):
             continue
 
-        try:
-            policy_files = await gather_category_fileinfos(session, project, "policies", patterns=[f"{topic}/"])
-        except (CategoryNotFoundError, OSError):
-            logger.warning("Failed to discover policy files for topic %r", topic, exc_info=True)
-            policy_files = []
-
-        logger.trace("_gather_policy_partials: topic=%r matched %d file(s)", topic, len(policy_files))
-
-        if not policy_files:
-            logger.trace("_gather_policy_partials: topic=%r — no files found, using placeholder", topic)
-            pre_partials[topic] = await render_missing_policy(topic)
+        key = (topic, *base_key) if base_key is not None else None
+        if key is not None and (cached := _lookup_policy_set(key, lookup_context)) is not None:
+            logger.trace("_gather_policy_partials: topic=%r served from cache", topic)
+            note_record(cached.dependencies)
+            pre_partials[topic] = cached.content
             continue
 
-        rendered_parts: list[str] = []
-        for policy_file in policy_files:
-            policy_file.resolve(policy_base_dir, docroot)
-            try:
-                policy_path = str(policy_file.path.relative_to(docroot))
-            except ValueError:
-                policy_path = policy_file.path.name
-            policy_context = template_context.new_child(
-                {
-                    "policy_topic": topic,
-                    "policy_category": "policies",
-                    "policy_path": policy_path,
-                }
+        with collect_dependencies() as dependencies:
+            # Adding or removing a document under the topic changes the selection
+            note_dependencies(policy_topics=(topic,), directories=(str(policy_base_dir / topic),))
+            content, names = await _render_policy_topic(
+                session, project, topic, template_context, project_flags, policy_base_dir, docroot
             )
-            try:
-                rendered = await render_template(
-                    file_info=policy_file,
-                    base_dir=policy_base_dir,
-                    project_flags=project_flags,
-                    context=policy_context,
-                )
-                if rendered is not None:
-                    logger.trace(
-                        "_gather_policy_partials: rendered %s (%d chars)", policy_file.path, len(rendered.content)
-                    )
-                    rendered_parts.append(rendered.content)
-                else:
-                    logger.trace(
-                        "_gather_policy_partials: %s rendered None (filtered by requirements?)", policy_file.path
-                    )
-            except (OSError, RuntimeError):
-                logger.warning("Failed to render policy file %s for topic %r", policy_file.path, topic, exc_info=True)
-
-        pre_partials[topic] = "\n\n".join(rendered_parts) if rendered_parts else await render_missing_policy(topic)
-        logger.trace("_gather_policy_partials: topic=%r → %d chars", topic, len(pre_partials[topic]))
+        pre_partials[topic] = content
+        if key is not None and names is not None:
+            _store_policy_set(key, names, lookup_context, content, dependencies.record())
+        logger.trace("_gather_policy_partials: topic=%r → %d chars", topic, len(content))
 
     return pre_partials
 
 
+async def _render_policy_topic(
+    session: "Session",
+    project: Project,
+    topic: str,
+    template_context: TemplateContext,
+    project_flags: dict[str, Any],
+    policy_base_dir: Path,
+    docroot: Path,
+) -> tuple[str, Optional[frozenset[str]]]:
+    """Render every policy file selected for topic.
+
+    Returns:
+        Tuple of (content, names) where names are the context names the policy
+        templates look up, or None if the output may depend on anything else
+    """
+    # Deferred import to avoid circular dependency (content.gathering imports content.utils)
+    from mcp_guide.content.gathering import gather_category_fileinfos
+
+    try:
+        policy_files = await gather_category_fileinfos(session, project, "policies", patterns=[f"{topic}/"])
+    except (CategoryNotFoundError, OSError):
+        logger.warning("Failed to discover policy files for topic %r", topic, exc_info=True)
+        # A transient discovery failure must not be remembered
+        return await render_missing_policy(topic), None
+
+    logger.trace("_gather_policy_partials: topic=%r matched %d file(s)", topic, len(policy_files))
+
+    if not policy_files:
+        logger.trace("_gather_policy_partials: topic=%r — no files found, using placeholder", topic)
+        return await render_missing_policy(topic), frozenset()
+
+    names: Optional[set[str]] = set()
+    rendered_parts: list[str] = []
+    for policy_file in policy_files:
+        policy_file.resolve(policy_base_dir, docroot)
+        try:
+            policy_path = str(policy_file.path.relative_to(docroot))
+        except ValueError:
+            policy_path = policy_file.path.name
+        policy_context = template_context.new_child(
+            {
+                "policy_topic": topic,
+                "policy_category": "policies",
+                "policy_path": policy_path,
+            }
+        )
+        try:
+            rendered = await render_template(
+                file_info=policy_file,
+                base_dir=policy_base_dir,
+                project_flags=project_flags,
+                context=policy_context,
+            )
+            if rendered is not None:
+                logger.trace("_gather_policy_partials: rendered %s (%d chars)", policy_file.path, len(rendered.content))
+                rendered_parts.append(rendered.content)
+            else:
+                logger.trace("_gather_policy_partials: %s rendered None (filtered by requirements?)", policy_file.path)
+            if names is not None:
+                names = await _policy_file_names(policy_file, names)
+        except (OSError, RuntimeError):
+            logger.warning("Failed to render policy file %s for topic %r", policy_file.path, topic, exc_info=True)
+            names = None
+
+    content = "\n\n".join(rendered_parts) if rendered_parts else await render_missing_policy(topic)
+    return content, None if names is None else frozenset(names - _POLICY_FILE_VARS)
+
+
+async def _policy_file_names(policy_file: FileInfo, names: set[str]) -> Optional[set[str]]:
+    """Add the context names a policy file's body looks up, or return None if they cannot be known."""
+    if not is_template_file(policy_file):
+        return names
+
+    import chevron
+
+    from mcp_guide.render.tokens import get_root_names
+
+    parsed = parse_content_with_frontmatter(await policy_file.read_raw())
+    if FM_INCLUDES in parsed.frontmatter:
+        # Included partials may look up names of their own
+        return None
+    try:
+        return names | get_root_names(parsed.content)
+    except chevron.ChevronError:
+        return None
+
+
+@dataclass(frozen=True)
+class _PolicySet:
+    """Rendered policy content plus the context values it was rendered with."""
+
+    names: frozenset[str]
+    values: Hashable
+    content: str
+    dependencies: DependencyRecord
+
+
+# Policy cache entries are registered in the dependency graph as (_POLICY_GRAPH_KEY, key)
+_POLICY_GRAPH_KEY = "policy"
+
+_policy_sets: OrderedDict[Hashable, _PolicySet] = OrderedDict()
+_policy_stats = {"hits": 0, "misses": 0}
+_policy_lock = threading.Lock()
+
+
+def _is_impure_lambda(name: str) -> bool:
+    """Return True if the lambda injected as name (or into the workflow section) is impure."""
+    methods = WORKFLOW_LAMBDAS.values() if name == "workflow" else [TEMPLATE_LAMBDAS.get(name)]
+    return any(method is not None and is_impure(getattr(TemplateFunctions, method)) for method in methods)
+
+
+def _policy_values(names: frozenset[str], context: Mapping[str, Any]) -> Optional[Hashable]:
+    """Fingerprint the values of names in context; None if any of them is impure."""
+    values = []
+    for name in sorted(names):
+        value = context.get(name)
+        if is_impure(value) or _is_impure_lambda(name):
+            return None
+        values.append(fingerprint(value))
+    return tuple(values)
+
+
+def _lookup_policy_set(key: Hashable, context: Mapping[str, Any]) -> Optional[_PolicySet]:
+    with _policy_lock:
+        entry = _policy_sets.get(key)
+    if entry is not None and _policy_values(entry.names, context) == entry.values:
+        with _policy_lock:
+            _policy_sets.move_to_end(key)
+            _policy_stats["hits"] += 1
+        return entry
+    with _policy_lock:
+        _policy_stats["misses"] += 1
+    return None
+
+
+def _store_policy_set(
+    key: Hashable, names: frozenset[str], context: Mapping[str, Any], content: str, dependencies: DependencyRecord
+) -> None:
+    values = _policy_values(names, context)
+    if values is None:
+        return
+    graph = get_dependency_graph()
+    graph.subscribe(_drop_policy_sets)
+    evicted = None
+    with _policy_lock:
+        _policy_sets[key] = _PolicySet(names, values, content, dependencies)
+        _policy_sets.move_to_end(key)
+        if len(_policy_sets) > POLICY_CACHE_SIZE:
+            evicted, _ = _policy_sets.popitem(last=False)
+    graph.record((_POLICY_GRAPH_KEY, key), dependencies)
+    if evicted is not None:
+        graph.forget((_POLICY_GRAPH_KEY, evicted))
+
+
+def _drop_policy_sets(invalidated: frozenset[Hashable]) -> None:
+    """Dependency graph callback dropping the policy topics whose files changed."""
+    with _policy_lock:
+        for graph_key in invalidated:
+            if isinstance(graph_key, tuple) and graph_key[0] == _POLICY_GRAPH_KEY:
+                _policy_sets.pop(graph_key[1], None)
+
+
+def get_policy_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters and current size of the rendered policy cache."""
+    with _policy_lock:
+        return {**_policy_stats, "entries": len(_policy_sets), "max_entries": POLICY_CACHE_SIZE}
+
+
+def clear_policy_cache() -> None:
+    """Drop all cached policy renders."""
+    with _policy_lock:
+        keys = list(_policy_sets)
+        _policy_sets.clear()
+        _policy_stats.update(hits=0, misses=0)
+    graph = get_dependency_graph()
+    for key in keys:
+        graph.forget((_POLICY_GRAPH_KEY, key))
+
+
 async def render_missing_policy(topic: str) -> str:
     """Render the missing-policy placeholder for a topic with no active selection.
 
@@ -330,25 +518,124 @@ async def read_and_render_file_contents(
     docroot: Path,
     template_context: Optional[TemplateContext] = None,
     category_prefix: Optional[str] = None,
+    concurrency: int = MAX_CONCURRENT_FILE_RENDERS,
+    limiter: Optional[anyio.CapacityLimiter] = None,
 ) -> list[str]:
     """Read and render content for FileInfo objects with template support.
 
+    Files are read and rendered concurrently, at most `concurrency` at a time, so
+    one file's I/O overlaps another's rendering. The filtered list and the errors
+    keep the input order.
+
     Args:
         files: List of FileInfo objects to read and render
         base_dir: Base directory for resolving file paths
         docroot: Document root for security validation
         template_context: Optional template context for rendering
         category_prefix: Optional prefix to add to basenames (e.g. "category")
+        concurrency: Maximum number of files processed at once
+        limiter: Shared limiter to use instead of `concurrency`, bounding several
+            concurrent calls by one budget
 
     Returns:
         List of error messages for files that failed to read or render
     """
-    file_read_errors: list[str] = []
-
     # Check if any files are templates to avoid unnecessary context validation
     has_templates = template_context is not None and any(is_template_file(f) for f in files)
 
-    # Build context for requirements checking (resolved flags + workflow)
+    # Every file in the batch is checked under the same flags, so requires-* outcomes are shared
+    flag_state = await _requirements_flag_state(template_context)
+
+    if has_templates:
+        # Build the base context (and bind a session if none is active) before fanning out,
+        # so tasks share it through their copied context instead of each building their own
+        await get_template_contexts()
+
+    # Process files concurrently; each outcome lands in its input slot so output order is stable
+    outcomes: list[tuple[Optional[FileInfo], Optional[str]]] = [(None, None)] * len(files)
+    if limiter is None:
+        limiter = anyio.CapacityLimiter(max(1, concurrency))
+
+    async def _process(index: int, file_info: FileInfo) -> None:
+        async with limiter:
+            outcomes[index] = await _read_and_render_file(
+                file_info, base_dir, docroot, template_context, category_prefix, has_templates, flag_state
+            )
+
+    async with anyio.create_task_group() as tg:
+        for index, file_info in enumerate(files):
+            tg.start_soon(_process, index, file_info)
+
+    filtered_files = [file_info for file_info, _ in outcomes if file_info is not None]
+    file_read_errors = [error for _, error in outcomes if error is not None]
+
+    # Update the original files list to only contain filtered files
+    files.clear()
+    files.extend(filtered_files)
+
+    return file_read_errors
+
+
+async def read_file_frontmatter(
+    files: list[FileInfo],
+    base_dir: Path,
+    docroot: Path,
+    template_context: Optional[TemplateContext] = None,
+    concurrency: int = MAX_CONCURRENT_FILE_RENDERS,
+) -> list[str]:
+    """Read and process the frontmatter of FileInfo objects without rendering their bodies.
+
+    Files are filtered by requires-* and their instruction and description fields are
+    rendered as read_and_render_file_contents does, so the instruction and disposition
+    of the remaining files match a full render. File content is left unset.
+
+    Args:
+        files: List of FileInfo objects to read; filtered in place
+        base_dir: Base directory for resolving file paths
+        docroot: Document root for security validation
+        template_context: Optional template context for requirements and field rendering
+        concurrency: Maximum number of files processed at once
+
+    Returns:
+        List of error messages for files that failed to read
+    """
+    has_templates = template_context is not None and any(is_template_file(f) for f in files)
+    flag_state = await _requirements_flag_state(template_context)
+    # Template fields see the same context layers as in render_template
+    field_context = template_context
+    if has_templates:
+        field_context = (await get_template_contexts()).new_child(template_context)
+
+    outcomes: list[tuple[Optional[FileInfo], Optional[str]]] = [(None, None)] * len(files)
+    limiter = anyio.CapacityLimiter(max(1, concurrency))
+
+    async def _process(index: int, file_info: FileInfo) -> None:
+        async with limiter:
+            try:
+                file_info.resolve(base_dir, docroot)
+                render_context = field_context if is_template_file(file_info) else template_context
+                processed = await process_file(file_info, flag_state, render_context)
+            except (FileNotFoundError, PermissionError, UnicodeDecodeError) as e:
+                outcomes[index] = None, f"'{file_info.name}': {e}"
+                return
+            except Exception as e:
+                logger.exception(f"Unexpected error reading frontmatter of '{file_info.name}'")
+                outcomes[index] = None, f"'{file_info.name}': Unexpected error: {e}"
+                return
+            if processed is not None:
+                file_info.frontmatter = processed.frontmatter
+                outcomes[index] = file_info, None
+
+    async with anyio.create_task_group() as tg:
+        for index, file_info in enumerate(files):
+            tg.start_soon(_process, index, file_info)
+
+    files[:] = [file_info for file_info, _ in outcomes if file_info is not None]
+    return [error for _, error in outcomes if error is not None]
+
+
+async def _requirements_flag_state(template_context: Optional[TemplateContext]) -> FlagState:
+    """Build the flags requires-* directives are checked against (resolved flags + workflow)."""
     requirements_context: dict[str, Any] = {}
     if template_context:
         # Add resolved flags (global + project) to context
@@ -374,97 +661,103 @@ async def read_and_render_file_contents(
             workflow_data = template_context["workflow"]
             requirements_context["workflow"] = workflow_data
 
-    # Process files with the render_template API
-    filtered_files = []
-    for file_info in files:
-        try:
-            # Resolve the file path with security validation
-            file_info.resolve(base_dir, docroot)
-
-            # For template files, use render_template API (it handles parsing)
-            if has_templates and is_template_file(file_info):
-                # Validate template context type
-                if not isinstance(template_context, TemplateContext):
-                    error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
-                    file_read_errors.append(f"'{error_path}' template error: Invalid template context type")
-                    continue  # Skip file on validation error
-
-                # Validate context data structure
-                try:
-                    # Test context access to catch corrupted internal state
-                    _ = dict(template_context)
-                except (TypeError, ValueError) as e:
-                    error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
-                    file_read_errors.append(f"'{error_path}' template error: Invalid template context data: {str(e)}")
-                    continue  # Skip file on validation error
-
-                try:
-                    # Pre-render any policy partials declared in the template's frontmatter
-                    pre_partials = await _gather_policy_partials(file_info, template_context, requirements_context)
-                    # Use the render_template API (handles parsing and requirements checking)
-                    rendered = await render_template(
-                        file_info=file_info,
-                        base_dir=base_dir,
-                        project_flags=requirements_context,
-                        context=template_context,
-                        pre_partials=pre_partials or None,
-                    )
-                except Exception as e:
-                    # Template rendering raised an exception - log with full context
-                    error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
-                    logger.exception(f"Template rendering failed for '{error_path}'")
-                    file_read_errors.append(f"'{error_path}' template error: {e}")
-                    continue  # Skip this file entirely
-
-                if rendered is None:
-                    # File filtered by requires-* (not an error)
-                    continue
-
-                # Extract rendered content and frontmatter
-                file_info.content = rendered.content
-                file_info.frontmatter = rendered.frontmatter
-            else:
-                # Non-template files: use process_file
-                try:
-                    processed = await process_file(file_info, requirements_context, template_context)
-                except Exception as e:
-                    # File processing raised an exception
-                    error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
-                    logger.exception(f"File processing failed for '{error_path}'")
-                    file_read_errors.append(f"'{error_path}': {e}")
-                    continue
-
-                if processed is None:
-                    # File filtered by requires-*
-                    continue
-
-                file_info.content = processed.content
-                file_info.frontmatter = processed.frontmatter or file_info.frontmatter
-
-            # Update content_size to reflect the final content size after all processing
-            content = file_info.content or ""
-            file_info.content_size = len(content.encode("utf-8"))
-
-            # Apply category prefix
-            if category_prefix:
-                file_info.name = f"{category_prefix}/{file_info.name}"
-
-            filtered_files.append(file_info)
-
-        except (FileNotFoundError, PermissionError, UnicodeDecodeError) as e:
-            error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
-            file_read_errors.append(f"'{error_path}': {e}")
-        except Exception as e:
-            # Catch any unexpected exceptions to prevent batch termination
-            error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
-            logger.exception(f"Unexpected error processing '{error_path}'")
-            file_read_errors.append(f"'{error_path}': Unexpected error: {e}")
+    return FlagState(requirements_context)
 
-    # Update the original files list to only contain filtered files
-    files.clear()
-    files.extend(filtered_files)
 
-    return file_read_errors
+async def _read_and_render_file(
+    file_info: FileInfo,
+    base_dir: Path,
+    docroot: Path,
+    template_context: Optional[TemplateContext],
+    category_prefix: Optional[str],
+    has_templates: bool,
+    requirements_context: FlagState,
+) -> tuple[Optional[FileInfo], Optional[str]]:
+    """Read and render one file for read_and_render_file_contents.
+
+    Returns:
+        Tuple of (file_info, error): the processed file, or None if it was filtered
+        out or failed, and the error message if it failed
+    """
+    try:
+        # Resolve the file path with security validation
+        file_info.resolve(base_dir, docroot)
+
+        # For template files, use render_template API (it handles parsing)
+        if has_templates and is_template_file(file_info):
+            # Validate template context type
+            if not isinstance(template_context, TemplateContext):
+                error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
+                return None, f"'{error_path}' template error: Invalid template context type"
+
+            # Validate context data structure
+            try:
+                # Walk the context keys to catch corrupted internal state; values are not
+                # read, so lazy sections are only built if the template uses them
+                _ = list(template_context.keys())
+            except (TypeError, ValueError) as e:
+                error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
+                return None, f"'{error_path}' template error: Invalid template context data: {str(e)}"
+
+            try:
+                # Pre-render any policy partials declared in the template's frontmatter
+                pre_partials = await _gather_policy_partials(file_info, template_context, requirements_context)
+                # Use the render_template API (handles parsing and requirements checking)
+                rendered = await render_template(
+                    file_info=file_info,
+                    base_dir=base_dir,
+                    project_flags=requirements_context,
+                    context=template_context,
+                    pre_partials=pre_partials or None,
+                )
+            except Exception as e:
+                # Template rendering raised an exception - log with full context
+                error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
+                logger.exception(f"Template rendering failed for '{error_path}'")
+                return None, f"'{error_path}' template error: {e}"
+
+            if rendered is None:
+                # File filtered by requires-* (not an error)
+                return None, None
+
+            # Extract rendered content and frontmatter
+            file_info.content = rendered.content
+            file_info.frontmatter = rendered.frontmatter
+        else:
+            # Non-template files: use process_file
+            try:
+                processed = await process_file(file_info, requirements_context, template_context)
+            except Exception as e:
+                # File processing raised an exception
+                error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
+                logger.exception(f"File processing failed for '{error_path}'")
+                return None, f"'{error_path}': {e}"
+
+            if processed is None:
+                # File filtered by requires-*
+                return None, None
+
+            file_info.content = processed.content
+            file_info.frontmatter = processed.frontmatter or file_info.frontmatter
+
+        # Update content_size to reflect the final content size after all processing
+        content = file_info.content or ""
+        file_info.content_size = len(content.encode("utf-8"))
+
+        # Apply category prefix
+        if category_prefix:
+            file_info.name = f"{category_prefix}/{file_info.name}"
+
+        return file_info, None
+
+    except (FileNotFoundError, PermissionError, UnicodeDecodeError) as e:
+        error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
+        return None, f"'{error_path}': {e}"
+    except Exception as e:
+        # Catch any unexpected exceptions to prevent batch termination
+        error_path = f"{category_prefix}/{file_info.name}" if category_prefix else file_info.name
+        logger.exception(f"Unexpected error processing '{error_path}'")
+        return None, f"'{error_path}': Unexpected error: {e}"
 
 
 def create_file_read_error_result(
@@ -29,6 +29,8 @@ class Result(Generic[T]):
     disposition: Optional[str] = None
     additional_agent_instructions: Optional[str] = None
     error_data: Optional[dict[str, Any]] = None
+    etag: Optional[str] = None
+    next_cursor: Optional[str] = None
 
     default_success_instruction: ClassVar[Optional[str]] = None
     default_failure_instruction: ClassVar[Optional[str]] = None
@@ -50,6 +52,7 @@ class Result(Generic[T]):
         instruction: Optional[str] = None,
         disposition: Optional[str] = None,
         additional_agent_instructions: Optional[str] = None,
+        etag: Optional[str] = None,
     ) -> "Result[T]":
         """Create a successful result.
 
@@ -60,6 +63,7 @@ class Result(Generic[T]):
             instruction: Optional instruction for agent
             disposition: Optional content disposition (e.g. user/information, agent/instruction)
             additional_agent_instructions: Optional side-band instruction for agent
+            etag: Optional identifier of the content version, for conditional requests
 
         Returns:
             Result with success=True
@@ -72,6 +76,7 @@ class Result(Generic[T]):
             instruction=instruction if instruction is not None else cls.default_success_instruction,
             disposition=disposition,
             additional_agent_instructions=additional_agent_instructions,
+            etag=etag,
         )
 
     @classmethod
@@ -162,6 +167,10 @@ class Result(Generic[T]):
             result["disposition"] = self.disposition
         if self.additional_agent_instructions:
             result["additional_agent_instructions"] = self.additional_agent_instructions
+        if self.etag:
+            result["etag"] = self.etag
+        if self.next_cursor:
+            result["next_cursor"] = self.next_cursor
 
         return result
 
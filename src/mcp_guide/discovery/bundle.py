@@ -0,0 +1,290 @@
+"""Precompiled docroot bundle written at install time and loaded by the server.
+
+The bundle holds, for every document under the docroot, its text, parsed
+frontmatter and (for templates) chevron tokens, plus the metadata of each
+command. It is written next to the documents by install and update, keyed by
+the docroot version, and loaded with a single read when a session starts
+watching the docroot. Entries whose file has been modified since are dropped,
+so those files are read and parsed from disk as before.
+"""
+
+import asyncio
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from anyio import Path as AsyncPath
+from chevron import ChevronError
+
+from mcp_guide.config_constants import COMMANDS_DIR
+from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.discovery.files import TEMPLATE_EXTENSIONS
+from mcp_guide.discovery.patterns import is_valid_command, is_valid_file
+from mcp_guide.watchers.docroot_watcher import add_docroot_listener
+
+logger = get_logger(__name__)
+
+# Bundle file name, alongside the other installer system files in the docroot
+BUNDLE_FILE = ".bundle.json"
+
+# Incremented whenever the bundle layout changes; other formats are ignored
+BUNDLE_FORMAT = 1
+
+_bundles: dict[str, "DocrootBundle"] = {}
+_lock = threading.Lock()
+
+
+def _json_safe(value: Any) -> bool:
+    """Return True if value survives a JSON round trip unchanged (YAML dates, for example, do not)."""
+    try:
+        return bool(json.loads(json.dumps(value)) == value)
+    except (TypeError, ValueError):
+        return False
+
+
+def _compile_file(path: Path, rel_path: str) -> Optional[dict[str, Any]]:
+    """Compile one docroot file into its bundle entry, or None if it is not UTF-8 text."""
+    from mcp_guide.discovery.commands import build_command_metadata
+    from mcp_guide.render.frontmatter import parse_content_with_frontmatter
+    from mcp_guide.render.tokens import tokenize_template
+
+    try:
+        stat = path.stat()
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    entry: dict[str, Any] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "text": text}
+    parsed = parse_content_with_frontmatter(text)
+    frontmatter = dict(parsed.frontmatter)
+    if not _json_safe(frontmatter) or text[parsed.frontmatter_length :] != parsed.content:
+        return entry
+    entry["frontmatter"] = frontmatter
+    entry["frontmatter_length"] = parsed.frontmatter_length
+
+    if any(suffix in TEMPLATE_EXTENSIONS for suffix in path.suffixes):
+        try:
+            entry["tokens"] = [list(token) for token in tokenize_template(parsed.content)]
+        except ChevronError:
+            pass
+
+    command_path = Path(rel_path)
+    if command_path.parts[0] == COMMANDS_DIR and is_valid_command(command_path):
+        command_name = str(Path(*command_path.parts[1:]).with_suffix(""))
+        command = build_command_metadata(command_name, path, frontmatter)
+        del command["path"]  # Re-attached from the caller's path on use
+        if _json_safe(command):
+            entry["command"] = command
+    return entry
+
+
+def _compile_docroot(docroot: Path, version: str) -> dict[str, Any]:
+    files: dict[str, Any] = {}
+    for dirpath, dirnames, filenames in os.walk(docroot):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            rel_path = path.relative_to(docroot).as_posix()
+            if not is_valid_file(Path(rel_path)):
+                continue
+            entry = _compile_file(path, rel_path)
+            if entry is not None:
+                files[rel_path] = entry
+    return {"format": BUNDLE_FORMAT, "version": version, "files": files}
+
+
+async def write_docroot_bundle(docroot: Path, version: str) -> int:
+    """Compile every document under docroot into its bundle file.
+
+    Args:
+        docroot: Document root directory
+        version: Docroot version the bundle belongs to (see installer.core.write_version)
+
+    Returns:
+        Number of files in the bundle
+    """
+    bundle = await asyncio.to_thread(_compile_docroot, docroot, version)
+    # Sorted keys keep the bundle byte-identical when nothing changed
+    data = json.dumps(bundle, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    await AsyncPath(docroot / BUNDLE_FILE).write_text(data, encoding="utf-8")
+    logger.debug(f"Wrote docroot bundle with {len(bundle['files'])} file(s) to {docroot}")
+    return len(bundle["files"])
+
+
+class DocrootBundle:
+    """Bundle entries for one docroot that still match the files on disk."""
+
+    def __init__(self, root: str, files: dict[str, dict[str, Any]]) -> None:
+        """Initialize DocrootBundle.
+
+        Args:
+            root: Absolute docroot path
+            files: Bundle entries by path relative to the docroot, already checked against disk
+        """
+        self.root = root
+        self._roots: tuple[str, ...] = (root,)
+        self._files = files
+        self._lock = threading.Lock()
+
+    def add_alias(self, path: str) -> None:
+        """Also look up paths below path in this bundle."""
+        if path not in self._roots:
+            self._roots += (path,)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _relative(self, path: str) -> Optional[str]:
+        for root in self._roots:
+            prefix = os.path.join(root, "")
+            if path.startswith(prefix):
+                return Path(path[len(prefix) :]).as_posix()
+        return None
+
+    def entry(self, path: str) -> Optional[dict[str, Any]]:
+        """Return the entry for an absolute path if the file is unchanged since it was bundled.
+
+        The file's mtime and size are checked on each lookup, so an edit is seen before
+        the docroot watcher's next poll (whose event then drops the entry).
+        """
+        rel_path = self._relative(path)
+        if rel_path is None:
+            return None
+        with self._lock:
+            entry = self._files.get(rel_path)
+        if entry is None or _matches_disk(path, entry):
+            return entry
+        self.files_changed(frozenset({path}))
+        return None
+
+    def files_changed(self, paths: frozenset[str]) -> None:
+        """Docroot listener dropping the entries of changed files (all of them if paths is empty)."""
+        with self._lock:
+            if not paths:
+                self._files.clear()
+                return
+            for path in paths:
+                rel_path = self._relative(path)
+                if rel_path is not None:
+                    self._files.pop(rel_path, None)
+
+
+def _matches_disk(path: str, entry: dict[str, Any]) -> bool:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return (stat.st_mtime_ns, stat.st_size) == (entry.get("mtime_ns"), entry.get("size"))
+
+
+def _read_bundle(root: str, version: Optional[str]) -> Optional[dict[str, dict[str, Any]]]:
+    """Read the bundle file and keep the entries whose file is unchanged."""
+    try:
+        with open(os.path.join(root, BUNDLE_FILE), encoding="utf-8") as f:
+            bundle = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable docroot bundle in {root}: {e}")
+        return None
+    if not isinstance(bundle, dict) or bundle.get("format") != BUNDLE_FORMAT or bundle.get("version") != version:
+        logger.debug(f"Ignoring docroot bundle in {root}: format or docroot version differs")
+        return None
+    files = bundle.get("files")
+    if not isinstance(files, dict):
+        return None
+    return {
+        rel_path: entry
+        for rel_path, entry in files.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("text"), str)
+        and _matches_disk(os.path.join(root, rel_path), entry)
+    }
+
+
+def _seed(files: dict[str, dict[str, Any]]) -> None:
+    """Hand pre-parsed frontmatter and tokens to the render caches."""
+    from mcp_guide.render.frontmatter import seed_parsed_content
+    from mcp_guide.render.tokens import seed_tokens
+
+    parsed = [entry for entry in files.values() if "frontmatter" in entry]
+    seed_parsed_content(
+        (entry["text"], entry["frontmatter"], entry["frontmatter_length"])
+        for entry in parsed
+        if entry["frontmatter_length"]
+    )
+    seed_tokens(
+        (entry["text"][entry["frontmatter_length"] :], tuple((tag, name) for tag, name in entry["tokens"]))
+        for entry in parsed
+        if "tokens" in entry
+    )
+
+
+async def load_docroot_bundle(docroot: Union[str, Path]) -> Optional[DocrootBundle]:
+    """Load the bundle for docroot once, unless it is missing or belongs to another docroot version.
+
+    Returns:
+        The loaded bundle, or None if docroot has no usable bundle
+    """
+    from mcp_guide.installer.core import read_version
+
+    root = str(Path(docroot).resolve())
+    with _lock:
+        bundle = _bundles.get(root)
+    if bundle is None:
+        files = await asyncio.to_thread(_read_bundle, root, await read_version(Path(root)))
+        if files is None:
+            return None
+        _seed(files)
+        with _lock:
+            bundle = _bundles.setdefault(root, DocrootBundle(root, files))
+        add_docroot_listener(bundle.files_changed)
+        logger.debug(f"Loaded docroot bundle with {len(files)} unmodified file(s) from {root}")
+    bundle.add_alias(os.path.abspath(docroot))
+    return bundle
+
+
+def unload_docroot_bundles() -> None:
+    """Forget every loaded bundle."""
+    with _lock:
+        _bundles.clear()
+
+
+def _find_entry(path: Union[str, Path]) -> Optional[dict[str, Any]]:
+    with _lock:
+        bundles = list(_bundles.values())
+    target = os.path.abspath(path)
+    for bundle in bundles:
+        entry = bundle.entry(target)
+        if entry is not None:
+            return entry
+    return None
+
+
+def get_bundled_text(path: Union[str, Path]) -> Optional[str]:
+    """Return the bundled text of an unmodified docroot file."""
+    entry = _find_entry(path)
+    return entry["text"] if entry is not None else None
+
+
+def get_bundled_command(path: Union[str, Path]) -> Optional[dict[str, Any]]:
+    """Return the bundled metadata of an unmodified command file, as built by discover_commands."""
+    entry = _find_entry(path)
+    if entry is None or "command" not in entry:
+        return None
+    return {**copy.deepcopy(entry["command"]), "path": str(path)}
+
+
+async def read_docroot_text(path: Union[str, Path]) -> str:
+    """Read a docroot file, from the bundle when it is unmodified.
+
+    Raises:
+        FileNotFoundError, PermissionError, UnicodeDecodeError: As for reading the file directly
+    """
+    text = get_bundled_text(path)
+    if text is not None:
+        return text
+    return await AsyncPath(path).read_text(encoding="utf-8")
@@ -1,7 +1,7 @@
 """Command discovery utilities for finding and parsing commands in _commands directory."""
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TypedDict
@@ -9,6 +9,7 @@ from typing import Any, TypedDict
 from anyio import Path as AsyncPath
 
 from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.discovery.bundle import get_bundled_command, read_docroot_text
 from mcp_guide.discovery.files import discover_document_files
 from mcp_guide.discovery.patterns import is_valid_command
 from mcp_guide.render.frontmatter import parse_content_with_frontmatter
@@ -123,6 +124,36 @@ def _normalise_aliases(
     return aliases, alias_metadata
 
 
+def build_command_metadata(command_name: str, file_path: Path, front_matter: Mapping[str, Any]) -> dict[str, Any]:
+    """Build the command dictionary for a command file from its frontmatter.
+
+    Args:
+        command_name: Command name (path relative to the commands directory, without extension)
+        file_path: Absolute path to the command file
+        front_matter: Parsed frontmatter (may be empty)
+
+    Returns:
+        Command dictionary with name, path, description, usage, examples, aliases, etc.
+    """
+    examples = front_matter.get("examples", [])
+    category = front_matter.get("category", "general")
+    aliases, alias_metadata = _normalise_aliases(
+        front_matter.get("aliases", []),
+        command_name=command_name,
+        file_path=file_path,
+    )
+    return {
+        "name": command_name,
+        "path": str(file_path),  # Absolute for template use
+        "description": front_matter.get("description", ""),
+        "usage": front_matter.get("usage", ""),
+        "examples": examples if isinstance(examples, list) else [],
+        "aliases": aliases,
+        "alias_metadata": alias_metadata,
+        "category": category if isinstance(category, str) else "general",
+    }
+
+
 async def discover_command_files(commands_dir: Path, patterns: list[str]) -> list[Any]:
     """Discover command files, filtering out underscore-prefixed files and directories."""
     all_files = await discover_document_files(commands_dir, patterns)
@@ -225,18 +256,10 @@ async def discover_commands(commands_dir: Path) -> list[dict[str, Any]]:
         # file_info.path is already relative to commands_dir
         command_name = str(file_info.path.with_suffix(""))
 
-        # Parse front matter by reading file content
-        description = ""
-        usage = ""
-        examples = []
-        aliases = []
-        alias_metadata = []
-        category = "general"
-
         try:
-            # Read file content to parse front matter
+            # Read file content to parse front matter (served from the docroot bundle when unmodified)
             file_path = commands_dir / file_info.path
-            content = await AsyncPath(file_path).read_text(encoding="utf-8")
+            content = await read_docroot_text(file_path)
 
             parsed = parse_content_with_frontmatter(content)
             front_matter = parsed.frontmatter
@@ -255,35 +278,16 @@ async def discover_commands(commands_dir: Path) -> list[dict[str, Any]]:
                     # Check requirements - skip command if not met
                     from mcp_guide.render.frontmatter import check_frontmatter_requirements
 
-                    if not check_frontmatter_requirements(front_matter, dict(context_data)):
+                    if not check_frontmatter_requirements(front_matter, context_data):
                         continue
 
-                description = front_matter.get("description", "")
-                usage = front_matter.get("usage", "")
-                examples = front_matter.get("examples", [])
-                aliases, alias_metadata = _normalise_aliases(
-                    front_matter.get("aliases", []),
-                    command_name=command_name,
-                    file_path=file_path,
-                )
-                category = front_matter.get("category", "general")
+            command = get_bundled_command(file_path) or build_command_metadata(command_name, file_path, front_matter)
         except Exception as e:
             # Collect errors for aggregated logging; skip bad files rather than aborting discovery
             error_files.append(f"{file_path}: {e}")
             continue
 
-        commands.append(
-            {
-                "name": command_name,
-                "path": str(commands_dir / file_info.path),  # Make absolute for template use
-                "description": description,
-                "usage": usage,
-                "examples": examples if isinstance(examples, list) else [],
-                "aliases": aliases,
-                "alias_metadata": alias_metadata,
-                "category": category if isinstance(category, str) else "general",
-            }
-        )
+        commands.append(command)
 
     # Log aggregated errors once
     if error_files:
@@ -1,8 +1,9 @@
 """File discovery utilities for finding files in category directories."""
 
+import copy
 from datetime import datetime
 from functools import partial
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Union
 
 if TYPE_CHECKING:
@@ -13,9 +14,13 @@ _SENTINEL = object()  # Sentinel value for distinguishing unset parameters
 import anyio
 from anyio import Path as AsyncPath
 
+from mcp_guide.config_constants import MAX_DOCUMENTS_PER_GLOB
+from mcp_guide.core.mcp_log import get_logger
 from mcp_guide.discovery.patterns import safe_glob_search
 from mcp_guide.store.document_store import get_document_content, list_documents
 
+logger = get_logger(__name__)
+
 # Template file extensions
 TEMPLATE_EXTENSIONS = (".mustache", ".hbs", ".handlebars", ".chevron")
 
@@ -136,6 +141,12 @@ class FileInfo:
         self._content_explicitly_set = content is not _SENTINEL
         self._raw_cache: Optional[str] = None
 
+    def clone(self) -> "FileInfo":
+        """Return a copy whose content and frontmatter can be loaded and changed independently."""
+        clone = copy.copy(self)
+        clone._frontmatter = copy.deepcopy(self._frontmatter)
+        return clone
+
     def resolve(self, base_dir: Path, docroot: Path) -> Path:
         """Resolve relative path to absolute path with security validation.
 
@@ -193,11 +204,11 @@ class FileInfo:
             self._load_error = None
             return
 
-        # Fall back to filesystem read
-        from mcp_guide.core import read_file_content
+        # Fall back to filesystem read (or the docroot bundle when the file is unmodified)
+        from mcp_guide.discovery.bundle import read_docroot_text
 
         try:
-            self._content = await read_file_content(self.path)
+            self._content = await read_docroot_text(self.path)
             if self._content is not None:
                 self.size = len(self._content)
             self._load_error = None
@@ -227,12 +238,29 @@ class FileInfo:
                 raise FileNotFoundError(f"No content available for {self.path}")
             self._raw_cache = content
             return content
-        from mcp_guide.core import read_file_content
+        from mcp_guide.discovery.bundle import read_docroot_text
 
-        result = await read_file_content(self.path)
+        result = await read_docroot_text(self.path)
         self._raw_cache = result
         return result
 
+    @property
+    def content_pending(self) -> bool:
+        """Whether content has yet to be loaded from its source."""
+        return not self._content_explicitly_set and self._content is None and self._raw_cache is None
+
+    def prime_content(self, content: str) -> None:
+        """Seed raw content fetched ahead of time so no per-file load is needed.
+
+        Used for batched prefetching of stored documents; a later read_raw() or
+        get_content() returns the primed value instead of calling content_loader.
+        """
+        self._raw_cache = content
+        if not self._content_explicitly_set and self._content is None:
+            self._content = content
+            self.size = len(content)
+            self._load_error = None
+
     def _parse_frontmatter_if_needed(self) -> None:
         """Internal method to parse frontmatter if not already parsed."""
         if self._frontmatter is not None or self._content is None or self.source == "store":
@@ -295,7 +323,8 @@ async def discover_document_stored(
 
     Uses the same pattern expansion as filesystem discovery
     (get_file_extension_patterns) including template extension variants.
-    Matching is case-sensitive, consistent with filesystem behaviour.
+    Matching is case-sensitive, consistent with filesystem behaviour, and is
+    performed by the store together with the MAX_DOCUMENTS_PER_GLOB limit.
 
     Args:
         category: Category name to query
@@ -308,11 +337,11 @@ async def discover_document_stored(
     for p in patterns:
         expanded.extend(get_file_extension_patterns(p))
 
-    records = await list_documents(category)
+    records = await list_documents(category, patterns=expanded, limit=MAX_DOCUMENTS_PER_GLOB)
+    if len(records) >= MAX_DOCUMENTS_PER_GLOB:
+        logger.warning(f"Reached maximum document limit ({MAX_DOCUMENTS_PER_GLOB}) for stored documents in {category}")
     results = []
     for record in records:
-        if not any(PurePosixPath(record.name).full_match(ep) for ep in expanded):
-            continue
         mtime = datetime.fromisoformat(record.updated_at)
         loader = partial(get_document_content, record.category, record.name)
         results.append(
@@ -14,6 +14,7 @@ FLAG_CONTENT_FORMAT = "content-format"
 FLAG_CONTENT_STYLE = "content-style"
 FLAG_RESOURCE = "format-resource"
 FLAG_COMMAND = "format-command"
+FLAG_CONTENT_BUDGET = "content-budget"
 
 # Startup flags
 FLAG_STARTUP_INSTRUCTION = "startup-instruction"
@@ -8,6 +8,7 @@ from mcp_guide.feature_flags.constants import (
     FLAG_ALLOW_CLIENT_INFO,
     FLAG_AUTOUPDATE,
     FLAG_COMMAND,
+    FLAG_CONTENT_BUDGET,
     FLAG_CONTENT_FORMAT,
     FLAG_CONTENT_STYLE,
     FLAG_GUIDE_DEVELOPMENT,
@@ -172,6 +173,23 @@ def validate_allow_client_info(value: FeatureValueLike | None, is_project: bool)
     return coerce_boolean_like(value) is not None
 
 
+def validate_content_budget(value: FeatureValueLike | None, is_project: bool) -> bool:
+    """Validate content-budget flag value.
+
+    Accepts a number of bytes or tokens, e.g. '48000', '48000 bytes' or '12000 tokens'.
+
+    Args:
+        value: Flag value to validate
+        is_project: Whether this is a project-level flag (unused)
+
+    Returns:
+        True if value is a valid budget, False otherwise
+    """
+    from mcp_guide.content.pagination import parse_content_budget
+
+    return parse_content_budget(value) is not None
+
+
 def validate_autoupdate(value: FeatureValueLike | None, is_project: bool) -> bool:
     """Validate autoupdate flag value.
 
@@ -376,6 +394,7 @@ def clear_validators() -> None:
 # Register validators
 register_flag_validator(FLAG_CONTENT_FORMAT, validate_content_format_mime)
 register_flag_validator(FLAG_CONTENT_STYLE, validate_template_styling)
+register_flag_validator(FLAG_CONTENT_BUDGET, validate_content_budget)
 register_flag_validator(
     FLAG_ALLOW_CLIENT_INFO,
     validate_allow_client_info,
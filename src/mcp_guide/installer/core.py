@@ -561,6 +561,7 @@ async def install_templates(docroot: Path, archive_path: Path) -> dict[str, int]
         Dict with operation counts: installed, updated, patched, unchanged, conflicts, skipped_binary
     """
     from mcp_guide import __version__
+    from mcp_guide.discovery.bundle import write_docroot_bundle
 
     # Ensure docroot exists before any operations
     await AsyncPath(docroot).mkdir(parents=True, exist_ok=True)
@@ -590,8 +591,9 @@ async def install_templates(docroot: Path, archive_path: Path) -> dict[str, int]
     with ZipFile(archive_path, "a") as zf:
         zf.writestr(VERSION_FILE, __version__)
 
-    # Write version to docroot
+    # Write version to docroot, then the bundle compiled from the resulting documents
     await write_version(docroot, __version__)
+    await write_docroot_bundle(docroot, __version__)
 
     return stats
 
@@ -636,11 +638,13 @@ async def update_documents(docroot: Path, archive_path: Path) -> dict[str, int]:
 
     # Add version to archive
     from mcp_guide import __version__
+    from mcp_guide.discovery.bundle import write_docroot_bundle
 
     with ZipFile(archive_path, "a") as zf:
         zf.writestr(VERSION_FILE, __version__)
 
-    # Write version to docroot
+    # Write version to docroot, then the bundle compiled from the resulting documents
     await write_version(docroot, __version__)
+    await write_docroot_bundle(docroot, __version__)
 
     return stats
@@ -1,17 +1,20 @@
 """Template context cache with session listener for decoupled context management."""
 
 import platform
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from mcp_guide.session import Session
+    from mcp_guide.task_manager.manager import TaskManager
 
 from mcp_guide import __version__
 from mcp_guide.core.mcp_log import get_logger
 from mcp_guide.discovery.files import FileInfo
 from mcp_guide.feature_flags.constants import FLAG_WORKFLOW, FLAG_WORKFLOW_CONSENT, FLAG_WORKFLOW_FILE
 from mcp_guide.feature_flags.types import FeatureValue, to_raw_feature_value
-from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.context import LazyValue, TemplateContext
+from mcp_guide.render.memo import impure
 from mcp_guide.result_constants import (
     INSTRUCTION_AGENT_INFORMATION,
     INSTRUCTION_AGENT_INSTRUCTIONS,
@@ -172,52 +175,105 @@ class TemplateContextCache(SessionListener):
 
         task_manager = get_task_manager()
 
-        # Add task statistics
+        # Task statistics and OpenSpec data are only gathered when a template uses them
+        agent_vars["tasks"] = LazyValue(partial(self._build_task_statistics, task_manager))
+        agent_vars["openspec"] = LazyValue(partial(self._build_openspec_context, task_manager))
+
+        agent_vars.update(formatting_vars)
+
+        return TemplateContext(agent_vars)
+
+    @staticmethod
+    def _build_task_statistics(task_manager: "TaskManager") -> Optional[dict[str, Any]]:
+        """Build the task statistics context section."""
         try:
-            agent_vars["tasks"] = task_manager.get_task_statistics()
+            return task_manager.get_task_statistics()
         except (AttributeError, KeyError) as e:
             logger.debug(f"Failed to get task statistics: {e}")
+            return None
 
-        # Add OpenSpec-specific context (version, changes, status)
+    @staticmethod
+    def _build_openspec_context(task_manager: "TaskManager") -> dict[str, Any] | bool:
+        """Build the OpenSpec context section (version, changes, status), or False when unavailable."""
         try:
             # OpenSpecTask needs lazy import
             from mcp_guide.openspec.task import OpenSpecTask
 
             openspec_task_subscriber = task_manager.get_task_by_type(OpenSpecTask)
 
-            if openspec_task_subscriber:
-                # Create lambda for version checking
-                def has_version(text: str, render: Any) -> bool:
-                    """Check if OpenSpec version meets minimum requirement.
-
-                    Args:
-                        text: Minimum version string (e.g., "1.2.0")
-                        render: Mustache render function
-
-                    Returns:
-                        True if current version >= minimum
-                    """
-                    minimum = render(text).strip()
-                    return openspec_task_subscriber.meets_minimum_version(minimum)
-
-                agent_vars["openspec"] = {
-                    "available": openspec_task_subscriber.is_available(),
-                    "version": openspec_task_subscriber.get_version(),
-                    "changes": openspec_task_subscriber.get_changes() or [],
-                    "show": openspec_task_subscriber.get_show(),
-                    "status": openspec_task_subscriber.get_status(),
-                    "has_version": has_version,
-                }
-            else:
+            if not openspec_task_subscriber:
                 # Task not registered (feature flag disabled) - set to False
-                agent_vars["openspec"] = False
+                return False
+
+            # Create lambda for version checking (reads live task state)
+            @impure
+            def has_version(text: str, render: Any) -> bool:
+                """Check if OpenSpec version meets minimum requirement.
+
+                Args:
+                    text: Minimum version string (e.g., "1.2.0")
+                    render: Mustache render function
+
+                Returns:
+                    True if current version >= minimum
+                """
+                minimum = render(text).strip()
+                return openspec_task_subscriber.meets_minimum_version(minimum)
+
+            return {
+                "available": openspec_task_subscriber.is_available(),
+                "version": openspec_task_subscriber.get_version(),
+                "changes": openspec_task_subscriber.get_changes() or [],
+                "show": openspec_task_subscriber.get_show(),
+                "status": openspec_task_subscriber.get_status(),
+                "has_version": has_version,
+            }
         except Exception as e:
             logger.debug(f"Failed to get OpenSpec context: {e}")
-            agent_vars["openspec"] = False
+            return False
 
-        agent_vars.update(formatting_vars)
+    @staticmethod
+    async def _build_projects_context(session: Optional["Session"], project_name: str) -> tuple[dict[str, Any], int]:
+        """Build the projects list context section and the number of projects."""
+        projects_data: dict[str, Any] = {}
+        projects_count = 0
+        try:
+            if session:
+                from mcp_guide.session import list_all_projects
 
-        return TemplateContext(agent_vars)
+                projects_result = await list_all_projects(session, verbose=True)
+                if projects_result.success and projects_result.value:
+                    projects_dict = projects_result.value.get("projects", {})
+                    # Convert to array format for Mustache iteration with current project marking
+                    current_project = project_name
+                    projects_list: list[dict[str, Any]] = []
+                    for name, data in projects_dict.items():
+                        # Format categories with patterns_str
+                        categories = []
+                        for cat in data.get("categories", []):
+                            patterns = cat.get("patterns", [])
+                            patterns_str = ", ".join(f"`{p}`" for p in patterns) if patterns else ""
+                            categories.append({**cat, "patterns_str": patterns_str})
+
+                        # Format collections with categories_str
+                        collections = []
+                        for col in data.get("collections", []):
+                            col_categories = col.get("categories", [])
+                            categories_str = ", ".join(f"`{c}`" for c in col_categories) if col_categories else ""
+                            collections.append({**col, "categories_str": categories_str})
+
+                        projects_list.append(
+                            {
+                                "key": name,
+                                "value": {**data, "categories": categories, "collections": collections},
+                                "current": name == current_project,
+                            }
+                        )
+                    projects_count = len(projects_dict)
+                    projects_data = {"projects": projects_list}
+        except Exception as e:
+            logger.debug(f"Failed to get projects list: {e}")
+        return projects_data, projects_count
 
     async def _build_project_context(self) -> "TemplateContext":
         """Build project context with current project data."""
@@ -234,6 +290,7 @@ class TemplateContextCache(SessionListener):
         flags_list: list[dict[str, Any]] = []
         project = None
         project_flag_values = []
+        session = None
 
         try:
             session = await get_session(None)
@@ -305,45 +362,14 @@ class TemplateContextCache(SessionListener):
         except Exception as e:
             logger.debug(f"Failed to resolve flags: {e}")
 
-        # Get projects list for template context
-        projects_data: dict[str, Any] = {}
-        projects_count = 0
-        try:
-            if session:
-                from mcp_guide.session import list_all_projects
-
-                projects_result = await list_all_projects(session, verbose=True)
-                if projects_result.success and projects_result.value:
-                    projects_dict = projects_result.value.get("projects", {})
-                    # Convert to array format for Mustache iteration with current project marking
-                    current_project = project_name
-                    projects_list: list[dict[str, Any]] = []
-                    for name, data in projects_dict.items():
-                        # Format categories with patterns_str
-                        categories = []
-                        for cat in data.get("categories", []):
-                            patterns = cat.get("patterns", [])
-                            patterns_str = ", ".join(f"`{p}`" for p in patterns) if patterns else ""
-                            categories.append({**cat, "patterns_str": patterns_str})
+        # The projects list reads every project's configuration, so it is only built when used
+        projects_info = LazyValue(partial(self._build_projects_context, session, project_name))
 
-                        # Format collections with categories_str
-                        collections = []
-                        for col in data.get("collections", []):
-                            col_categories = col.get("categories", [])
-                            categories_str = ", ".join(f"`{c}`" for c in col_categories) if col_categories else ""
-                            collections.append({**col, "categories_str": categories_str})
+        async def projects() -> dict[str, Any]:
+            return (await projects_info.resolve())[0]
 
-                        projects_list.append(
-                            {
-                                "key": name,
-                                "value": {**data, "categories": categories, "collections": collections},
-                                "current": name == current_project,
-                            }
-                        )
-                    projects_count = len(projects_dict)
-                    projects_data = {"projects": projects_list}
-        except Exception as e:
-            logger.debug(f"Failed to get projects list: {e}")
+        async def projects_count() -> int:
+            return (await projects_info.resolve())[1]
 
         # Get client working directory for template context
         client_working_dir = ""
@@ -525,8 +551,8 @@ class TemplateContextCache(SessionListener):
             "flag_values": resolved_flags_list,  # List format for iteration
             "feature_flags": global_flags_dict,  # Global flags only (dict format)
             "feature_flag_values": global_flags_list,  # Global flags only (list format)
-            "projects": projects_data,
-            "projects_count": projects_count,
+            "projects": LazyValue(projects, {}),
+            "projects_count": LazyValue(projects_count, 0),
         }
 
         # Create base context and add workflow configuration as child if enabled
@@ -572,12 +598,18 @@ class TemplateContextCache(SessionListener):
         Returns:
             TemplateContext with layered contexts (system → agent → project → category)
         """
+        # Add category context if requested (not cached) on top of the shared base
+        # snapshot, so a request spanning several categories builds the base only once
+        if category_name is not None:
+            base_context = await self.get_template_contexts()
+            category_context = await self._build_category_context(category_name)
+            return category_context.new_child(base_context)
+
         # Check cache first (only for non-category contexts)
-        if category_name is None:
-            if self._cache is not None:
-                logger.trace("TemplateContextCache: Returning cached context")
-                return self._cache
-            logger.trace("TemplateContextCache: No cached context, building new one")
+        if self._cache is not None:
+            logger.trace("TemplateContextCache: Returning cached context")
+            return self._cache
+        logger.trace("TemplateContextCache: No cached context, building new one")
 
         # Build contexts
         system_context = await self._build_system_context()
@@ -588,15 +620,10 @@ class TemplateContextCache(SessionListener):
         # Create layered context: project → agent → client → system
         layered_context = project_context.new_child(agent_context.new_child(client_context.new_child(system_context)))
 
-        # Add category context if requested (not cached)
-        if category_name is not None:
-            category_context = await self._build_category_context(category_name)
-            layered_context = category_context.new_child(layered_context)
-        else:
-            # Cache only when no category context (base contexts only)
-            self._cache = layered_context
-
-        return layered_context
+        # Cache the base contexts flattened into one read-only snapshot so lookups
+        # do not walk the layer chain
+        self._cache = layered_context.snapshot()
+        return self._cache
 
     def get_transient_context(self) -> "TemplateContext":
         """Generate fresh transient context with timestamps.
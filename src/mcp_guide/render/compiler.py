@@ -0,0 +1,239 @@
+"""Compiled Mustache engine that turns chevron token streams into Python closures.
+
+Templates are tokenised by chevron (via the token cache) and compiled once into a
+tree of closures, so rendering no longer dispatches on tag types or re-collects
+section tokens per render. Scope lookup, escaping and partial loading reuse
+chevron's own helpers, keeping output identical to chevron.render, including:
+
+- falsy section values and falsy list items render nothing
+- lambdas receive the section's raw text and a render callback
+- partials are indented by the whitespace preceding them on their line, where
+  the line is measured within the current render call as chevron does
+
+chevron scans for the end of a lambda or list section without fully tracking
+nesting, so a template with a section nesting another of the same key is rendered
+by chevron from the start. Deciding before any node runs means lambdas are never
+called twice for one render.
+"""
+
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any, Optional
+
+import chevron
+from chevron.renderer import _get_key, _get_partial, _html_escape
+
+from mcp_guide.render.tokens import Token, Tokens, get_compiled
+
+# Node signature: (scopes, padding, output buffer, partials)
+_Node = Callable[[list[Any], str, list[str], Mapping[str, Any]], None]
+
+# chevron's tag prefixes for reconstructing a lambda section's raw text
+_TAG_PREFIX = {
+    "section": "#",
+    "inverted section": "^",
+    "end": "/",
+    "partial": ">",
+    "set delimiter": "=",
+    "no escape": "&",
+    "variable": "",
+}
+
+
+class CompiledTemplate:
+    """A template compiled into closures; render() mirrors chevron.render."""
+
+    __slots__ = ("_nodes", "_tokens", "_use_chevron")
+
+    def __init__(self, tokens: Tokens, nodes: Optional[tuple["_Node", ...]] = None, use_chevron: bool = False) -> None:
+        self._tokens = tokens
+        if nodes is None:
+            nodes, _sections, use_chevron = _compile(list(tokens), 0, len(tokens))
+        self._nodes = nodes
+        # A same-key nested section depends on chevron's token scanning
+        self._use_chevron = use_chevron
+
+    def render(self, data: Any, partials: Mapping[str, Any], padding: str = "") -> str:
+        """Render with data as the only scope."""
+        return self.run([data], padding, partials)
+
+    def run(self, scopes: list[Any], padding: str, partials: Mapping[str, Any]) -> str:
+        """Render as a chevron render call with the given scope stack."""
+        if self._use_chevron:
+            return chevron.render(self._tokens, scopes=list(scopes), padding=padding, partials_dict=partials)
+        out: list[str] = []
+        for node in self._nodes:
+            node(scopes, padding, out, partials)
+        return "".join(out)
+
+
+def compile_template(content: str) -> CompiledTemplate:
+    """Return the compiled form of template text, cached alongside its tokens."""
+    return get_compiled(content, CompiledTemplate)
+
+
+def render_compiled(content: str, data: Any, partials: Mapping[str, Any], key: Any = None) -> str:
+    """Render template text with the compiled engine.
+
+    Args:
+        content: Template text
+        data: Root scope
+        partials: Partial name to partial template text
+        key: Optional template identity for the token cache
+    """
+    return get_compiled(content, CompiledTemplate, key).render(data, partials)
+
+
+def _compile(tokens: list[Token], start: int, end: int) -> tuple[tuple[_Node, ...], set[Token], bool]:
+    """Compile tokens[start:end].
+
+    Returns:
+        The nodes, the (tag, key) of every section within, and whether a section
+        nests another of the same key (the tokens must then be rendered by chevron)
+    """
+    nodes: list[_Node] = []
+    sections: set[Token] = set()
+    use_chevron = False
+    i = start
+    while i < end:
+        tag, key = tokens[i]
+        if tag in ("section", "inverted section"):
+            close = _find_close(tokens, i, end)
+            children, inner, inner_chevron = _compile(tokens, i + 1, close)
+            if tag == "section":
+                same_key = ("section", key) in inner or ("inverted section", key) in inner
+                nodes.append(_section(key, children, tokens[i + 1 : close], inner_chevron))
+                use_chevron = use_chevron or same_key or inner_chevron
+            else:
+                nodes.append(_inverted(key, children))
+                use_chevron = use_chevron or inner_chevron
+            sections |= inner
+            sections.add((tag, key))
+            i = close + 1
+            continue
+        if tag == "literal":
+            nodes.append(_literal(key))
+        elif tag == "variable":
+            nodes.append(_variable(key))
+        elif tag == "no escape":
+            nodes.append(_no_escape(key))
+        elif tag == "partial":
+            nodes.append(_partial(key))
+        # set delimiter tokens render nothing
+        i += 1
+    return tuple(nodes), sections, use_chevron
+
+
+def _find_close(tokens: list[Token], open_index: int, end: int) -> int:
+    depth = 0
+    for j in range(open_index + 1, end):
+        tag = tokens[j][0]
+        if tag in ("section", "inverted section"):
+            depth += 1
+        elif tag == "end":
+            if depth == 0:
+                return j
+            depth -= 1
+    raise chevron.ChevronError(f'Unclosed section "{tokens[open_index][1]}"')
+
+
+def _run(
+    nodes: tuple[_Node, ...], scopes: list[Any], padding: str, out: list[str], partials: Mapping[str, Any]
+) -> None:
+    for node in nodes:
+        node(scopes, padding, out, partials)
+
+
+def _literal(text: str) -> _Node:
+    has_newline = "\n" in text
+
+    def literal(scopes: list[Any], padding: str, out: list[str], partials: Mapping[str, Any]) -> None:
+        out.append(text.replace("\n", "\n" + padding) if padding and has_newline else text)
+
+    return literal
+
+
+def _variable(key: str) -> _Node:
+    def variable(scopes: list[Any], padding: str, out: list[str], partials: Mapping[str, Any]) -> None:
+        thing = _get_key(key, scopes)
+        if thing is True and key == ".":
+            # Inverted sections push True; use the un-coerced scope below it
+            thing = scopes[1]
+        out.append(_html_escape(thing if isinstance(thing, str) else str(thing)))
+
+    return variable
+
+
+def _no_escape(key: str) -> _Node:
+    def no_escape(scopes: list[Any], padding: str, out: list[str], partials: Mapping[str, Any]) -> None:
+        thing = _get_key(key, scopes)
+        out.append(thing if isinstance(thing, str) else str(thing))
+
+    return no_escape
+
+
+def _section(key: str, children: tuple[_Node, ...], raw_tokens: list[Token], use_chevron: bool) -> _Node:
+    # chevron rebuilds the section's raw text from its tokens in this exact form
+    lambda_text = "".join(
+        value
+        if tag == "literal"
+        else f"{{{{& {value} }}}}"
+        if tag == "no escape"
+        else f"{{{{{_TAG_PREFIX[tag]} {value}}}}}"
+        for tag, value in raw_tokens
+    )
+    body = CompiledTemplate(tuple(raw_tokens), children, use_chevron)
+
+    def section(scopes: list[Any], padding: str, out: list[str], partials: Mapping[str, Any]) -> None:
+        scope = _get_key(key, scopes)
+
+        if callable(scope):
+
+            def render(template: str, data: Any = None) -> str:
+                target = body if template == lambda_text else compile_template(template)
+                return target.run(data and [data] + scopes or scopes, padding, partials)
+
+            out.append(scope(lambda_text, render))
+
+        elif isinstance(scope, (Sequence, Iterator)) and not isinstance(scope, str):
+            for thing in scope:
+                # A falsy item suppresses every tag in its iteration
+                if not thing:
+                    continue
+                item_out: list[str] = []
+                _run(children, [thing] + scopes, padding, item_out, partials)
+                out.append("".join(item_out))
+
+        elif scope:
+            _run(children, [scope] + scopes, padding, out, partials)
+
+    return section
+
+
+def _inverted(key: str, children: tuple[_Node, ...]) -> _Node:
+    def inverted(scopes: list[Any], padding: str, out: list[str], partials: Mapping[str, Any]) -> None:
+        if not _get_key(key, scopes):
+            _run(children, [True] + scopes, padding, out, partials)
+
+    return inverted
+
+
+def _partial(key: str) -> _Node:
+    def partial(scopes: list[Any], padding: str, out: list[str], partials: Mapping[str, Any]) -> None:
+        template = _get_partial(key, partials, ".", "mustache")
+        left = _current_line(out)
+        indented = left.isspace()
+        part_out = compile_template(template).run(scopes, padding + left if indented else padding, partials)
+        out.append(part_out.rstrip(" \t") if indented else part_out)
+
+    return partial
+
+
+def _current_line(out: list[str]) -> str:
+    """Return the text after the last newline written to out."""
+    tail: list[str] = []
+    for piece in reversed(out):
+        _, newline, rest = piece.rpartition("\n")
+        tail.append(rest)
+        if newline:
+            break
+    return "".join(reversed(tail))
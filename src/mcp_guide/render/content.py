@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.render.dependencies import DependencyRecord
 from mcp_guide.render.frontmatter import Content, resolve_instruction
 from mcp_guide.result_constants import AGENT_INSTRUCTION
 
@@ -29,12 +30,14 @@ class RenderedContent(Content):
         template_name: Name of the template file
         partial_frontmatter: List of frontmatter from included partials
         errors: Application-level errors signaled via {{#_error}} lambda
+        dependencies: Files, partials, flags and context names the output depends on
     """
 
     template_path: Path
     template_name: str
     partial_frontmatter: list[dict[str, Any]] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    dependencies: DependencyRecord = field(default_factory=DependencyRecord)
 
     @property
     def template_type(self) -> str:
@@ -1,60 +1,218 @@
 """Template context management with type-safe ChainMap extension."""
 
+import inspect
 import time
 from collections import ChainMap
-from collections.abc import MutableMapping
+from collections.abc import Callable, ItemsView, Iterable, Mapping, MutableMapping, Sequence, ValuesView
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, overload
 
 from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.render.memo import active_reads
 
 logger = get_logger(__name__)
 
 
 def convert_lists_to_indexed(obj: Any) -> Any:
-    """Recursively convert lists to IndexedList for both iteration and indexed access."""
-    if isinstance(obj, list):
-        return IndexedList([convert_lists_to_indexed(item) for item in obj])
+    """Recursively convert lists to IndexedList for both iteration and indexed access.
+
+    Lists are wrapped without being walked; their items are converted when accessed.
+    Dicts are copied only when something inside them was converted.
+    """
+    if isinstance(obj, IndexedList):
+        return obj
+    elif isinstance(obj, list):
+        return IndexedList(obj)
     elif isinstance(obj, dict):
-        return {k: convert_lists_to_indexed(v) for k, v in obj.items()}
+        converted = {k: convert_lists_to_indexed(v) for k, v in obj.items()}
+        # Share dicts that hold no lists rather than copying them
+        return obj if all(converted[k] is v for k, v in obj.items()) else converted
     else:
         return obj
 
 
-class IndexedList(list[Any]):
-    """List that supports both iteration and indexed access via attributes."""
+class IndexedList(Sequence[Any]):
+    """Read-only list view that supports both iteration and indexed access via attributes.
+
+    Items are presented as dicts carrying `first` and `last` (scalars are wrapped as
+    `{"value": item}`), and `.0`, `.1`, ... and `.length` resolve as attributes, so
+    templates can use `items.0.value` or `items.length`. Items are built on access
+    from the underlying list, which is neither copied nor walked up front.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list[Any]) -> None:
+        self._items = items
+
+    def _item(self, index: int) -> dict[str, Any]:
+        item = convert_lists_to_indexed(self._items[index])
+        position = {"first": index == 0, "last": index == len(self._items) - 1}
+        if isinstance(item, dict):
+            return {**item, **position}
+        return {"value": item, **position}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(len(self._items))[index]]
+        if not isinstance(index, int):
+            raise TypeError(f"IndexedList indices must be integers or slices, not {type(index).__name__}")
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("IndexedList index out of range")
+        return self._item(index)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "length":
+            return len(self._items)
+        if name.isdigit() and int(name) < len(self._items):
+            return self._item(int(name))
+        raise AttributeError(name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (IndexedList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class LazyValue:
+    """Context value computed by a provider the first time it is needed.
+
+    A sync provider runs when a template first dereferences the value. An async
+    provider cannot run during a (synchronous) render, so it is awaited by
+    TemplateContext.resolve_lazy() for the names a template uses; until then the
+    default is seen. The result is kept, so a provider runs at most once per
+    context built by the template context cache.
+    """
+
+    __slots__ = ("_provider", "_default", "_value", "resolved")
+
+    def __init__(self, provider: Callable[[], Any], default: Any = None) -> None:
+        self._provider = provider
+        self._default = default
+        self._value: Any = None
+        self.resolved = False
+
+    def get(self) -> Any:
+        """Return the value, running a sync provider if needed."""
+        if not self.resolved:
+            if inspect.iscoroutinefunction(self._provider):
+                name = getattr(self._provider, "__name__", self._provider)
+                logger.debug(f"Lazy context value {name} read before being resolved")
+                return self._default
+            self._value = self._provider()
+            self.resolved = True
+        return self._value
+
+    async def resolve(self) -> Any:
+        """Return the value, awaiting an async provider if needed."""
+        if not self.resolved:
+            value = self._provider()
+            self._value = await value if inspect.isawaitable(value) else value
+            self.resolved = True
+        return self._value
 
-    def __init__(self, items: Any) -> None:
-        super().__init__()
-        processed_items = []
-        for i, item in enumerate(items):
-            if isinstance(item, dict):
-                enhanced_item = item.copy()
-                enhanced_item["first"] = i == 0
-                enhanced_item["last"] = i == len(items) - 1
-                processed_items.append(enhanced_item)
-            else:
-                processed_items.append({"value": item, "first": (i == 0), "last": (i == len(items) - 1)})
 
-        self.extend(processed_items)
+class _Layer(dict[str, Any]):
+    """One context layer; values are converted with convert_lists_to_indexed on first access.
 
-        for i, item in enumerate(processed_items):
-            setattr(self, str(i), item)
-        setattr(self, "length", len(processed_items))
+    Layers are shared by every context chained above them, so each value is
+    converted at most once however many child contexts are created.
+    """
+
+    __slots__ = ("_converted",)
+
+    def __init__(self, mapping: Mapping[str, Any]) -> None:
+        super().__init__(mapping)
+        self._converted: set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        value = dict.__getitem__(self, key)
+        if key not in self._converted:
+            if isinstance(value, LazyValue):
+                lazy = value
+                value = lazy.get()
+                if not lazy.resolved:
+                    return convert_lists_to_indexed(value)
+            value = convert_lists_to_indexed(value)
+            dict.__setitem__(self, key, value)
+            self._converted.add(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+        self._converted.discard(key)
+
+    def get(self, key: str, default: Any = None) -> Any:  # ty: ignore[invalid-method-override]
+        return self[key] if key in self else default
+
+    def items(self) -> ItemsView[str, Any]:  # ty: ignore[invalid-method-override]
+        return ItemsView(self)
+
+    def values(self) -> ValuesView[Any]:  # ty: ignore[invalid-method-override]
+        return ValuesView(self)
+
+    @classmethod
+    def merge(cls, layers: Iterable["_Layer"]) -> "_ReadOnlyLayer":
+        """Merge layers (highest priority first) into one read-only layer sharing their values."""
+        merged = _ReadOnlyLayer({})
+        for layer in reversed(list(layers)):
+            for key, value in dict.items(layer):
+                dict.__setitem__(merged, key, value)
+                if key in layer._converted:
+                    merged._converted.add(key)
+                else:
+                    merged._converted.discard(key)
+        return merged
+
+
+class _ReadOnlyLayer(_Layer):
+    """Layer that rejects writes; values are still converted on first access."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Template context snapshot is read-only; add values with new_child()")
+
+    __setitem__ = __delitem__ = pop = popitem = clear = update = setdefault = _read_only
 
 
 class TemplateContext(ChainMap[str, Any]):
-    """Type-safe template context extending ChainMap for scope chaining."""
+    """Type-safe template context extending ChainMap for scope chaining.
 
-    def __init__(self, *maps: dict[str, Any]) -> None:
-        converted_maps = [convert_lists_to_indexed(mapping) for mapping in maps]
-        for mapping in converted_maps:
-            self._validate_mapping(mapping)
-        super().__init__(*converted_maps)
+    Each map becomes a layer that is validated once and converts its values on
+    first access; existing layers (including those of a TemplateContext passed
+    as a map) are reused as-is, so new_child() does not re-walk the parent chain.
+    """
+
+    def __init__(self, *maps: Mapping[str, Any]) -> None:
+        layers: list[MutableMapping[str, Any]] = []
+        for mapping in maps:
+            if isinstance(mapping, TemplateContext):
+                layers.extend(mapping.maps)
+            elif isinstance(mapping, _Layer):
+                layers.append(mapping)
+            else:
+                self._validate_mapping(mapping)
+                layers.append(_Layer(mapping))
+        super().__init__(*layers)
 
     @staticmethod
-    def _validate_mapping(mapping: dict[str, Any]) -> None:
+    def _validate_mapping(mapping: Mapping[str, Any]) -> None:
 
         for key in mapping:
             if not isinstance(key, str):
@@ -65,20 +223,52 @@ class TemplateContext(ChainMap[str, Any]):
             raise TypeError(f"Context keys must be strings, got {type(key).__name__}: {key}")
         super().__setitem__(key, value)
 
+    def __getitem__(self, key: str) -> Any:
+        reads = active_reads()
+        if reads is None:
+            return super().__getitem__(key)
+        return reads.lookup(self, key)
+
     def __contains__(self, key: object) -> bool:
-        return isinstance(key, str) and super().__contains__(key)
+        if not isinstance(key, str):
+            return False
+        reads = active_reads()
+        if reads is None:
+            return super().__contains__(key)
+        try:
+            reads.lookup(self, key)
+        except KeyError:
+            return False
+        return True
 
     def new_child(self, m: Optional[MutableMapping[str, Any]] = None) -> "TemplateContext":
         if m is None:
             m = {}
-        if isinstance(m, dict):
-            self._validate_mapping(m)  # ty: ignore[invalid-argument-type]
-        return TemplateContext(m, *self.maps)  # ty: ignore[invalid-argument-type]
+        return TemplateContext(m, *self.maps)
 
     @property
     def parents(self) -> Optional["TemplateContext"]:
         parent_maps = super().parents
-        return None if len(self.maps) <= 1 else TemplateContext(*parent_maps.maps)  # ty: ignore[invalid-argument-type]
+        return None if len(self.maps) <= 1 else TemplateContext(*parent_maps.maps)
+
+    def snapshot(self) -> "TemplateContext":
+        """Return a flat, read-only context with the values visible through this one.
+
+        Values are shared with this context's layers, not copied: lazy values and
+        lists already converted for templates carry over. Lookups then hit a single
+        layer, and per-render data is added on top with new_child().
+        """
+        return TemplateContext(_Layer.merge(self.maps))  # ty: ignore[invalid-argument-type]
+
+    async def resolve_lazy(self, names: Optional[Iterable[str]] = None) -> None:
+        """Await async lazy values visible under the given names (all names if None)."""
+        for name in set(self) if names is None else names:
+            for layer in self.maps:
+                if name in layer:
+                    value = dict.__getitem__(layer, name)  # ty: ignore[invalid-argument-type]
+                    if isinstance(value, LazyValue) and not value.resolved:
+                        await value.resolve()
+                    break
 
 
 def _convert_to_template_safe(value: Any) -> Any:
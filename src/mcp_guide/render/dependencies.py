@@ -0,0 +1,340 @@
+"""Render dependency records and the graph mapping change events to cached outputs.
+
+While a template renders, the files, partials, policy topics, flags and context
+names it depends on are noted into every active DependencyCollector (see
+collect_dependencies). The resulting DependencyRecord is attached to the output,
+and a cache that keeps the output registers it in the DependencyGraph under its
+own key. File change events from the docroot watchers and flag changes reported
+by sessions are then mapped to exactly the keys depending on them, and each
+subscribed cache drops those entries.
+"""
+
+import os
+import threading
+from collections.abc import Callable, Generator, Hashable, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.watchers.docroot_watcher import add_docroot_listener
+
+if TYPE_CHECKING:
+    from mcp_guide.session import Session
+
+logger = get_logger(__name__)
+
+# Context names whose values are derived from feature flags
+FLAG_CONTEXT_KEYS = frozenset(
+    {"flags", "flag_values", "feature_flags", "feature_flag_values", "project", "path", "workflow"}
+)
+
+InvalidationCallback = Callable[[frozenset[Hashable]], None]
+
+
+@dataclass(frozen=True)
+class DependencyRecord:
+    """What one rendered output depends on."""
+
+    # Files whose content was read (templates, partials, policy documents)
+    files: frozenset[str] = frozenset()
+    # Directories whose listing was used, so an added or removed file matters
+    directories: frozenset[str] = frozenset()
+    # Partial files included while rendering (also in files)
+    partials: frozenset[str] = frozenset()
+    policy_topics: frozenset[str] = frozenset()
+    # Flags checked by requires-* directives
+    flags: frozenset[str] = frozenset()
+    # Top-level context names looked up
+    context_keys: frozenset[str] = frozenset()
+
+    def merge(self, other: "DependencyRecord") -> "DependencyRecord":
+        """Return a record depending on everything either record depends on."""
+        return DependencyRecord(
+            files=self.files | other.files,
+            directories=self.directories | other.directories,
+            partials=self.partials | other.partials,
+            policy_topics=self.policy_topics | other.policy_topics,
+            flags=self.flags | other.flags,
+            context_keys=self.context_keys | other.context_keys,
+        )
+
+
+@dataclass
+class DependencyCollector:
+    """Dependencies noted while it is active."""
+
+    files: set[str] = field(default_factory=set)
+    directories: set[str] = field(default_factory=set)
+    partials: set[str] = field(default_factory=set)
+    policy_topics: set[str] = field(default_factory=set)
+    flags: set[str] = field(default_factory=set)
+    context_keys: set[str] = field(default_factory=set)
+
+    def record(self) -> DependencyRecord:
+        """Return the dependencies noted so far."""
+        return DependencyRecord(
+            files=frozenset(self.files),
+            directories=frozenset(self.directories),
+            partials=frozenset(self.partials),
+            policy_topics=frozenset(self.policy_topics),
+            flags=frozenset(self.flags),
+            context_keys=frozenset(self.context_keys),
+        )
+
+
+_collectors: ContextVar[tuple[DependencyCollector, ...]] = ContextVar("dependency_collectors", default=())
+
+
+@contextmanager
+def collect_dependencies() -> Generator[DependencyCollector]:
+    """Collect the dependencies of everything rendered while active.
+
+    Collectors nest: a dependency noted inside an inner collector is also noted
+    in every enclosing one, since the outer output contains the inner one.
+    """
+    collector = DependencyCollector()
+    token = _collectors.set((*_collectors.get(), collector))
+    try:
+        yield collector
+    finally:
+        _collectors.reset(token)
+
+
+def note_dependencies(
+    *,
+    files: Iterable[str] = (),
+    directories: Iterable[str] = (),
+    partials: Iterable[str] = (),
+    policy_topics: Iterable[str] = (),
+    flags: Iterable[str] = (),
+    context_keys: Iterable[str] = (),
+) -> None:
+    """Add dependencies to every active collector (no-op when none is active)."""
+    collectors = _collectors.get()
+    if not collectors:
+        return
+    partials = tuple(partials)
+    files = (*files, *partials)
+    directories, policy_topics = tuple(directories), tuple(policy_topics)
+    flags, context_keys = tuple(flags), tuple(context_keys)
+    for collector in collectors:
+        collector.files.update(files)
+        collector.directories.update(directories)
+        collector.partials.update(partials)
+        collector.policy_topics.update(policy_topics)
+        collector.flags.update(flags)
+        collector.context_keys.update(context_keys)
+
+
+def note_record(record: DependencyRecord) -> None:
+    """Add a previously collected record to every active collector, e.g. on a cache hit."""
+    note_dependencies(
+        files=record.files,
+        directories=record.directories,
+        partials=record.partials,
+        policy_topics=record.policy_topics,
+        flags=record.flags,
+        context_keys=record.context_keys,
+    )
+
+
+class DependencyGraph:
+    """Index from files, directories and flags to the cached outputs depending on them."""
+
+    def __init__(self) -> None:
+        self._records: dict[Hashable, DependencyRecord] = {}
+        self._by_file: dict[str, set[Hashable]] = {}
+        self._by_directory: dict[str, set[Hashable]] = {}
+        self._by_flag: dict[str, set[Hashable]] = {}
+        # Outputs reading flag-derived context sections depend on every flag
+        self._any_flag: set[Hashable] = set()
+        self._callbacks: list[InvalidationCallback] = []
+        self._stats = {"invalidated": 0}
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        """Register a function called with the keys invalidated by each change event."""
+        with self._lock:
+            if callback not in self._callbacks:
+                self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: InvalidationCallback) -> None:
+        """Unregister a callback added with subscribe."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def record(self, key: Hashable, record: DependencyRecord) -> None:
+        """Register (or replace) the dependencies of the cached output stored under key."""
+        with self._lock:
+            self._forget(key)
+            self._records[key] = record
+            for path in record.files:
+                self._by_file.setdefault(path, set()).add(key)
+            for directory in record.directories:
+                self._by_directory.setdefault(directory.rstrip(os.sep) or os.sep, set()).add(key)
+            for flag in record.flags:
+                self._by_flag.setdefault(flag, set()).add(key)
+            if record.context_keys & FLAG_CONTEXT_KEYS:
+                self._any_flag.add(key)
+
+    def forget(self, key: Hashable) -> None:
+        """Drop key, e.g. when its cache evicts the output."""
+        with self._lock:
+            self._forget(key)
+
+    def get_record(self, key: Hashable) -> Optional[DependencyRecord]:
+        """Return the dependencies registered for key."""
+        with self._lock:
+            return self._records.get(key)
+
+    def files_changed(self, paths: frozenset[str]) -> frozenset[Hashable]:
+        """Invalidate outputs depending on the changed files; all outputs if paths is empty.
+
+        Returns:
+            The invalidated keys
+        """
+        with self._lock:
+            if not paths:
+                keys: set[Hashable] = set(self._records)
+            else:
+                keys = set()
+                for path in paths:
+                    keys |= self._by_file.get(path, set())
+                    # An added or removed file changes the listing of every directory above it
+                    parent = os.path.dirname(path)
+                    while True:
+                        keys |= self._by_directory.get(parent, set())
+                        grandparent = os.path.dirname(parent)
+                        if grandparent == parent:
+                            break
+                        parent = grandparent
+        return self._invalidate(keys)
+
+    def on_docroot_changed(self, paths: frozenset[str]) -> None:
+        """Docroot listener forwarding watcher events to files_changed."""
+        self.files_changed(paths)
+
+    def flags_changed(self, names: Optional[Iterable[str]] = None) -> frozenset[Hashable]:
+        """Invalidate outputs depending on the named flags (any flag if names is None).
+
+        Returns:
+            The invalidated keys
+        """
+        with self._lock:
+            if names is None:
+                keys = set(self._any_flag).union(*self._by_flag.values())
+            else:
+                keys = set(self._any_flag)
+                for name in names:
+                    keys |= self._by_flag.get(name, set())
+        return self._invalidate(keys)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the number of tracked outputs and of invalidations so far."""
+        with self._lock:
+            return {**self._stats, "records": len(self._records)}
+
+    def clear(self) -> None:
+        """Forget every record (subscriptions are kept)."""
+        with self._lock:
+            self._records.clear()
+            self._by_file.clear()
+            self._by_directory.clear()
+            self._by_flag.clear()
+            self._any_flag.clear()
+            self._stats.update(invalidated=0)
+
+    def _forget(self, key: Hashable) -> None:
+        record = self._records.pop(key, None)
+        if record is None:
+            return
+        for index, names in (
+            (self._by_file, record.files),
+            (self._by_directory, {d.rstrip(os.sep) or os.sep for d in record.directories}),
+            (self._by_flag, record.flags),
+        ):
+            for name in names:
+                keys = index.get(name)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[name]
+        self._any_flag.discard(key)
+
+    def _invalidate(self, keys: set[Hashable]) -> frozenset[Hashable]:
+        if not keys:
+            return frozenset()
+        with self._lock:
+            for key in keys:
+                self._forget(key)
+            self._stats["invalidated"] += len(keys)
+            callbacks = list(self._callbacks)
+        invalidated = frozenset(keys)
+        logger.debug(f"Dependency graph invalidated {len(invalidated)} cached output(s)")
+        for callback in callbacks:
+            try:
+                callback(invalidated)
+            except Exception as e:
+                logger.exception(f"Error in dependency invalidation callback: {e}")
+        return invalidated
+
+
+_graph: Optional[DependencyGraph] = None
+_graph_lock = threading.Lock()
+
+
+def get_dependency_graph() -> DependencyGraph:
+    """Return the process-wide dependency graph, subscribed to docroot file changes."""
+    global _graph
+    with _graph_lock:
+        if _graph is None:
+            _graph = DependencyGraph()
+            add_docroot_listener(_graph.on_docroot_changed)
+        return _graph
+
+
+class DependencyFlagListener:
+    """Session listener reporting which resolved flags changed to the dependency graph.
+
+    One instance per session; the first change seen invalidates every flag-dependent
+    output, since the flags before it are not known.
+    """
+
+    def __init__(self) -> None:
+        self._flags: Optional[dict[str, Any]] = None
+
+    async def on_project_changed(self, session: "Session", old_project: str, new_project: str) -> None:
+        """Report flags that differ in the new project."""
+        await self._report(session)
+
+    async def on_config_changed(self, session: "Session") -> None:
+        """Report flags changed by a configuration update."""
+        await self._report(session)
+
+    async def _report(self, session: "Session") -> None:
+        from mcp_guide.feature_flags.types import to_raw_feature_value
+        from mcp_guide.models import resolve_all_flags
+        from mcp_guide.render.memo import fingerprint
+
+        try:
+            flags = {name: to_raw_feature_value(value) for name, value in (await resolve_all_flags(session)).items()}
+        except Exception as e:
+            logger.debug(f"Failed to resolve flags for dependency tracking: {e}")
+            get_dependency_graph().flags_changed()
+            self._flags = None
+            return
+
+        previous, self._flags = self._flags, flags
+        if previous is None:
+            get_dependency_graph().flags_changed()
+            return
+        changed = {
+            name
+            for name in previous.keys() | flags.keys()
+            if fingerprint(previous.get(name)) != fingerprint(flags.get(name))
+        }
+        if changed:
+            get_dependency_graph().flags_changed(changed)
@@ -0,0 +1,81 @@
+"""Mustache engine selection for template rendering."""
+
+import os
+from collections.abc import Hashable, Mapping
+from typing import Any, Optional
+
+import chevron
+
+from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.render.compiler import render_compiled
+from mcp_guide.render.tokens import Tokens, get_tokens
+
+logger = get_logger(__name__)
+
+ENGINE_COMPILED = "compiled"
+ENGINE_CHEVRON = "chevron"
+ENGINES = (ENGINE_COMPILED, ENGINE_CHEVRON)
+
+# Environment variable selecting the engine at startup
+ENGINE_ENV_VAR = "MCP_GUIDE_TEMPLATE_ENGINE"
+
+
+def _engine_from_env() -> str:
+    engine = os.environ.get(ENGINE_ENV_VAR, ENGINE_COMPILED).strip().lower()
+    if engine not in ENGINES:
+        logger.warning(f"Unknown template engine {engine!r} in {ENGINE_ENV_VAR}, using {ENGINE_COMPILED!r}")
+        return ENGINE_COMPILED
+    return engine
+
+
+_engine = _engine_from_env()
+
+
+def get_template_engine() -> str:
+    """Return the active Mustache engine name."""
+    return _engine
+
+
+def set_template_engine(engine: str) -> None:
+    """Select the Mustache engine ("compiled" or "chevron").
+
+    Raises:
+        ValueError: If engine is not a known engine name
+    """
+    global _engine
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown template engine {engine!r}; expected one of {ENGINES}")
+    _engine = engine
+
+
+class _TokenisedPartials:
+    """Partials view that hands chevron cached tokens instead of partial text."""
+
+    def __init__(self, partials: Mapping[str, str]) -> None:
+        self._partials = partials
+
+    def __getitem__(self, name: str) -> Tokens:
+        return get_tokens(self._partials[name])
+
+
+def render_mustache(
+    content: str,
+    data: Any,
+    partials: Optional[Mapping[str, str]] = None,
+    key: Optional[Hashable] = None,
+) -> str:
+    """Render Mustache template text with the active engine.
+
+    Args:
+        content: Template text
+        data: Root context
+        partials: Partial name to partial template text
+        key: Optional template identity for the token cache (see render.tokens.file_key)
+
+    Raises:
+        ChevronError: If the template or a rendered partial has invalid syntax
+    """
+    partials = partials if partials is not None else {}
+    if _engine == ENGINE_CHEVRON:
+        return chevron.render(get_tokens(content, key), data, partials_dict=_TokenisedPartials(partials))
+    return render_compiled(content, data, partials, key)
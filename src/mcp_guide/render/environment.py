@@ -0,0 +1,129 @@
+"""Long-lived render environment holding the template lambda table.
+
+The lambdas injected into every template context are built once per process.
+Each one dispatches to the TemplateFunctions bound for the render in progress
+through a ContextVar, so a render only creates that small handle (its context
+and error list) instead of a TemplateFunctions, a highlighter probe and a
+wrapper closure per lambda. The binding is a context variable, so it follows a
+render onto an offload worker thread and never leaks between concurrent renders.
+"""
+
+from collections import ChainMap
+from collections.abc import Callable, Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Optional
+
+from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.functions import SyntaxHighlighter, TemplateFunctions
+from mcp_guide.render.memo import impure, is_impure
+
+logger = get_logger(__name__)
+
+# Context name -> TemplateFunctions method for every lambda injected into templates
+TEMPLATE_LAMBDAS = MappingProxyType(
+    {
+        "format_date": "format_date",
+        "truncate": "truncate",
+        "highlight_code": "highlight_code",
+        "pad_right": "pad_right",
+        "contains": "contains",
+        "equals": "equals",
+        "notequals": "notequals",
+        "time_ago": "time_ago",
+        "resource": "resource",
+        "command": "command",
+        "command-args": "command_args",
+        "command-flags": "command_flags",
+        "command-alias": "command_alias",
+    }
+)
+
+# Lambdas added to a "workflow" context section
+WORKFLOW_LAMBDAS = MappingProxyType({"contains": "workflow_contains", "notcontains": "workflow_notcontains"})
+
+_bound: ContextVar[Optional[TemplateFunctions]] = ContextVar("template_functions", default=None)
+
+
+def _safe_lambda(func: Callable[..., str]) -> Callable[..., str]:
+    """Wrap lambda function to handle errors gracefully.
+
+    Logs the full exception and returns a concise, user-safe error string that
+    includes the exception type to aid debugging.
+    """
+
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            # Log full traceback for diagnostics
+            logger.exception("Error while evaluating template lambda", exc_info=True)
+            # Return a user-friendly error string with exception type preserved
+            return f"[Template Error ({type(e).__name__}): {e}]"
+
+    wrapper.__qualname__ = getattr(func, "__qualname__", wrapper.__qualname__)
+    return impure(wrapper) if is_impure(func) else wrapper
+
+
+def _dispatch(method_name: str) -> Callable[..., str]:
+    """Build a lambda calling method_name on the TemplateFunctions bound for the current render."""
+    method = getattr(TemplateFunctions, method_name)
+
+    def template_lambda(text: str, render: Optional[Callable[[str], str]] = None) -> str:
+        functions = _bound.get()
+        if functions is None:
+            raise RuntimeError(f"Template lambda {method_name} called outside a render")
+        return method(functions, text, render)
+
+    # The output memo fingerprints lambdas by qualified name
+    template_lambda.__qualname__ = f"TemplateFunctions.{method_name}"
+    return impure(template_lambda) if is_impure(method) else template_lambda
+
+
+class RenderEnvironment:
+    """Template lambdas and capability probes shared by every render."""
+
+    def __init__(self) -> None:
+        """Probe optional capabilities and build the lambda tables."""
+        self.highlighter = SyntaxHighlighter()
+        lambdas = {name: _safe_lambda(_dispatch(method)) for name, method in TEMPLATE_LAMBDAS.items()}
+        # _error reports through the bound error list and must not swallow its own failures
+        lambdas["_error"] = _dispatch("_error")
+        self.lambdas: Mapping[str, Callable[..., str]] = MappingProxyType(lambdas)
+        self.workflow_lambdas: Mapping[str, Callable[..., str]] = MappingProxyType(
+            {name: _safe_lambda(_dispatch(method)) for name, method in WORKFLOW_LAMBDAS.items()}
+        )
+        # Read-only layer reused by every TemplateContext render
+        self._lambda_context = TemplateContext(self.lambdas).snapshot()
+
+    def functions(self, context: ChainMap[str, Any]) -> TemplateFunctions:
+        """Return the per-render handle for context."""
+        return TemplateFunctions(context, self.highlighter)
+
+    def template_context(self, context: ChainMap[str, Any], values: dict[str, Any]) -> ChainMap[str, Any]:
+        """Return context with the lambda table and the per-render values layered on top."""
+        if isinstance(context, TemplateContext):
+            return TemplateContext(values, self._lambda_context, context)
+        return context.new_child({**self.lambdas, **values})
+
+    @contextmanager
+    def bind(self, functions: TemplateFunctions) -> Generator[TemplateFunctions]:
+        """Route the environment's lambdas to functions while active."""
+        token = _bound.set(functions)
+        try:
+            yield functions
+        finally:
+            _bound.reset(token)
+
+
+_environment: Optional[RenderEnvironment] = None
+
+
+def get_render_environment() -> RenderEnvironment:
+    """Return the process-wide render environment, creating it on first use."""
+    global _environment
+    if _environment is None:
+        _environment = RenderEnvironment()
+    return _environment
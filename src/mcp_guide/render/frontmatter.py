@@ -1,6 +1,8 @@
 """Front-matter parsing utilities for YAML metadata extraction."""
 
+import copy
 import re
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -9,11 +11,9 @@ import anyio
 import yaml
 
 from mcp_guide.core.mcp_log import get_logger
-from mcp_guide.feature_flags.constants import FLAG_WORKFLOW
-from mcp_guide.feature_flags.types import to_raw_feature_value
-from mcp_guide.feature_flags.validators import normalise_flag
+from mcp_guide.render.dependencies import note_dependencies
 from mcp_guide.render.frontmatter_types import Frontmatter
-from mcp_guide.render.requires import check_requires_directive
+from mcp_guide.render.requires import compile_requirements
 from mcp_guide.result_constants import (
     AGENT_INFO,
     AGENT_INSTRUCTION,
@@ -24,7 +24,6 @@ from mcp_guide.result_constants import (
     INSTRUCTION_DISPLAY_ONLY,
     USER_INFO,
 )
-from mcp_guide.workflow.constants import DEFAULT_WORKFLOW_PHASES
 
 if TYPE_CHECKING:
     from mcp_guide.render.context import TemplateContext
@@ -37,6 +36,7 @@ __all__ = [
     "parse_content_with_frontmatter",
     "check_frontmatter_requirements",
     "process_frontmatter",
+    "render_frontmatter_fields",
     "process_file",
 ]
 
@@ -45,46 +45,22 @@ logger = get_logger(__name__)
 # Pre-compile regex for important instruction prefix
 IMPORTANT_PREFIX_PATTERN = re.compile(r"^\^\s*")
 
+# Raw text -> (frontmatter, frontmatter_length) parsed ahead of time, e.g. by the docroot bundle
+_parsed_seeds: dict[str, tuple[dict[str, Any], int]] = {}
 
-def _normalize_requires_actual_value(flag_name: str, actual_value: Any) -> Any:
-    """Normalize raw flag values before evaluating requires-* directives."""
-    if actual_value is None:
-        return None
-
-    try:
-        normalized = normalise_flag(flag_name, actual_value)
-        if normalized is None:
-            return None
-        normalized_value = to_raw_feature_value(normalized)
-    except TypeError:
-        return actual_value
 
-    if flag_name == FLAG_WORKFLOW and normalized_value is True:
-        return DEFAULT_WORKFLOW_PHASES
-    return normalized_value
-
-
-def check_frontmatter_requirements(frontmatter: Dict[str, Any], context: Dict[str, Any]) -> bool:
+def check_frontmatter_requirements(frontmatter: Dict[str, Any], context: Mapping[str, Any]) -> bool:
     """Check if frontmatter requirements are satisfied by context.
 
     Args:
         frontmatter: Parsed frontmatter dictionary
-        context: Context dictionary (e.g., project flags, workflow state)
+        context: Context dictionary (e.g., project flags, workflow state). Pass a
+            FlagState to reuse outcomes across documents checked under the same flags.
 
     Returns:
         True if requirements are satisfied, False if content should be suppressed
     """
-    for key, required_value in frontmatter.items():
-        if not key.startswith("requires-"):
-            continue
-
-        flag_name = key[9:]  # Remove "requires-" prefix
-        actual_value = _normalize_requires_actual_value(flag_name, context.get(flag_name))
-
-        if not check_requires_directive(required_value, actual_value):
-            return False
-
-    return True
+    return compile_requirements(frontmatter).evaluate(context)
 
 
 @dataclass
@@ -116,6 +92,18 @@ def parse_content_with_frontmatter(content: str) -> Content:
     Returns:
         Content object with parsed frontmatter and clean content
     """
+    seeded = _parsed_seeds.get(content)
+    if seeded is not None:
+        metadata, frontmatter_length = seeded
+        clean_content = content[frontmatter_length:]
+        # Callers may modify the frontmatter, so each one gets its own copy
+        return Content(
+            frontmatter=Frontmatter(copy.deepcopy(metadata)),
+            frontmatter_length=frontmatter_length,
+            content=clean_content,
+            content_length=len(clean_content),
+        )
+
     if not content.startswith("---\n"):
         return Content(frontmatter=Frontmatter(), frontmatter_length=0, content=content, content_length=len(content))
 
@@ -154,6 +142,22 @@ def parse_content_with_frontmatter(content: str) -> Content:
     )
 
 
+def seed_parsed_content(entries: Iterable[tuple[str, dict[str, Any], int]]) -> None:
+    """Register frontmatter parsed ahead of time so parse_content_with_frontmatter skips YAML.
+
+    Args:
+        entries: (raw text, frontmatter, frontmatter length) as returned by an earlier parse
+            of exactly that text
+    """
+    for content, frontmatter, frontmatter_length in entries:
+        _parsed_seeds[content] = (frontmatter, frontmatter_length)
+
+
+def clear_parsed_seeds() -> None:
+    """Drop all frontmatter registered with seed_parsed_content."""
+    _parsed_seeds.clear()
+
+
 async def read_content_with_frontmatter(file_path: Path) -> Content:
     """Read file and parse frontmatter.
 
@@ -280,9 +284,45 @@ def get_default_instruction_for_type(content_type: Optional[str]) -> str:
     return type_instructions.get(content_type or "", INSTRUCTION_DISPLAY_ONLY)
 
 
+async def render_frontmatter_fields(frontmatter: Frontmatter, render_context: Mapping[str, Any]) -> None:
+    """Render the instruction and description fields of frontmatter in place.
+
+    Args:
+        frontmatter: Parsed frontmatter; rendered fields replace the template text
+        render_context: Context the fields are rendered with
+    """
+    import chevron
+
+    from mcp_guide.render.context import TemplateContext
+    from mcp_guide.render.engine import render_mustache
+    from mcp_guide.render.tokens import get_root_names
+
+    fields = [
+        field
+        for field in ("instruction", "description")
+        if field in frontmatter and isinstance(frontmatter[field], str)
+    ]
+    # Fetch lazy context sections the fields refer to; syntax errors are reported below
+    names: set[str] = set()
+    for field in fields:
+        try:
+            names |= get_root_names(frontmatter[field])
+        except chevron.ChevronError:
+            continue
+    if isinstance(render_context, TemplateContext):
+        await render_context.resolve_lazy(names)
+    note_dependencies(context_keys=names)
+
+    for field in fields:
+        try:
+            frontmatter[field] = render_mustache(frontmatter[field], render_context)
+        except chevron.ChevronError as e:
+            logger.warning(f"Failed to render {field} field: {e}")
+
+
 async def process_frontmatter(
     content: str,
-    requirements_context: Optional[Dict[str, Any]],
+    requirements_context: Optional[Mapping[str, Any]],
     render_context: Optional["TemplateContext"] = None,
 ) -> Optional[ProcessedFrontmatter]:
     """Process frontmatter: parse, check requirements, render fields.
@@ -304,22 +344,15 @@ async def process_frontmatter(
     parsed = parse_content_with_frontmatter(content)
 
     # Check requirements only if context provided and not empty
-    if requirements_context is not None and not check_frontmatter_requirements(
-        parsed.frontmatter, requirements_context
-    ):
-        return None
+    if requirements_context is not None:
+        requirements = compile_requirements(parsed.frontmatter)
+        note_dependencies(flags=requirements.flags)
+        if not requirements.evaluate(requirements_context):
+            return None
 
     # Render instruction and description fields if render_context provided
     if render_context:
-        import chevron
-
-        context_dict = dict(render_context)
-        for field in ("instruction", "description"):
-            if field in parsed.frontmatter and isinstance(parsed.frontmatter[field], str):
-                try:
-                    parsed.frontmatter[field] = chevron.render(parsed.frontmatter[field], context_dict)
-                except chevron.ChevronError as e:
-                    logger.warning(f"Failed to render {field} field: {e}")
+        await render_frontmatter_fields(parsed.frontmatter, render_context)
 
     return ProcessedFrontmatter(
         frontmatter=parsed.frontmatter,
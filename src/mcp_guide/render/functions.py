@@ -9,6 +9,8 @@ from mcp_guide.core.mcp_log import get_logger
 from mcp_guide.core.prompt_decorator import get_prompt_name
 from mcp_guide.core.tool_decorator import get_tool_prefix
 from mcp_guide.feature_flags.constants import FLAG_COMMAND, FLAG_RESOURCE
+from mcp_guide.render.context import IndexedList
+from mcp_guide.render.memo import impure
 
 logger = get_logger(__name__)
 _MISSING = object()
@@ -31,10 +33,10 @@ class SyntaxHighlighter:
 class TemplateFunctions:
     """Template lambda functions with ChainMap context integration."""
 
-    def __init__(self, context: ChainMap[str, Any]) -> None:
-        """Initialize with ChainMap context."""
+    def __init__(self, context: ChainMap[str, Any], highlighter: SyntaxHighlighter | None = None) -> None:
+        """Initialize with ChainMap context and an optional shared highlighter."""
         self.context = context
-        self.highlighter = SyntaxHighlighter()
+        self.highlighter = highlighter if highlighter is not None else SyntaxHighlighter()
         self.errors: list[str] = []
 
     def _error(self, text: str, render: Callable[[str], str] | None = None) -> str:
@@ -99,7 +101,7 @@ class TemplateFunctions:
             if isinstance(value, dict):
                 value = cast(dict[str, Any], value).get(part, _MISSING)
                 continue
-            if isinstance(value, list):
+            if isinstance(value, (list, IndexedList)):
                 try:
                     value = value[int(part)]
                 except (ValueError, IndexError):
@@ -141,7 +143,7 @@ class TemplateFunctions:
             return set()
 
         phase_list = workflow.get("phase_list")
-        if isinstance(phase_list, list):
+        if isinstance(phase_list, (list, IndexedList)):
             phases: set[str] = set()
             for item in phase_list:
                 if isinstance(item, dict):
@@ -236,6 +238,7 @@ class TemplateFunctions:
 
         return render(body) if render and str(candidate) not in self._get_workflow_phases() else ""
 
+    @impure
     def time_ago(self, text: str, render: Callable[[str], str] | None = None) -> str:
         """Format timestamp as relative time: {{#time_ago}}{{exported_at}}{{/time_ago}}"""
         _, var_name = self._parse_template_args(text)
@@ -0,0 +1,197 @@
+"""Rendered-output memo keyed on the context values a render actually read.
+
+While a template renders, every top-level name read from a TemplateContext is
+recorded together with the value it resolved to (or its absence). The output is
+then stored under the template identity and a fingerprint of exactly those
+values, so a later render whose recorded names still resolve to equal values is
+answered from the memo. Values nested inside a recorded name are covered by its
+fingerprint, since sections and lambdas can only reach them through that name.
+
+Lambdas whose output depends on anything other than their arguments and the
+context (the clock, task state) are declared with @impure; reading one marks
+the render as not memoisable.
+"""
+
+import threading
+from collections import ChainMap, OrderedDict
+from collections.abc import Callable, Generator, Hashable, Mapping, Sequence, Set
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Maximum number of memoised outputs kept; least recently used are evicted
+OUTPUT_CACHE_SIZE = 512
+
+# Distinct sets of read names remembered per template (branches can read different names)
+_SHAPES_PER_TEMPLATE = 4
+
+_IMPURE_ATTR = "__template_impure__"
+_MISSING = object()
+
+# (source index, name) pairs read by one render, in first-read order
+_Shape = tuple[tuple[int, str], ...]
+
+
+def impure(func: F) -> F:
+    """Declare a template lambda impure so renders reading it bypass the output memo."""
+    setattr(func, _IMPURE_ATTR, True)
+    return func
+
+
+def is_impure(value: Any) -> bool:
+    """Return True if value is a callable declared with @impure."""
+    return bool(getattr(value, _IMPURE_ATTR, False))
+
+
+class Reads:
+    """Names read from the source contexts during one render."""
+
+    __slots__ = ("sources", "values", "memoisable", "_depth")
+
+    def __init__(self, sources: Sequence[ChainMap[str, Any]]) -> None:
+        self.sources = tuple(sources)
+        self.values: dict[tuple[int, str], Any] = {}
+        self.memoisable = True
+        self._depth = 0
+
+    def lookup(self, context: ChainMap[str, Any], key: str) -> Any:
+        """Resolve key in context, recording the outermost read. Raises KeyError if absent."""
+        if self._depth:
+            return ChainMap.__getitem__(context, key)
+        self._depth += 1
+        try:
+            value = ChainMap.__getitem__(context, key)
+        except KeyError:
+            self._note(context, key, _MISSING)
+            raise
+        finally:
+            self._depth -= 1
+        self._note(context, key, value)
+        return value
+
+    def _note(self, context: ChainMap[str, Any], key: str, value: Any) -> None:
+        for index, source in enumerate(self.sources):
+            if source is context:
+                self.values.setdefault((index, key), value)
+                break
+        else:
+            # Read from a context the memo cannot re-resolve on lookup
+            self.memoisable = False
+        if is_impure(value):
+            self.memoisable = False
+
+
+_reads: ContextVar[Optional[Reads]] = ContextVar("template_reads", default=None)
+
+
+def active_reads() -> Optional[Reads]:
+    """Return the recorder of the render in progress, if any."""
+    return _reads.get()
+
+
+@contextmanager
+def record_reads(*sources: ChainMap[str, Any]) -> Generator[Reads]:
+    """Record names read from sources (and any context chained under them) while active."""
+    reads = Reads(sources)
+    token = _reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _reads.reset(token)
+
+
+def fingerprint(value: Any) -> Hashable:
+    """Build a hashable value that compares equal only for values rendering identically."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        # The type keeps 1, 1.0 and True apart; they render differently
+        return (type(value), value)
+    if isinstance(value, Mapping):
+        return (type(value), tuple((k, fingerprint(v)) for k, v in value.items()))
+    if isinstance(value, (Sequence, Set)):
+        return (type(value), tuple(fingerprint(v) for v in value))
+    if callable(value):
+        return ("callable", getattr(value, "__qualname__", type(value).__qualname__), is_impure(value))
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    return (type(value), value)
+
+
+def _resolve(source: ChainMap[str, Any], key: str) -> Any:
+    try:
+        return source[key]
+    except KeyError:
+        return _MISSING
+
+
+_shapes: OrderedDict[Hashable, list[_Shape]] = OrderedDict()
+_outputs: OrderedDict[Hashable, Any] = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "bypassed": 0}
+_lock = threading.Lock()
+
+
+def lookup_output(identity: Hashable, sources: Sequence[ChainMap[str, Any]]) -> Optional[Any]:
+    """Return the memoised result for identity if every name it read still resolves equally.
+
+    Args:
+        identity: Template identity, including anything outside the context the output depends on
+        sources: Contexts in the same order as given to record_reads
+    """
+    with _lock:
+        shapes = list(_shapes.get(identity, ()))
+    for shape in shapes:
+        try:
+            values = tuple(fingerprint(_resolve(sources[index], key)) for index, key in shape)
+        except (RecursionError, IndexError):
+            continue
+        with _lock:
+            result = _outputs.get((identity, shape, values))
+            if result is not None:
+                _outputs.move_to_end((identity, shape, values))
+                _stats["hits"] += 1
+                return result
+    with _lock:
+        _stats["misses"] += 1
+    return None
+
+
+def store_output(identity: Hashable, reads: Reads, result: Any) -> None:
+    """Memoise result for identity under the values recorded in reads, unless the render was impure."""
+    if not reads.memoisable:
+        with _lock:
+            _stats["bypassed"] += 1
+        return
+    shape: _Shape = tuple(reads.values)
+    try:
+        values = tuple(fingerprint(value) for value in reads.values.values())
+    except RecursionError:
+        return
+    with _lock:
+        shapes = _shapes.setdefault(identity, [])
+        _shapes.move_to_end(identity)
+        if shape not in shapes:
+            shapes.append(shape)
+            del shapes[:-_SHAPES_PER_TEMPLATE]
+        if len(_shapes) > OUTPUT_CACHE_SIZE:
+            _shapes.popitem(last=False)
+        _outputs[(identity, shape, values)] = result
+        _outputs.move_to_end((identity, shape, values))
+        if len(_outputs) > OUTPUT_CACHE_SIZE:
+            _outputs.popitem(last=False)
+
+
+def get_output_cache_stats() -> dict[str, Any]:
+    """Return hit/miss/bypass counters and current size of the output memo."""
+    with _lock:
+        return {**_stats, "entries": len(_outputs), "max_entries": OUTPUT_CACHE_SIZE}
+
+
+def clear_output_cache() -> None:
+    """Drop all memoised outputs."""
+    with _lock:
+        _shapes.clear()
+        _outputs.clear()
+        _stats.update(hits=0, misses=0, bypassed=0)
@@ -0,0 +1,174 @@
+"""Off-loop execution of large template renders.
+
+Mustache rendering is synchronous, so a large template holds the event loop for
+its whole render and stalls every other session's tool call and the task
+manager's timers. Renders whose template and partials exceed a size or
+token-count threshold run on a small worker thread pool instead; smaller renders
+stay inline, where the thread hop would cost more than the render itself.
+
+Workers are threads rather than processes: render contexts hold template
+lambdas, lazy providers and session state that cannot be pickled, and a render
+records the context values it reads into the caller's output-memo recorder
+through a ContextVar, which is copied into the worker. Lazy context values a
+template references are resolved before rendering, so workers never await.
+Tokenising is serialised by the token cache; chevron's remaining tokenizer
+globals only feed line numbers into syntax error messages.
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+from collections.abc import Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from chevron import ChevronError
+
+from mcp_guide.config_constants import MAX_RENDER_WORKERS
+from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.render.engine import render_mustache
+from mcp_guide.render.tokens import get_tokens
+
+logger = get_logger(__name__)
+
+# Environment variables overriding the offload thresholds at startup (0 disables a threshold)
+OFFLOAD_CHARS_ENV_VAR = "MCP_GUIDE_RENDER_OFFLOAD_CHARS"
+OFFLOAD_TOKENS_ENV_VAR = "MCP_GUIDE_RENDER_OFFLOAD_TOKENS"
+
+# Template plus partial text length at which a render is offloaded
+DEFAULT_OFFLOAD_CHARS = 32 * 1024
+
+# Template plus partial token count at which a render is offloaded
+DEFAULT_OFFLOAD_TOKENS = 2000
+
+
+def _threshold_from_env(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        threshold = int(value)
+    except ValueError:
+        threshold = -1
+    if threshold < 0:
+        logger.warning(f"Invalid render offload threshold {value!r} in {name}, using {default}")
+        return default
+    return threshold
+
+
+_chars_threshold = _threshold_from_env(OFFLOAD_CHARS_ENV_VAR, DEFAULT_OFFLOAD_CHARS)
+_tokens_threshold = _threshold_from_env(OFFLOAD_TOKENS_ENV_VAR, DEFAULT_OFFLOAD_TOKENS)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_stats = {"offloaded": 0, "inline": 0}
+_lock = threading.Lock()
+
+
+def get_render_offload_thresholds() -> tuple[int, int]:
+    """Return the (characters, tokens) thresholds for offloading a render (0 = disabled)."""
+    return _chars_threshold, _tokens_threshold
+
+
+def set_render_offload_thresholds(chars: int, tokens: int) -> None:
+    """Set the thresholds for offloading a render; 0 disables a threshold.
+
+    Renders reaching either enabled threshold are offloaded; with both disabled
+    every render runs inline.
+
+    Raises:
+        ValueError: If a threshold is negative
+    """
+    global _chars_threshold, _tokens_threshold
+    if chars < 0 or tokens < 0:
+        raise ValueError(f"Render offload thresholds must not be negative, got chars={chars}, tokens={tokens}")
+    _chars_threshold, _tokens_threshold = chars, tokens
+
+
+def should_offload(content: str, partials: Mapping[str, str], key: Optional[Hashable] = None) -> bool:
+    """Return True if rendering content with partials reaches an offload threshold.
+
+    Args:
+        content: Template text
+        partials: Partial name to partial template text
+        key: Optional template identity for the token cache
+    """
+    if _chars_threshold and len(content) + sum(len(text) for text in partials.values()) >= _chars_threshold:
+        return True
+    if not _tokens_threshold:
+        return False
+    # Tokens are cached, so counting them costs nothing once the template has been seen
+    count = len(get_tokens(content, key))
+    for text in partials.values():
+        if count >= _tokens_threshold:
+            break
+        try:
+            count += len(get_tokens(text))
+        except ChevronError:
+            # Reported when (and if) the partial is rendered
+            continue
+    return count >= _tokens_threshold
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_RENDER_WORKERS, thread_name_prefix="template-render")
+        return _executor
+
+
+async def render_mustache_offloaded(
+    content: str,
+    data: Any,
+    partials: Optional[Mapping[str, str]] = None,
+    key: Optional[Hashable] = None,
+) -> str:
+    """Render like render_mustache, on a worker thread when the template is large.
+
+    Args:
+        content: Template text
+        data: Root context
+        partials: Partial name to partial template text
+        key: Optional template identity for the token cache
+
+    Raises:
+        ChevronError: If the template or a rendered partial has invalid syntax
+    """
+    partials = partials if partials is not None else {}
+    if not should_offload(content, partials, key):
+        with _lock:
+            _stats["inline"] += 1
+        return render_mustache(content, data, partials, key)
+
+    with _lock:
+        _stats["offloaded"] += 1
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), context.run, render_mustache, content, data, partials, key)
+
+
+def get_render_offload_stats() -> dict[str, Any]:
+    """Return offloaded/inline render counters and the current thresholds."""
+    with _lock:
+        return {
+            **_stats,
+            "chars_threshold": _chars_threshold,
+            "tokens_threshold": _tokens_threshold,
+            "max_workers": MAX_RENDER_WORKERS,
+        }
+
+
+def clear_render_offload_stats() -> None:
+    """Reset the offloaded/inline render counters."""
+    with _lock:
+        _stats.update(offloaded=0, inline=0)
+
+
+def shutdown_render_executor() -> None:
+    """Stop the worker threads; the pool is recreated by the next offloaded render."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,17 +1,147 @@
-"""Template partial utilities for path resolution and content loading."""
+"""Template partial utilities for path resolution and content loading.
 
+Partials are included many times per request, so resolved paths and parsed
+files are kept in a process-wide cache. Entries are invalidated by the docroot
+watcher: under a watched docroot they stay valid until its generation moves on,
+elsewhere each use re-checks the file's stat signature instead.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from anyio import Path as AsyncPath
 
 from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.discovery.bundle import read_docroot_text
+from mcp_guide.render.dependencies import note_dependencies
+from mcp_guide.render.requires import compile_requirements
+from mcp_guide.watchers.docroot_watcher import get_docroot_generation, is_watched
 
 if TYPE_CHECKING:
-    from mcp_guide.render.frontmatter import Frontmatter
+    from mcp_guide.render.frontmatter import Content, Frontmatter
 
 logger = get_logger(__name__)
 
+# Maximum number of parsed partial files kept; least recently used are evicted
+PARTIAL_CACHE_SIZE = 256
+
+# Distinct flag value combinations whose requires-* outcome is kept per partial
+_REQUIREMENT_RESULTS_PER_PARTIAL = 16
+
+# (mtime_ns, size, inode) of a partial file
+_Signature = tuple[int, int, int]
+
+
+class _PartialEntry:
+    """A parsed partial file plus its requires-* outcomes by flag values."""
+
+    __slots__ = ("parsed", "signature", "generation", "requires", "flags", "requirements")
+
+    def __init__(self, parsed: "Content", signature: _Signature, generation: int) -> None:
+        self.parsed = parsed
+        self.signature = signature
+        self.generation = generation
+        self.requires = compile_requirements(parsed.frontmatter)
+        self.flags = self.requires.flags
+        self.requirements: dict[Hashable, bool] = {}
+
+    def requirements_met(self, context: Mapping[str, Any]) -> bool:
+        """Check the partial's requires-* directives, reusing the outcome for equal flag values."""
+        if not self.flags:
+            return True
+
+        from mcp_guide.render.memo import fingerprint
+
+        key = fingerprint(tuple(context.get(flag) for flag in self.flags))
+        met = self.requirements.get(key)
+        if met is None:
+            met = self.requires.evaluate(context)
+            if len(self.requirements) >= _REQUIREMENT_RESULTS_PER_PARTIAL:
+                self.requirements.clear()
+            self.requirements[key] = met
+        return met
+
+
+_entries: OrderedDict[str, _PartialEntry] = OrderedDict()
+# Unresolved partial path -> (docroot generation, resolved path or None)
+_resolved: dict[str, tuple[int, Optional[Path]]] = {}
+_stats = {"hits": 0, "misses": 0}
+_lock = threading.Lock()
+
+
+async def _resolve_partial_path(base: Path) -> Optional[Path]:
+    """Resolve a partial's extension, reusing the answer while its docroot is unchanged."""
+    from mcp_guide.discovery.files import resolve_file_with_extensions
+
+    key = str(base)
+    watched = is_watched(key)
+    generation = get_docroot_generation()
+    if watched:
+        with _lock:
+            cached = _resolved.get(key)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+    found = await resolve_file_with_extensions(base)
+    if watched:
+        with _lock:
+            if len(_resolved) >= PARTIAL_CACHE_SIZE:
+                _resolved.clear()
+            _resolved[key] = (generation, found)
+    return found
+
+
+async def _get_partial_entry(path: Path) -> _PartialEntry:
+    """Return the parsed partial at path, reading it only when not cached or stale."""
+    from mcp_guide.render.frontmatter import parse_content_with_frontmatter
+
+    key = str(path)
+    generation = get_docroot_generation()
+    with _lock:
+        entry = _entries.get(key)
+    if entry is not None and entry.generation == generation and is_watched(key):
+        with _lock:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+        return entry
+
+    async_path = AsyncPath(path)
+    stat = await async_path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    if entry is not None and entry.signature == signature:
+        entry.generation = generation
+        with _lock:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+        return entry
+
+    content = await read_docroot_text(path)
+    entry = _PartialEntry(parse_content_with_frontmatter(content), signature, generation)
+    with _lock:
+        _stats["misses"] += 1
+        _entries[key] = entry
+        _entries.move_to_end(key)
+        if len(_entries) > PARTIAL_CACHE_SIZE:
+            _entries.popitem(last=False)
+    return entry
+
+
+def get_partial_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters and current size of the partial cache."""
+    with _lock:
+        return {**_stats, "entries": len(_entries), "max_entries": PARTIAL_CACHE_SIZE}
+
+
+def clear_partial_cache() -> None:
+    """Drop all cached partials and path resolutions."""
+    with _lock:
+        _entries.clear()
+        _resolved.clear()
+        _stats.update(hits=0, misses=0)
+
 
 class PartialNotFoundError(Exception):
     """Raised when a partial template file cannot be found."""
@@ -20,7 +150,7 @@ class PartialNotFoundError(Exception):
 
 
 async def load_partial_content(
-    partial_path: Path, base_path: Path, context: dict[str, Any] | None = None
+    partial_path: Path, base_path: Path, context: Mapping[str, Any] | None = None
 ) -> tuple[str, "Frontmatter"]:
     """Load content from a partial template file with frontmatter processing.
 
@@ -51,40 +181,38 @@ async def load_partial_content(
 
     logger.trace(f"Base partial path: {resolved_base}")
 
-    # Use common extension resolution function
-    from mcp_guide.discovery.files import resolve_file_with_extensions
-
-    found_path = await resolve_file_with_extensions(Path(resolved_base))
+    found_path = await _resolve_partial_path(Path(resolved_base))
 
     if found_path is None:
         logger.trace(f"Partial file does not exist: {resolved_base} (tried all extension patterns)")
+        # Creating the partial later changes the output
+        note_dependencies(directories=(str(Path(resolved_base).parent),))
         raise PartialNotFoundError(f"Partial template not found: {resolved_base}")
 
-    final_path = AsyncPath(found_path)
-    logger.trace(f"Resolved final partial path: {final_path}")
+    logger.trace(f"Resolved final partial path: {found_path}")
 
     try:
-        content = await final_path.read_text(encoding="utf-8")
-
-        # Process frontmatter: parse, check requirements, render instruction/description
-        from mcp_guide.render.context import TemplateContext
-        from mcp_guide.render.frontmatter import process_frontmatter
+        entry = await _get_partial_entry(found_path)
+    except Exception as e:
+        logger.trace(f"Failed to read partial content from {found_path}: {e}")
+        raise
+    note_dependencies(partials=(str(found_path),), flags=entry.flags)
 
-        render_context = TemplateContext(context) if context else None
-        processed = await process_frontmatter(content, context, render_context)
+    from mcp_guide.render.context import TemplateContext
+    from mcp_guide.render.frontmatter import Frontmatter, render_frontmatter_fields
 
-        if processed is None:
-            # Requirements not met - return empty content with empty frontmatter
-            logger.debug(f"Partial {partial_path} skipped due to unmet frontmatter requirements")
-            from mcp_guide.render.frontmatter import parse_content_with_frontmatter
+    # Callers own the returned frontmatter; the cached copy stays unrendered
+    frontmatter = Frontmatter(entry.parsed.frontmatter)
 
-            parsed = parse_content_with_frontmatter(content)
-            return ("", parsed.frontmatter)
+    if context is not None and not entry.requirements_met(context):
+        # Requirements not met - return empty content with the unrendered frontmatter
+        logger.debug(f"Partial {partial_path} skipped due to unmet frontmatter requirements")
+        return ("", frontmatter)
 
-        logger.trace(f"Successfully loaded partial content ({len(processed.content)} chars): {final_path}")
-        # Return content and frontmatter
-        return (processed.content, processed.frontmatter)
+    # Render instruction/description with the same context
+    if context:
+        render_context = context if isinstance(context, TemplateContext) else TemplateContext(context)
+        await render_frontmatter_fields(frontmatter, render_context)
 
-    except Exception as e:
-        logger.trace(f"Failed to read partial content from {final_path}: {e}")
-        raise
+    logger.trace(f"Successfully loaded partial content ({len(entry.parsed.content)} chars): {found_path}")
+    return (entry.parsed.content, frontmatter)
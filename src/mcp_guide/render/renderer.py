@@ -1,18 +1,23 @@
 """Template rendering utilities for Mustache templates."""
 
+from collections.abc import Hashable
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, TypeVar
 
-import chevron
 from chevron import ChevronError
 
 from mcp_guide.core.mcp_log import get_logger
 from mcp_guide.core.prompt_decorator import get_prompt_name
+from mcp_guide.core.tool_decorator import get_tool_prefix
 from mcp_guide.discovery.files import TEMPLATE_EXTENSIONS, FileInfo
 from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.dependencies import note_dependencies
+from mcp_guide.render.environment import get_render_environment
 from mcp_guide.render.frontmatter import get_frontmatter_includes
-from mcp_guide.render.functions import TemplateFunctions
+from mcp_guide.render.memo import lookup_output, record_reads, store_output
+from mcp_guide.render.offload import render_mustache_offloaded
 from mcp_guide.render.partials import PartialNotFoundError, load_partial_content
+from mcp_guide.render.tokens import get_root_names
 from mcp_guide.result import Result
 from mcp_guide.result_constants import ERROR_TEMPLATE, INSTRUCTION_VALIDATION_ERROR
 
@@ -22,7 +27,7 @@ _VT = TypeVar("_VT")
 
 
 class _TrackingDict(Dict[str, _VT]):
-    """Dict subclass that records which keys were accessed (for chevron partial tracking)."""
+    """Dict subclass that records which keys were accessed (for partial tracking)."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -55,23 +60,16 @@ def is_template_file(file_info: FileInfo) -> bool:
     return str(file_info.path).endswith(TEMPLATE_EXTENSIONS)
 
 
-def _safe_lambda(func: Callable[..., str]) -> Callable[..., str]:
-    """Wrap lambda function to handle errors gracefully.
-
-    Logs the full exception and returns a concise, user-safe error string that
-    includes the exception type to aid debugging.
-    """
-
-    def wrapper(*args: Any, **kwargs: Any) -> str:
+def _referenced_names(content: str, template_key: Optional[Hashable], partials: Dict[str, str]) -> set[str]:
+    """Return the context names a template and its partials may look up."""
+    names = set(get_root_names(content, template_key))
+    for partial_content in partials.values():
         try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            # Log full traceback for diagnostics
-            logger.exception("Error while evaluating template lambda", exc_info=True)
-            # Return a user-friendly error string with exception type preserved
-            return f"[Template Error ({type(e).__name__}): {e}]"
-
-    return wrapper
+            names |= get_root_names(partial_content)
+        except ChevronError:
+            # Reported when (and if) the partial is rendered
+            continue
+    return names
 
 
 async def render_template_content(
@@ -82,6 +80,7 @@ async def render_template_content(
     partials: Optional[Dict[str, str]] = None,
     metadata: Optional[Dict[str, Any]] = None,
     base_dir: Optional[Path] = None,
+    template_key: Optional[Hashable] = None,
 ) -> Result[tuple[str, list[Dict[str, Any]], list[str]]]:
     """Render template content with context.
 
@@ -92,6 +91,8 @@ async def render_template_content(
         transient_fn: Optional function to add transient data to context
         partials: Optional dictionary of partial templates
         metadata: Optional frontmatter metadata to merge into context
+        template_key: Optional identity of the template file for the token cache
+            (see render.tokens.file_key); content is used as the key otherwise
 
     Returns:
         Result with tuple of (rendered content, list of partial frontmatter)
@@ -126,18 +127,16 @@ async def render_template_content(
 
                         # Load partial content using base directory
                         try:
-                            # Build context for frontmatter requirements checking
-                            context_dict = dict(render_context) if render_context else {}
-
+                            # The render context is used as-is for frontmatter requirements checking
                             if base_dir:
                                 partial_content, partial_frontmatter = await load_partial_content(
-                                    full_include_path, base_dir, context_dict
+                                    full_include_path, base_dir, render_context
                                 )
                             else:
                                 # Fallback to file path parent if no base_dir provided
                                 file_parent = Path(file_path).parent if file_path != "<template>" else Path.cwd()
                                 partial_content, partial_frontmatter = await load_partial_content(
-                                    full_include_path, file_parent, context_dict
+                                    full_include_path, file_parent, render_context
                                 )
 
                             processed_partials[partial_name] = partial_content
@@ -158,57 +157,66 @@ async def render_template_content(
         # Apply transient function if provided
         final_context = transient_fn(render_context) if transient_fn else render_context
 
-        # Create template functions and inject into context with error handling
-        functions = TemplateFunctions(final_context)
+        # Bind this render's functions handle to the shared lambda table
+        environment = get_render_environment()
+        functions = environment.functions(final_context)
         workflow_context = final_context.get("workflow")
         workflow_vars = {}
         if isinstance(workflow_context, dict):
-            workflow_vars = {
-                "workflow": {
-                    **workflow_context,
-                    "contains": _safe_lambda(functions.workflow_contains),
-                    "notcontains": _safe_lambda(functions.workflow_notcontains),
-                }
-            }
+            workflow_vars = {"workflow": {**workflow_context, **environment.workflow_lambdas}}
         stem = Path(file_path).stem if file_path else "template"
-        template_context = final_context.new_child(
+        template_context = environment.template_context(
+            final_context,
             {
                 "template_name": stem.lstrip("_"),
                 "prompt": get_prompt_name(),
-                "_error": functions._error,
-                "format_date": _safe_lambda(functions.format_date),
-                "truncate": _safe_lambda(functions.truncate),
-                "highlight_code": _safe_lambda(functions.highlight_code),
-                "pad_right": _safe_lambda(functions.pad_right),
-                "contains": _safe_lambda(functions.contains),
-                "equals": _safe_lambda(functions.equals),
-                "notequals": _safe_lambda(functions.notequals),
-                "time_ago": _safe_lambda(functions.time_ago),
-                "resource": _safe_lambda(functions.resource),
-                "command": _safe_lambda(functions.command),
-                "command-args": _safe_lambda(functions.command_args),
-                "command-flags": _safe_lambda(functions.command_flags),
-                "command-alias": _safe_lambda(functions.command_alias),
                 **workflow_vars,
-            }
+            },
         )
 
-        # Use a tracking dict so we know which partials chevron actually renders
-        tracking_partials: _TrackingDict[str] = _TrackingDict(processed_partials)
-
-        # Render template with Chevron (TemplateContext works as ChainMap)
-        logger.trace(f"Rendering template {file_path} with partials: {list(processed_partials.keys())}")
-        rendered = chevron.render(content, template_context, partials_dict=tracking_partials)
-        logger.trace(f"Template {file_path} rendered content ({len(rendered)} chars): {rendered[:1024]}")
+        # Lazy context sections with async providers are fetched only when referenced.
+        # Plain ChainMap contexts have neither lazy values nor read tracking.
+        tracked = isinstance(final_context, TemplateContext)
+        if tracked:
+            await final_context.resolve_lazy(_referenced_names(content, template_key, processed_partials))
+
+        # Output depends on the template, its partials, the context values it reads and
+        # the tool/prompt naming used by command and resource lambdas
+        memo_identity = (
+            template_key if template_key is not None else ("text", content),
+            tuple(processed_partials.items()),
+            get_tool_prefix(),
+            get_prompt_name(),
+        )
+        memo_sources = (template_context, final_context)
+        memoised = lookup_output(memo_identity, memo_sources) if tracked else None
+        if memoised is not None:
+            rendered, accessed_partials, errors, read_names = memoised
+            logger.trace(f"Template {file_path} served from output memo ({len(rendered)} chars)")
+        else:
+            # Use a tracking dict so we know which partials are actually rendered
+            tracking_partials: _TrackingDict[str] = _TrackingDict(processed_partials)
+
+            # Render with the active Mustache engine (TemplateContext works as ChainMap);
+            # large templates render on a worker thread to keep the event loop free
+            logger.trace(f"Rendering template {file_path} with partials: {list(processed_partials.keys())}")
+            with record_reads(*memo_sources) as reads, environment.bind(functions):
+                rendered = await render_mustache_offloaded(content, template_context, tracking_partials, template_key)
+            logger.trace(f"Template {file_path} rendered content ({len(rendered)} chars): {rendered[:1024]}")
+
+            accessed_partials = tuple(tracking_partials.accessed)
+            errors = tuple(functions.errors)
+            read_names = frozenset(name for _, name in reads.values)
+            if tracked:
+                store_output(memo_identity, reads, (rendered, accessed_partials, errors, read_names))
+        note_dependencies(context_keys=read_names)
 
         # Only collect frontmatter from partials that were actually rendered
         partial_frontmatter_list = [
-            partial_frontmatter_by_name[name]
-            for name in tracking_partials.accessed
-            if name in partial_frontmatter_by_name
+            partial_frontmatter_by_name[name] for name in accessed_partials if name in partial_frontmatter_by_name
         ]
 
-        return Result.ok((rendered, partial_frontmatter_list, functions.errors))
+        return Result.ok((rendered, partial_frontmatter_list, list(errors)))
 
     except ChevronError as e:
         # Enhanced Chevron-specific error handling with line context
@@ -1,8 +1,36 @@
-"""Shared utilities for requires-* directive checking."""
+"""Shared utilities for requires-* directive checking.
 
-from typing import Any
+A frontmatter's requires-* directives are compiled once into a RequirementSet
+of per-flag predicates, shared by every frontmatter declaring the same
+directives. Evaluated against a FlagState, the outcome is also remembered per
+flag-state generation: equal flag states share a generation, so re-checking a
+document under unchanged flags is a single integer comparison.
+"""
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any, Optional
+
+from mcp_guide.feature_flags.constants import FLAG_WORKFLOW
 from mcp_guide.feature_flags.types import FeatureValue, to_raw_feature_value
+from mcp_guide.feature_flags.validators import normalise_flag
+from mcp_guide.render.context import IndexedList
+from mcp_guide.render.memo import fingerprint
+from mcp_guide.workflow.constants import DEFAULT_WORKFLOW_PHASES
+
+REQUIRES_PREFIX = "requires-"
+
+# Maximum number of compiled requirement sets kept; least recently used are evicted
+REQUIREMENT_CACHE_SIZE = 1024
+
+# Maximum number of distinct flag states given a shared generation
+FLAG_STATE_CACHE_SIZE = 64
+
+# Outcomes remembered per requirement set, by flag-state generation
+_RESULTS_PER_REQUIREMENT_SET = 8
+
+_Predicate = Callable[[Any], bool]
 
 
 def check_requires_directive(required_value: Any, actual_value: Any) -> bool:
@@ -32,26 +60,191 @@ def check_requires_directive(required_value: Any, actual_value: Any) -> bool:
         >>> check_requires_directive(["implementation"], {"implementation": ["entry"]})
         True
     """
-    if isinstance(actual_value, FeatureValue):
-        actual_value = to_raw_feature_value(actual_value)
+    return _compile_directive(required_value)(actual_value)
 
-    # Boolean mode: check truthy/falsy
+
+def _compile_directive(required_value: Any) -> _Predicate:
+    """Build the predicate check_requires_directive applies for required_value."""
     if isinstance(required_value, bool):
-        return bool(actual_value) == required_value
+        return lambda actual: bool(_raw(actual)) == required_value
 
-    # List membership mode: ANY match (OR logic)
     if isinstance(required_value, list):
-        # Scalar actual_value: check if it's in the required list
-        if not isinstance(actual_value, (list, dict)):
-            return actual_value in required_value
+        required = tuple(required_value)
+
+        def any_of(actual: Any) -> bool:
+            actual = _raw(actual)
+            # List actual_value: check if ANY required item is in actual list
+            if isinstance(actual, (list, IndexedList)):
+                return any(item in actual for item in required)
+            # Dict actual_value: check if ANY required key exists in dict
+            if isinstance(actual, dict):
+                return any(key in actual for key in required)
+            # Scalar actual_value: check if it's in the required list
+            return actual in required
+
+        return any_of
+
+    return lambda actual: bool(_raw(actual) == required_value)
+
+
+def _raw(actual_value: Any) -> Any:
+    return to_raw_feature_value(actual_value) if isinstance(actual_value, FeatureValue) else actual_value
+
+
+def normalize_requires_value(flag_name: str, actual_value: Any) -> Any:
+    """Normalize a raw flag value before evaluating requires-* directives."""
+    if actual_value is None:
+        return None
+
+    try:
+        normalized = normalise_flag(flag_name, actual_value)
+        if normalized is None:
+            return None
+        normalized_value = to_raw_feature_value(normalized)
+    except TypeError:
+        return actual_value
+
+    if flag_name == FLAG_WORKFLOW and normalized_value is True:
+        return DEFAULT_WORKFLOW_PHASES
+    return normalized_value
+
+
+_lock = threading.Lock()
+_generations: OrderedDict[Hashable, int] = OrderedDict()
+_next_generation = 0
+
+
+def _flag_state_generation(values: Mapping[str, Any]) -> int:
+    """Return the generation shared by every flag state with values equal to values."""
+    global _next_generation
+    try:
+        # Flag order depends on how the state was assembled, not on its values
+        key: Optional[Hashable] = fingerprint(dict(sorted(values.items())))
+    except RecursionError:
+        key = None
+    with _lock:
+        if key is not None:
+            generation = _generations.get(key)
+            if generation is not None:
+                _generations.move_to_end(key)
+                return generation
+        _next_generation += 1
+        generation = _next_generation
+        if key is not None:
+            _generations[key] = generation
+            if len(_generations) > FLAG_STATE_CACHE_SIZE:
+                _generations.popitem(last=False)
+    return generation
+
+
+class FlagState(dict[str, Any]):
+    """Flag values for requires-* checks, tagged with a flag-state generation.
+
+    Build one per batch of documents checked under the same flags and treat it
+    as read-only: the generation describes the values it was created with.
+    Normalized values are computed once per flag.
+    """
+
+    __slots__ = ("generation", "_normalized")
+
+    def __init__(self, values: Mapping[str, Any]) -> None:
+        super().__init__(values)
+        self.generation = _flag_state_generation(self)
+        self._normalized: dict[str, Any] = {}
+
+    def normalized(self, flag_name: str) -> Any:
+        """Return the flag's value as requires-* directives compare it."""
+        try:
+            return self._normalized[flag_name]
+        except KeyError:
+            value = self._normalized[flag_name] = normalize_requires_value(flag_name, self.get(flag_name))
+            return value
+
+
+class RequirementSet:
+    """The requires-* directives of a frontmatter, compiled into per-flag predicates."""
+
+    __slots__ = ("requirements", "_results")
+
+    def __init__(self, requirements: tuple[tuple[str, _Predicate], ...]) -> None:
+        self.requirements = requirements
+        # Flag-state generation -> outcome
+        self._results: dict[int, bool] = {}
+
+    @property
+    def flags(self) -> tuple[str, ...]:
+        """Names of the flags the directives check."""
+        return tuple(flag for flag, _ in self.requirements)
+
+    def evaluate(self, context: Mapping[str, Any]) -> bool:
+        """Return True if every directive is satisfied by context.
+
+        The outcome for a FlagState is remembered by its generation; other
+        mappings are checked directly.
+        """
+        if not self.requirements:
+            return True
+        if not isinstance(context, FlagState):
+            return all(
+                predicate(normalize_requires_value(flag, context.get(flag))) for flag, predicate in self.requirements
+            )
+
+        met = self._results.get(context.generation)
+        if met is None:
+            met = all(predicate(context.normalized(flag)) for flag, predicate in self.requirements)
+            if len(self._results) >= _RESULTS_PER_REQUIREMENT_SET:
+                self._results.clear()
+            self._results[context.generation] = met
+        return met
+
+
+_NO_REQUIREMENTS = RequirementSet(())
+_compiled: OrderedDict[Hashable, RequirementSet] = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+def compile_requirements(frontmatter: Mapping[str, Any]) -> RequirementSet:
+    """Return the compiled requires-* directives of frontmatter.
+
+    Frontmatters declaring equal directives share one RequirementSet.
+    """
+    directives = tuple((key, value) for key, value in frontmatter.items() if key.startswith(REQUIRES_PREFIX))
+    if not directives:
+        return _NO_REQUIREMENTS
+    try:
+        key: Optional[Hashable] = tuple((name, fingerprint(value)) for name, value in directives)
+    except RecursionError:
+        key = None
+
+    if key is not None:
+        with _lock:
+            compiled = _compiled.get(key)
+            if compiled is not None:
+                _compiled.move_to_end(key)
+                _stats["hits"] += 1
+                return compiled
+            _stats["misses"] += 1
+
+    compiled = RequirementSet(
+        tuple((name[len(REQUIRES_PREFIX) :], _compile_directive(value)) for name, value in directives)
+    )
+    if key is not None:
+        with _lock:
+            _compiled[key] = compiled
+            if len(_compiled) > REQUIREMENT_CACHE_SIZE:
+                _compiled.popitem(last=False)
+    return compiled
+
 
-        # List actual_value: check if ANY required item is in actual list
-        if isinstance(actual_value, list):
-            return any(item in actual_value for item in required_value)
+def get_requirement_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters and current size of the compiled requirement cache."""
+    with _lock:
+        return {**_stats, "entries": len(_compiled), "max_entries": REQUIREMENT_CACHE_SIZE}
 
-        # Dict actual_value: check if ANY required key exists in dict
-        if isinstance(actual_value, dict):
-            return any(key in actual_value for key in required_value)
 
-    # Exact match mode: fallback for other types
-    return bool(actual_value == required_value)
+def clear_requirement_cache() -> None:
+    """Drop all compiled requirement sets and flag-state generations."""
+    with _lock:
+        _compiled.clear()
+        _generations.clear()
+        _stats.update(hits=0, misses=0)
@@ -8,7 +8,9 @@ from mcp_guide.discovery.files import FileInfo
 from mcp_guide.render.cache import get_template_contexts
 from mcp_guide.render.content import FM_INCLUDES, FM_REQUIRES_PREFIX, RenderedContent
 from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.dependencies import collect_dependencies, note_dependencies
 from mcp_guide.render.renderer import is_template_file, render_template_content
+from mcp_guide.render.tokens import file_key
 
 logger = get_logger(__name__)
 
@@ -46,41 +48,50 @@ async def render_template(
     if context:
         final_context = final_context.new_child(context)
 
-    # Process frontmatter: parse, check requirements, render instruction/description
-    from mcp_guide.render.frontmatter import process_frontmatter
-
-    processed = await process_frontmatter(content, project_flags, final_context)
-    if processed is None:
-        logger.debug(f"Template {file_info.path} filtered by requirements")
-        return None
-
-    # Extract frontmatter vars (exclude requires-* and includes) and add to context
-    frontmatter_vars = {
-        k: v for k, v in processed.frontmatter.items() if not k.startswith(FM_REQUIRES_PREFIX) and k != FM_INCLUDES
-    }
-
-    # Add frontmatter vars to context for template body rendering
-    # Context chain: base → caller → frontmatter_vars
-    if frontmatter_vars:
-        final_context = final_context.new_child(frontmatter_vars)
-    # Render template or return as-is
-    if is_template_file(file_info):
-        result = await render_template_content(
-            content=processed.content,
-            context=final_context,
-            file_path=str(file_info.path),
-            metadata=dict(processed.frontmatter),
-            base_dir=base_dir,
-            partials=pre_partials,
-        )
-        if not result.success:
-            raise RuntimeError(f"Template rendering failed: {result.error}")
-        assert result.value is not None, "Result value should not be None when success is True"
-        rendered_content, partial_frontmatter_list, template_errors = result.value
-    else:
-        rendered_content = processed.content
-        partial_frontmatter_list = []
-        template_errors = []
+    with collect_dependencies() as dependencies:
+        if file_info.source == "file":
+            note_dependencies(files=(str(file_info.path),))
+
+        # Process frontmatter: parse, check requirements, render instruction/description
+        from mcp_guide.render.frontmatter import process_frontmatter
+
+        processed = await process_frontmatter(content, project_flags, final_context)
+        if processed is None:
+            logger.debug(f"Template {file_info.path} filtered by requirements")
+            return None
+
+        # Extract frontmatter vars (exclude requires-* and includes) and add to context
+        frontmatter_vars = {
+            k: v for k, v in processed.frontmatter.items() if not k.startswith(FM_REQUIRES_PREFIX) and k != FM_INCLUDES
+        }
+
+        # Add frontmatter vars to context for template body rendering
+        # Context chain: base → caller → frontmatter_vars
+        if frontmatter_vars:
+            final_context = final_context.new_child(frontmatter_vars)
+        # Render template or return as-is
+        if is_template_file(file_info):
+            # Resolved filesystem templates are keyed by file version; others by their text
+            template_key = None
+            if file_info.source == "file" and file_info.path.is_absolute():
+                template_key = file_key(file_info.path, file_info.mtime, file_info.size, processed.content)
+            result = await render_template_content(
+                content=processed.content,
+                context=final_context,
+                file_path=str(file_info.path),
+                metadata=dict(processed.frontmatter),
+                base_dir=base_dir,
+                partials=pre_partials,
+                template_key=template_key,
+            )
+            if not result.success:
+                raise RuntimeError(f"Template rendering failed: {result.error}")
+            assert result.value is not None, "Result value should not be None when success is True"
+            rendered_content, partial_frontmatter_list, template_errors = result.value
+        else:
+            rendered_content = processed.content
+            partial_frontmatter_list = []
+            template_errors = []
 
     return RenderedContent(
         frontmatter=processed.frontmatter,
@@ -91,4 +102,5 @@ async def render_template(
         template_name=file_info.path.name,
         partial_frontmatter=partial_frontmatter_list,
         errors=template_errors,
+        dependencies=dependencies.record(),
     )
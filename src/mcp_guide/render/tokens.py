@@ -0,0 +1,167 @@
+"""Tokenised template cache so chevron only tokenises each template once."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+from chevron.tokenizer import tokenize
+
+Token = tuple[str, str]
+Tokens = tuple[Token, ...]
+
+T = TypeVar("T")
+
+# Maximum number of tokenised templates kept; least recently used are evicted
+TOKEN_CACHE_SIZE = 1024
+
+# Tags whose name is looked up in the context
+_LOOKUP_TAGS = ("variable", "no escape", "section", "inverted section")
+
+
+class _Entry:
+    """Cached tokens plus an optional compiled form built from them."""
+
+    __slots__ = ("tokens", "compiled", "names")
+
+    def __init__(self, tokens: Tokens) -> None:
+        self.tokens = tokens
+        self.compiled: Any = None
+        self.names: Optional[frozenset[str]] = None
+
+
+_cache: OrderedDict[Hashable, _Entry] = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "seeded": 0}
+
+# Template text -> tokens produced ahead of time, e.g. by the docroot bundle
+_seeds: dict[str, Tokens] = {}
+
+# chevron's tokenizer keeps delimiter and line state in module globals
+_lock = threading.Lock()
+
+
+def file_key(path: Path, mtime: datetime, size: int, content: str) -> Hashable:
+    """Build a cache key identifying a template file version.
+
+    The content length is included so a file rewritten between discovery (which
+    supplied mtime and size) and reading cannot reuse tokens of the old text.
+    """
+    return ("file", str(path), int(mtime.timestamp() * 1_000_000_000), size, len(content))
+
+
+def _get_entry(content: str, key: Optional[Hashable]) -> _Entry:
+    cache_key = ("text", content) if key is None else key
+    with _lock:
+        entry = _cache.get(cache_key)
+        if entry is not None:
+            _cache.move_to_end(cache_key)
+            _stats["hits"] += 1
+            return entry
+        _stats["misses"] += 1
+        tokens = _seeds.get(content)
+        if tokens is None:
+            tokens = tuple(tokenize(content))
+        else:
+            _stats["seeded"] += 1
+        entry = _Entry(tokens)
+        _cache[cache_key] = entry
+        if len(_cache) > TOKEN_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return entry
+
+
+def get_tokens(content: str, key: Optional[Hashable] = None) -> Tokens:
+    """Return chevron tokens for content, tokenising only on a cache miss.
+
+    Args:
+        content: Template text
+        key: Identity of the template (see file_key). Inline text such as partials
+            or frontmatter fields omits it and is keyed on the text itself.
+
+    Returns:
+        Token sequence accepted by chevron.render in place of template text
+
+    Raises:
+        ChevronError: If the template has invalid syntax (not cached)
+    """
+    return _get_entry(content, key).tokens
+
+
+def get_compiled(content: str, compiler: Callable[[Tokens], T], key: Optional[Hashable] = None) -> T:
+    """Return content compiled from its cached tokens, compiling only once per cache entry.
+
+    Args:
+        content: Template text
+        compiler: Function building the compiled form from tokens
+        key: Identity of the template, as for get_tokens
+
+    Raises:
+        ChevronError: If the template has invalid syntax (not cached)
+    """
+    entry = _get_entry(content, key)
+    if entry.compiled is None:
+        # Compilation is pure, so a concurrent duplicate build is harmless
+        entry.compiled = compiler(entry.tokens)
+    return entry.compiled
+
+
+def get_root_names(content: str, key: Optional[Hashable] = None) -> frozenset[str]:
+    """Return the first segment of every name a template's tags look up.
+
+    Tags inside lambda sections are included, since lambdas receive that text.
+
+    Args:
+        content: Template text
+        key: Identity of the template, as for get_tokens
+
+    Raises:
+        ChevronError: If the template has invalid syntax (not cached)
+    """
+    entry = _get_entry(content, key)
+    if entry.names is None:
+        entry.names = frozenset(
+            name.split(".", 1)[0] for tag, name in entry.tokens if tag in _LOOKUP_TAGS and name != "."
+        )
+    return entry.names
+
+
+def tokenize_template(content: str) -> Tokens:
+    """Tokenise content without caching it (safe to call from any thread).
+
+    Raises:
+        ChevronError: If the template has invalid syntax
+    """
+    with _lock:
+        return tuple(tokenize(content))
+
+
+def seed_tokens(entries: Iterable[tuple[str, Tokens]]) -> None:
+    """Register tokens produced ahead of time; a cache miss for the same text uses them.
+
+    Tokens depend only on the text, so seeds never go stale: an edited template
+    simply no longer matches its seed.
+    """
+    with _lock:
+        for content, tokens in entries:
+            _seeds[content] = tokens
+
+
+def get_token_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters and current size of the token cache."""
+    with _lock:
+        return {**_stats, "entries": len(_cache), "max_entries": TOKEN_CACHE_SIZE}
+
+
+def clear_token_cache() -> None:
+    """Drop all cached tokens (seeds are kept)."""
+    with _lock:
+        _cache.clear()
+        _stats.update(hits=0, misses=0, seeded=0)
+
+
+def clear_token_seeds() -> None:
+    """Drop all tokens registered with seed_tokens."""
+    with _lock:
+        _seeds.clear()
@@ -124,6 +124,14 @@ INSTRUCTION_AGENT_INFORMATION = f"This information is for your information and u
 INSTRUCTION_AGENT_INSTRUCTIONS = f"You MUST follow these instructions. {INSTRUCTION_NO_DISPLAY}"
 INSTRUCTION_AGENT_REQUIREMENTS = f"You MUST ALWAYS adhere to these guidelines. {INSTRUCTION_NO_DISPLAY}"
 INSTRUCTION_DISPLAY_ERRORS = "Display errors to the user, otherwise follow the provided instructions."
+INSTRUCTION_CONTENT_UNCHANGED = (
+    "The content has not changed since the version with this etag. "
+    f"Use the copy you already have instead of requesting it again. {INSTRUCTION_NO_DISPLAY}"
+)
+INSTRUCTION_INVALID_CURSOR = (
+    "The cursor no longer matches the content, which has changed since the first page. "
+    "Request the content again without a cursor to start from the first page."
+)
 
 # Content type identifiers
 USER_INFO = "user/information"
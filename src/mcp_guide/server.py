@@ -34,6 +34,7 @@ def _initialize_runtime_tasks() -> None:
     from mcp_guide.task_manager import TaskManager  # noqa: F401
     from mcp_guide.tasks.document_task import DocumentTask  # noqa: F401
     from mcp_guide.tasks.retry_task import RetryTask  # noqa: F401
+    from mcp_guide.tasks.store_maintenance_task import StoreMaintenanceTask  # noqa: F401
     from mcp_guide.tasks.update_task import McpUpdateTask  # noqa: F401
     from mcp_guide.workflow.tasks import WorkflowMonitorTask  # noqa: F401
 
@@ -89,7 +90,12 @@ async def guide_lifespan(server: GuideMCP) -> AsyncIterator[dict[str, Any]]:
 
     yield {}  # Server runs
 
-    # Shutdown: cleanup if needed (future)
+    # Shutdown: stop polling docroots watched by sessions and the render workers
+    from mcp_guide.render.offload import shutdown_render_executor
+    from mcp_guide.watchers.docroot_watcher import stop_docroot_watchers
+
+    await stop_docroot_watchers()
+    shutdown_render_executor()
 
 
 class _ToolsProxy:
@@ -16,6 +16,7 @@ from fastmcp import Context
 
 from mcp_guide.core.file_reader import read_file_content
 from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.discovery.bundle import load_docroot_bundle
 from mcp_guide.feature_flags.types import FeatureValue, to_raw_feature_value
 from mcp_guide.file_lock import lock_update
 from mcp_guide.mcp_context import cache_mcp_globals, consume_bootstrap_mcp_data
@@ -40,6 +41,7 @@ if TYPE_CHECKING:
 from mcp_guide.mcp_context import resolve_project_name, resolve_project_path
 from mcp_guide.result import Result
 from mcp_guide.watchers.config_watcher import ConfigWatcher
+from mcp_guide.watchers.docroot_watcher import watch_docroot
 
 logger = get_logger(__name__)
 
@@ -499,6 +501,7 @@ class Session:
         self._project_dirty = False
         self._config_watcher: Optional[ConfigWatcher] = None
         self._watcher_task: Optional["asyncio.Task[None]"] = None
+        self._docroot_watched = False
         self._listeners: list["SessionListener"] = []
         self._template_cache: Optional["TemplateContextCache"] = None
         self.command_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
@@ -625,6 +628,19 @@ class Session:
                 if self._watcher_task is None or self._watcher_task.done():
                     self._watcher_task = asyncio.create_task(self._config_watcher.start())
 
+    async def _ensure_docroot_watched(self) -> None:
+        """Ensure the docroot is watched so cached partials and content see external edits."""
+        if self._docroot_watched:
+            return
+        self._docroot_watched = True
+        try:
+            docroot = await self.get_docroot()
+            await watch_docroot(docroot)
+            # Precompiled documents from the last install or update, where still unmodified
+            await load_docroot_bundle(docroot)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not watch docroot for {self.project_name}: {e}")
+
     async def _on_config_file_changed(self, file_path: str) -> None:
         """Handle config file changes by marking project stale."""
         logger.warning(
@@ -702,6 +718,7 @@ class Session:
             NoProjectError: If no project is bound to this session.
         """
         await self._ensure_watcher_started()
+        await self._ensure_docroot_watched()
         if self._project_dirty:
             await self.invalidate_cache()
         return self.__delegate.project
@@ -905,6 +922,11 @@ async def get_or_create_session(
 
     session.add_listener(GuideUriListener())
 
+    # Register per-session listener reporting flag changes to the render dependency graph
+    from mcp_guide.render.dependencies import DependencyFlagListener
+
+    session.add_listener(DependencyFlagListener())
+
     # Store in ContextVar
     set_current_session(session)
 
@@ -4,12 +4,12 @@ import json
 import sqlite3
 from dataclasses import dataclass, fields
 from datetime import UTC, datetime
-from pathlib import Path
-from typing import Literal, Optional
+from pathlib import Path, PurePosixPath
+from typing import Any, Literal, Optional
 
 from mcp_guide.config_paths import get_documents_db
 from mcp_guide.core.mcp_log import get_logger
-from mcp_guide.store.executor import run_in_thread
+from mcp_guide.store.executor import latency_percentiles, run_in_thread, run_untimed
 
 logger = get_logger(__name__)
 
@@ -33,13 +33,53 @@ CREATE TABLE IF NOT EXISTS documents (
 );
 CREATE INDEX IF NOT EXISTS idx_documents_category ON documents (category);
 CREATE INDEX IF NOT EXISTS idx_documents_name ON documents (name);
+CREATE TABLE IF NOT EXISTS store_version (
+    id      INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS documents_inserted AFTER INSERT ON documents BEGIN
+    INSERT INTO store_version (id, version) VALUES (1, 1) ON CONFLICT (id) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS documents_updated AFTER UPDATE ON documents BEGIN
+    INSERT INTO store_version (id, version) VALUES (1, 1) ON CONFLICT (id) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS documents_deleted AFTER DELETE ON documents BEGIN
+    INSERT INTO store_version (id, version) VALUES (1, 1) ON CONFLICT (id) DO UPDATE SET version = version + 1;
+END;
 """
 
+# Batched lookups bind one parameter per name up to this limit; larger batches are
+# joined against a temporary table instead (SQLite caps bound parameters per statement).
+_MAX_IN_PARAMS = 500
+
 # Additive-only migrations — use ALTER TABLE ... ADD COLUMN IF NOT EXISTS.
 # Never drop, rename, or change column types (requires table rebuild).
+# Generated columns expose frequently queried metadata keys so they can be indexed;
+# json_valid() guards keep a malformed metadata value from failing every query.
 _MIGRATIONS = """
+ALTER TABLE documents ADD COLUMN meta_type TEXT
+    GENERATED ALWAYS AS (CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.type') END) VIRTUAL;
+ALTER TABLE documents ADD COLUMN meta_content_type TEXT
+    GENERATED ALWAYS AS (CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$."content-type"') END) VIRTUAL;
+ALTER TABLE documents ADD COLUMN has_description INTEGER
+    GENERATED ALWAYS AS (
+        CASE WHEN json_valid(metadata) AND ifnull(json_extract(metadata, '$.description'), '') != '' THEN 1 ELSE 0 END
+    ) VIRTUAL;
+CREATE INDEX IF NOT EXISTS idx_documents_meta_type ON documents (category, meta_type);
+CREATE INDEX IF NOT EXISTS idx_documents_meta_content_type ON documents (category, meta_content_type);
+CREATE INDEX IF NOT EXISTS idx_documents_source_type ON documents (category, source_type);
+CREATE INDEX IF NOT EXISTS idx_documents_has_description ON documents (category, has_description);
 """
 
+# Free pages released per maintenance pass by PRAGMA incremental_vacuum
+_INCREMENTAL_VACUUM_PAGES = 256
+
+# Metadata keys backed by an indexed generated column (see _MIGRATIONS).
+_INDEXED_METADATA_COLUMNS: dict[str, str] = {
+    "type": "meta_type",
+    "content-type": "meta_content_type",
+}
+
 
 @dataclass
 class UpsertResult:
@@ -75,6 +115,9 @@ def _get_conn(db_path: Optional[Path] = None) -> sqlite3.Connection:
     path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
+    # auto_vacuum only takes effect on a new database; existing ones are converted by _run_maintenance
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("PRAGMA journal_mode = WAL")
     conn.executescript(_CREATE_TABLE)
     if _MIGRATIONS.strip():
         for statement in _MIGRATIONS.strip().split(";"):
@@ -215,6 +258,43 @@ def _get_document_content(category: str, name: str, db_path: Optional[Path] = No
     return row["content"] if row else None
 
 
+def _get_documents(category: str, names: list[str], db_path: Optional[Path] = None) -> dict[str, DocumentRecord]:
+    unique_names = list(dict.fromkeys(names))
+    if not unique_names:
+        return {}
+    conn = _get_conn(db_path)
+    try:
+        if len(unique_names) <= _MAX_IN_PARAMS:
+            placeholders = ", ".join("?" * len(unique_names))
+            rows = conn.execute(
+                f"SELECT * FROM documents WHERE category = ? AND name IN ({placeholders})",  # nosec B608
+                (category, *unique_names),
+            ).fetchall()
+        else:
+            # Temp tables are private to this connection and dropped when it closes
+            conn.execute("CREATE TEMP TABLE requested_names (name TEXT PRIMARY KEY COLLATE NOCASE)")
+            conn.executemany(
+                "INSERT OR IGNORE INTO requested_names (name) VALUES (?)",
+                ((name,) for name in unique_names),
+            )
+            rows = conn.execute(
+                "SELECT d.* FROM documents d JOIN requested_names r ON d.name = r.name WHERE d.category = ?",
+                (category,),
+            ).fetchall()
+    finally:
+        conn.close()
+    return {row["name"]: _row_to_record(row) for row in rows}
+
+
+def _get_store_version(db_path: Optional[Path] = None) -> int:
+    conn = _get_conn(db_path)
+    try:
+        row = conn.execute("SELECT version FROM store_version WHERE id = 1").fetchone()
+    finally:
+        conn.close()
+    return row["version"] if row else 0
+
+
 def _remove_document(category: str, name: str, db_path: Optional[Path] = None) -> bool:
     conn = _get_conn(db_path)
     try:
@@ -229,19 +309,137 @@ def _remove_document(category: str, name: str, db_path: Optional[Path] = None) -
     return rowcount > 0
 
 
-def _list_documents(category: Optional[str] = None, db_path: Optional[Path] = None) -> list[DocumentRecord]:
+def _translate_glob(pattern: str) -> Optional[str]:
+    """Translate a PurePosixPath.full_match pattern into an equivalent SQLite GLOB.
+
+    GLOB wildcards also match '/', so the caller must pin the separator count of the
+    name to that of the pattern; every '/' in the name is then consumed by a literal
+    '/' in the pattern and no wildcard can cross a segment boundary.
+
+    Returns None when the semantics cannot be matched exactly ('**' segments,
+    unterminated or '^'-leading brackets, brackets containing '/').
+    """
+    if "**" in pattern:
+        return None
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char != "[":
+            out.append(char)
+            i += 1
+            continue
+        # fnmatch bracket rules: a ']' directly after '[' or '[!' is a literal member
+        j = i + 1
+        if j < len(pattern) and pattern[j] == "!":
+            j += 1
+        if j < len(pattern) and pattern[j] == "]":
+            j += 1
+        end = pattern.find("]", j)
+        if end == -1:
+            return None
+        members = pattern[i + 1 : end]
+        if "/" in members or members.startswith("^"):
+            return None
+        if members.startswith("!"):
+            members = "^" + members[1:]
+        out.append(f"[{members}]")
+        i = end + 1
+    return "".join(out)
+
+
+def _name_filter(patterns: list[str]) -> Optional[tuple[str, list[Any]]]:
+    """Build a WHERE fragment matching any of the patterns, or None if any cannot be pushed down."""
+    clauses: list[str] = []
+    params: list[Any] = []
+    for pattern in dict.fromkeys(str(PurePosixPath(p)) for p in patterns):
+        glob = _translate_glob(pattern)
+        if glob is None:
+            return None
+        clauses.append("(name GLOB ? AND length(name) - length(replace(name, '/', '')) = ?)")
+        params.extend((glob, pattern.count("/")))
+    if not clauses:
+        return "0", []
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+def _metadata_filter(metadata: dict[str, Any]) -> tuple[list[str], list[Any]]:
+    """Build WHERE fragments requiring each metadata key to equal the given scalar value."""
+    clauses: list[str] = []
+    params: list[Any] = []
+    for key, value in metadata.items():
+        if value is not None and not isinstance(value, (str, int, float, bool)):
+            raise ValueError(f"metadata filter for {key!r} must be a scalar, got {type(value).__name__}")
+        column = _INDEXED_METADATA_COLUMNS.get(key)
+        if column is None:
+            if '"' in key:
+                raise ValueError(f"metadata filter key must not contain '\"': {key!r}")
+            column = "(CASE WHEN json_valid(metadata) THEN json_extract(metadata, ?) END)"
+            params.append(f'$."{key}"')
+        if value is None:
+            clauses.append(f"{column} IS NULL")
+        else:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return clauses, params
+
+
+def _list_documents(
+    category: Optional[str] = None,
+    db_path: Optional[Path] = None,
+    patterns: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    source_type: Optional[str] = None,
+    has_description: Optional[bool] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> list[DocumentRecord]:
+    where: list[str] = []
+    params: list[Any] = []
+    if category is not None:
+        where.append("category = ?")
+        params.append(category)
+    if source_type is not None:
+        where.append("source_type = ?")
+        params.append(source_type)
+    if has_description is not None:
+        where.append("has_description = ?")
+        params.append(int(has_description))
+    if metadata:
+        meta_clauses, meta_params = _metadata_filter(metadata)
+        where.extend(meta_clauses)
+        params.extend(meta_params)
+
+    # Patterns are pushed into SQL when they translate exactly; otherwise rows are
+    # matched in Python and the limit is applied afterwards.
+    match_in_python = False
+    if patterns is not None:
+        name_filter = _name_filter(patterns)
+        if name_filter is None:
+            match_in_python = True
+        else:
+            where.append(name_filter[0])
+            params.extend(name_filter[1])
+
+    query = _SELECT_METADATA
+    if where:
+        query += " WHERE " + " AND ".join(where)  # nosec B608
+    query += " ORDER BY name" if category is not None else " ORDER BY category, name"
+    if limit is not None and not match_in_python:
+        query += " LIMIT ?"
+        params.append(limit)
+
     conn = _get_conn(db_path)
     try:
-        if category is not None:
-            rows = conn.execute(
-                _SELECT_METADATA + " WHERE category = ? ORDER BY name",
-                (category,),
-            ).fetchall()
-        else:
-            rows = conn.execute(_SELECT_METADATA + " ORDER BY category, name").fetchall()
+        rows = conn.execute(query, params).fetchall()
     finally:
         conn.close()
-    return [_row_to_metadata_record(r) for r in rows]
+
+    records = [_row_to_metadata_record(r) for r in rows]
+    if match_in_python and patterns is not None:
+        records = [r for r in records if any(PurePosixPath(r.name).full_match(p) for p in patterns)]
+        if limit is not None:
+            records = records[:limit]
+    return records
 
 
 def _update_document(
@@ -313,6 +511,59 @@ def _update_document(
 # --- Async public API ---
 
 
+def _run_maintenance(db_path: Optional[Path] = None, vacuum_pages: int = _INCREMENTAL_VACUUM_PAGES) -> dict[str, Any]:
+    conn = _get_conn(db_path)
+    try:
+        freelist_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # One-off rebuild so databases created before incremental auto_vacuum can use it
+            conn.execute("VACUUM")
+        elif freelist_before:
+            conn.execute(f"PRAGMA incremental_vacuum({int(vacuum_pages)})").fetchall()
+        busy, wal_pages, checkpointed = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        conn.execute("PRAGMA optimize")
+        freelist_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    finally:
+        conn.close()
+    return {
+        "pages_freed": max(freelist_before - freelist_after, 0),
+        "checkpoint_busy": bool(busy),
+        "wal_pages_checkpointed": max(checkpointed, 0),
+    }
+
+
+def _store_stats(db_path: Optional[Path] = None) -> dict[str, Any]:
+    path = db_path or get_documents_db()
+    conn = _get_conn(path)
+    try:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        categories = {
+            row["category"]: row["documents"]
+            for row in conn.execute(
+                "SELECT category, count(*) AS documents FROM documents GROUP BY category ORDER BY category"
+            )
+        }
+        content_bytes = conn.execute("SELECT ifnull(sum(length(CAST(content AS BLOB))), 0) FROM documents").fetchone()[
+            0
+        ]
+    finally:
+        conn.close()
+    wal_path = path.with_name(path.name + "-wal")
+    return {
+        "documents": sum(categories.values()),
+        "categories": categories,
+        "content_bytes": content_bytes,
+        "file_bytes": path.stat().st_size,
+        "wal_bytes": wal_path.stat().st_size if wal_path.exists() else 0,
+        "page_size": page_size,
+        "page_count": page_count,
+        "free_pages": freelist_count,
+        "fragmentation": round(freelist_count / page_count, 4) if page_count else 0.0,
+    }
+
+
 async def add_document(
     category: str,
     name: str,
@@ -325,9 +576,10 @@ async def add_document(
     db_path: Optional[Path] = None,
 ) -> UpsertResult:
     """Insert or update a document. Returns UpsertResult with record or skip reason."""
-    return await run_in_thread(
+    result = await run_in_thread(
         _add_document, category, name, source, source_type, content, metadata, mtime, force, db_path
     )
+    return result
 
 
 async def get_document(category: str, name: str, db_path: Optional[Path] = None) -> Optional[DocumentRecord]:
@@ -340,14 +592,42 @@ async def get_document_content(category: str, name: str, db_path: Optional[Path]
     return await run_in_thread(_get_document_content, category, name, db_path)
 
 
+async def get_documents(category: str, names: list[str], db_path: Optional[Path] = None) -> dict[str, DocumentRecord]:
+    """Return documents (with content) for several names in one query, keyed by stored name.
+
+    Names that do not exist are absent from the result.
+    """
+    return await run_in_thread(_get_documents, category, names, db_path)
+
+
 async def remove_document(category: str, name: str, db_path: Optional[Path] = None) -> bool:
     """Delete document by (category, name). Returns True if a row was deleted."""
     return await run_in_thread(_remove_document, category, name, db_path)
 
 
-async def list_documents(category: Optional[str] = None, db_path: Optional[Path] = None) -> list[DocumentRecord]:
-    """List documents, optionally filtered by category."""
-    return await run_in_thread(_list_documents, category, db_path)
+async def list_documents(
+    category: Optional[str] = None,
+    db_path: Optional[Path] = None,
+    *,
+    patterns: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    source_type: Optional[str] = None,
+    has_description: Optional[bool] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> list[DocumentRecord]:
+    """List documents, optionally filtered by category, name patterns and metadata.
+
+    Patterns use PurePosixPath.full_match semantics (case-sensitive) and a name is
+    returned if it matches any of them. Filtering and the row limit are applied in
+    the database where the patterns can be expressed as SQLite GLOB predicates.
+
+    ``metadata`` maps keys to the scalar value they must equal (None matches a
+    missing key). ``type`` and ``content-type``, like ``source_type`` and
+    ``has_description``, are answered from indexed columns.
+    """
+    return await run_in_thread(
+        _list_documents, category, db_path, patterns, limit, source_type, has_description, metadata
+    )
 
 
 async def update_document(
@@ -373,3 +653,28 @@ async def update_document(
         metadata_clear=metadata_clear,
         db_path=db_path,
     )
+
+
+async def get_store_generation(db_path: Optional[Path] = None) -> int:
+    """Return a counter that increases whenever any process changes a stored document.
+
+    The counter is kept in the database and bumped by triggers inside every write
+    transaction, so it also reflects documents added, updated or removed by other
+    server processes sharing the store. Caches of gathered documents record the
+    generation they were filled at and treat entries from another generation as stale.
+    """
+    return await run_untimed(_get_store_version, db_path)
+
+
+async def run_maintenance(
+    db_path: Optional[Path] = None, vacuum_pages: int = _INCREMENTAL_VACUUM_PAGES
+) -> dict[str, Any]:
+    """Reclaim free pages, checkpoint the WAL and refresh planner statistics."""
+    return await run_untimed(_run_maintenance, db_path, vacuum_pages)
+
+
+async def get_store_stats(db_path: Optional[Path] = None) -> dict[str, Any]:
+    """Return row counts, sizes, page fragmentation and recent query latency percentiles."""
+    stats = await run_untimed(_store_stats, db_path)
+    stats["latency"] = latency_percentiles()
+    return stats
@@ -2,13 +2,21 @@
 
 import asyncio
 import concurrent.futures
+import time
+from collections import deque
 from collections.abc import Callable
 from functools import partial
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 T = TypeVar("T")
 
+# Number of recent operation timings kept for latency percentiles
+LATENCY_SAMPLES = 1000
+
 _executor: concurrent.futures.ThreadPoolExecutor | None = None
+_latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+_last_activity: Optional[float] = None
+_operation_count = 0
 
 
 def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
@@ -18,7 +26,54 @@ def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
     return _executor
 
 
+def _timed(func: Callable[[], T]) -> T:
+    global _last_activity, _operation_count
+    start = time.perf_counter()
+    try:
+        return func()
+    finally:
+        _latencies.append(time.perf_counter() - start)
+        _last_activity = time.monotonic()
+        _operation_count += 1
+
+
 async def run_in_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
     """Run a sync callable on the document store thread."""
     loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _timed, partial(func, *args, **kwargs))
+
+
+async def run_untimed(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a sync callable on the document store thread without recording it as store activity."""
+    loop = asyncio.get_running_loop()
     return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+
+def latency_percentiles() -> dict[str, Any]:
+    """Return p50/p95/p99/max of recent operation latencies in milliseconds."""
+    samples = sorted(_latencies)
+    if not samples:
+        return {"samples": 0}
+
+    def pick(fraction: float) -> float:
+        return round(samples[min(len(samples) - 1, int(fraction * len(samples)))] * 1000, 3)
+
+    return {
+        "samples": len(samples),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": round(samples[-1] * 1000, 3),
+    }
+
+
+def operation_count() -> int:
+    """Number of timed store operations run so far."""
+    return _operation_count
+
+
+def seconds_since_activity() -> Optional[float]:
+    """Seconds since the last timed store operation finished, or None if there has been none."""
+    if _last_activity is None:
+        return None
+    return time.monotonic() - _last_activity
@@ -0,0 +1,92 @@
+"""StoreMaintenanceTask - keeps the document store compact during idle periods."""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp_guide.config_paths import get_documents_db
+from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.decorators import task_init
+from mcp_guide.store.document_store import run_maintenance
+from mcp_guide.store.executor import operation_count, seconds_since_activity
+from mcp_guide.task_manager.interception import EventType
+from mcp_guide.task_manager.manager import get_task_manager
+
+if TYPE_CHECKING:
+    from mcp_guide.task_manager.manager import EventResult, TaskManager
+
+logger = get_logger(__name__)
+
+
+@task_init
+class StoreMaintenanceTask:
+    """Run incremental vacuum, WAL checkpoint and optimize when the store is idle."""
+
+    # Timer interval between maintenance checks, in seconds
+    INTERVAL = 300.0
+
+    # Minimum time since the last store operation before maintenance may run
+    IDLE_SECONDS = 30.0
+
+    def __init__(self, task_manager: Optional["TaskManager"] = None) -> None:
+        """Initialize StoreMaintenanceTask.
+
+        Args:
+            task_manager: TaskManager instance (optional, uses singleton if not provided)
+        """
+        if task_manager is None:
+            task_manager = get_task_manager()
+        self.task_manager = task_manager
+        # Operation count at the last maintenance run; None until the first run
+        self._maintained_at: Optional[int] = None
+
+        self.task_manager.subscribe(self, EventType.TIMER, timer_interval=self.INTERVAL)
+
+    def get_name(self) -> str:
+        """Get task name.
+
+        Returns:
+            Task name
+        """
+        return "StoreMaintenanceTask"
+
+    async def on_tool(self) -> None:
+        """Called after tool execution - no-op."""
+        pass
+
+    async def handle_event(self, event_type: EventType, data: dict[str, Any]) -> "EventResult | None":
+        """Handle timer events and maintain the store when idle.
+
+        Args:
+            event_type: Type of event
+            data: Event data
+
+        Returns:
+            EventResult when maintenance ran, otherwise None
+        """
+        from mcp_guide.task_manager.manager import EventResult
+
+        if not (event_type & EventType.TIMER):
+            return None
+
+        # Never create the database just to maintain it
+        if not get_documents_db().exists():
+            return None
+
+        # Skip if nothing has touched the store since the last run, or it is still busy
+        operations = operation_count()
+        if operations == self._maintained_at:
+            return None
+        idle_for = seconds_since_activity()
+        if idle_for is not None and idle_for < self.IDLE_SECONDS:
+            return None
+        if not self.task_manager.is_queue_empty():
+            return None
+
+        try:
+            summary = await run_maintenance()
+        except Exception as e:
+            logger.warning(f"Document store maintenance failed: {e}")
+            return None
+
+        self._maintained_at = operations
+        logger.debug(f"Document store maintenance: {summary}")
+        return EventResult(result=True)
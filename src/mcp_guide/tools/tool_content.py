@@ -2,45 +2,74 @@
 
 """Unified content access tool - get_content."""
 
+import asyncio
 import contextlib
+import os
 import time
 import zlib
+from collections.abc import Hashable
 from dataclasses import replace as dc_replace
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+import anyio
 from fastmcp import Context
 from pydantic import Field
 
+from mcp_guide.config_constants import MAX_CONCURRENT_FILE_RENDERS
+from mcp_guide.content.exports import get_export_tracker
 from mcp_guide.content.formatters.selection import ContentFormat, get_formatter_from_flag
-from mcp_guide.content.gathering import gather_content
+from mcp_guide.content.gathering import expression_categories, gather_content, prefetch_stored_content
+from mcp_guide.content.pagination import (
+    PAGE_PREFETCH_BATCH,
+    InvalidCursorError,
+    PageCursor,
+    cursor_scope,
+    decode_cursor,
+    encode_cursor,
+    parse_content_budget,
+    select_page,
+)
+from mcp_guide.content.responses import compute_etag, lookup_response, store_response
 from mcp_guide.content.utils import (
     create_file_read_error_result,
     extract_and_deduplicate_instructions,
     prepend_export_frontmatter,
     read_and_render_file_contents,
+    read_file_frontmatter,
     resolve_content_disposition,
 )
 from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.core.prompt_decorator import get_prompt_name
 from mcp_guide.core.tool_arguments import ToolArguments
-from mcp_guide.core.tool_decorator import toolfunc
+from mcp_guide.core.tool_decorator import get_tool_prefix, toolfunc
 from mcp_guide.discovery.files import FileInfo
 from mcp_guide.filesystem.read_write_security import ReadWriteSecurityPolicy, SecurityError
 from mcp_guide.models import CategoryNotFoundError, CollectionNotFoundError, ExpressionParseError, FileReadError
 from mcp_guide.models.project import Project
 from mcp_guide.render.cache import get_template_context_if_needed
+from mcp_guide.render.dependencies import DependencyRecord, collect_dependencies
+from mcp_guide.render.memo import fingerprint
 from mcp_guide.result import Result
 from mcp_guide.result_constants import (
     ERROR_FILE_READ,
     ERROR_NOT_FOUND,
+    ERROR_VALIDATION,
+    INSTRUCTION_CONTENT_UNCHANGED,
     INSTRUCTION_FILE_ERROR,
+    INSTRUCTION_INVALID_CURSOR,
     INSTRUCTION_NOTFOUND_ERROR,
     INSTRUCTION_PATTERN_ERROR,
     make_no_project_result,
 )
+from mcp_guide.store.document_store import get_store_generation
 from mcp_guide.tools.tool_helpers import get_session_and_project
 from mcp_guide.tools.tool_result import parse_options, tool_result
+from mcp_guide.watchers.docroot_watcher import get_docroot_generation
+
+if TYPE_CHECKING:
+    from mcp_guide.session import Session
 
 logger = get_logger(__name__)
 
@@ -82,6 +111,64 @@ def compute_metadata_hash(files: list[FileInfo]) -> Optional[str]:
     return f"{zlib.crc32(data):08x}"
 
 
+async def _gather_export_files(
+    session: "Session", project: Project, docroot: str, expression: str, pattern: Optional[str]
+) -> tuple[list[FileInfo], Optional[str]]:
+    """Gather the files behind an export and track them for list_exports.
+
+    Returns:
+        The gathered files and their metadata hash
+
+    Raises:
+        ExpressionParseError, CategoryNotFoundError, CollectionNotFoundError: As for gather_content
+    """
+    store_generation, docroot_generation = await get_store_generation(), get_docroot_generation()
+    gather_expression = _build_expression(expression, pattern)
+    files = await gather_content(session, project, gather_expression, prefetch=False)
+    metadata_hash = compute_metadata_hash(files)
+
+    try:
+        categories = expression_categories(project, gather_expression)
+    except (ExpressionParseError, CategoryNotFoundError, CollectionNotFoundError):
+        return files, metadata_hash
+    root = Path(docroot)
+    get_export_tracker().record(
+        (docroot, project.name, expression, pattern),
+        metadata_hash=metadata_hash,
+        files=[
+            os.path.join(root / file.category.dir, file.path)
+            for file in files
+            if file.source != "store" and file.category is not None
+        ],
+        directories=[str(root / project.categories[name].dir) for name in categories],
+        config=_export_config(project),
+        store_generation=store_generation,
+        docroot_generation=docroot_generation,
+    )
+    return files, metadata_hash
+
+
+def _export_config(project: Project) -> Hashable:
+    """Fingerprint the configuration deciding which files an export covers."""
+    return fingerprint((project.categories, project.collections))
+
+
+# Background re-verifications started by list_exports (referenced until done)
+_verification_tasks: set[asyncio.Task[None]] = set()
+
+
+async def _reverify_exports(
+    session: "Session", project: Project, docroot: str, exports: list[tuple[str, Optional[str]]]
+) -> None:
+    """Gather tracked exports again so changes missed by docroot events are picked up."""
+    for expression, pattern in exports:
+        try:
+            await _gather_export_files(session, project, docroot, expression, pattern)
+        except Exception as e:
+            logger.debug(f"list_exports: background verification failed for {expression!r}: {e}")
+            get_export_tracker().forget((docroot, project.name, expression, pattern))
+
+
 class ContentArgs(ToolArguments):
     """Arguments for get_content tool.
 
@@ -104,11 +191,22 @@ class ContentArgs(ToolArguments):
         description="If True, return full content even if exported. "
         "If False (default), return reference to exported content when available.",
     )
+    if_none_match: str | None = Field(
+        None,
+        description="The etag of a previous get_content result for the same expression and pattern. "
+        "If the content has not changed since, a short 'unchanged' result is returned instead of the content.",
+    )
+    cursor: str | None = Field(
+        None,
+        description="The next_cursor of a previous get_content result for the same expression and pattern. "
+        "Returns the next page of content when responses are limited by the content-budget flag.",
+    )
 
 
 async def internal_get_content(
     args: ContentArgs,
     ctx: Optional[Context] = None,
+    paginate: bool = False,
 ) -> Result[str]:
     """Get content from collections and categories (unified access).
 
@@ -118,6 +216,7 @@ async def internal_get_content(
     Args:
         args: Tool arguments with name and optional pattern
         ctx: MCP Context (auto-injected by FastMCP)
+        paginate: Limit the response to the content-budget flag, returning one page of files
 
     Returns:
         Result containing formatted content or error
@@ -133,11 +232,10 @@ async def internal_get_content(
     if not args.force:
         export_entry = project.get_export_entry(args.expression, args.pattern)
         if export_entry:
-            # Get the original content to extract its instruction
-            original_result = await internal_get_content(
-                ContentArgs(expression=args.expression, pattern=args.pattern, force=True), ctx
+            # Instruction and type of the original content, from frontmatter only
+            original_instruction, original_type, metadata_hash = await _exported_content_metadata(
+                session, project, docroot, args
             )
-            original_instruction = original_result.instruction if original_result.success else None
 
             # Content has been exported - return reference instructions
             from mcp_guide.render.context import TemplateContext
@@ -152,7 +250,8 @@ async def internal_get_content(
                         "expression": args.expression,
                         "pattern": args.pattern,
                         "instruction": original_instruction,
-                        "type": original_result.disposition if original_result.success else None,
+                        "type": original_type,
+                        "stale": metadata_hash is not None and metadata_hash != export_entry.metadata_hash,
                     }
                 }
             )
@@ -166,74 +265,321 @@ async def internal_get_content(
         # If a pattern is provided, append it to the expression
         expression = _build_expression(args.expression, args.pattern)
 
-        files = await gather_content(session, project, expression)
+        store_generation, docroot_generation = await get_store_generation(), get_docroot_generation()
+        # Stored document bodies are only loaded once a render is needed
+        files = await gather_content(session, project, expression, prefetch=False)
 
         if not files:
             return Result.ok(
                 f"No matching content found for '{args.expression}'", instruction=INSTRUCTION_PATTERN_ERROR
             )
 
-        # Group files by category for reading
-        files_by_category: dict[str, list[FileInfo]] = {}
-        for file in files:
-            category_name = (
-                file.category.name if file.category else "unknown"
-            )  # Category is always set by gather_content
-            if category_name not in files_by_category:
-                files_by_category[category_name] = []
-            files_by_category[category_name].append(file)
-
-        # Read content for each category group
-        final_files: list[FileInfo] = []
-        file_read_errors: list[str] = []
-
-        for category_name, category_files in files_by_category.items():
-            category = project.categories.get(category_name)
-            if not category:
-                raise CategoryNotFoundError(f"Invalid category '{category_name}' found in FileInfo object")
-
-            category_dir = docroot / category.dir
-            template_context = await get_template_context_if_needed(category_files, category_name)
+        # Answer requests for unchanged content from the response cache or with a short reply
+        files_hash = compute_metadata_hash(files)
+        flags = await _flags_fingerprint(session)
+        budget = await _content_budget(session) if paginate else None
+        response_key = (
+            str(docroot),
+            project.name,
+            _export_config(project),
+            args.expression,
+            args.pattern,
+            get_tool_prefix(),
+            get_prompt_name(),
+            budget,
+            args.cursor if budget else None,
+        )
+        cached = await lookup_response(response_key, files_hash, flags)
+        if cached is not None:
+            return _unless_unchanged(cached.result, cached.etag, args.if_none_match)
+
+        category_groups = _group_by_category(files, project)
+        with collect_dependencies() as dependencies:
+            if budget:
+                result = await _render_page(session, project, docroot, category_groups, args, budget, files_hash)
+            else:
+                await prefetch_stored_content(files)
+                result = await _render_content(session, project, docroot, files, category_groups, args.expression)
+        if not result.success:
+            return result
+
+        etag = compute_etag(files_hash, flags, result)
+        directories = frozenset(
+            str(docroot / project.categories[name].dir) for name in expression_categories(project, expression)
+        )
+        await store_response(
+            response_key,
+            result,
+            etag,
+            files_hash=files_hash,
+            flags=flags,
+            store_generation=store_generation,
+            docroot_generation=docroot_generation,
+            categories=[category_name for category_name, _ in category_groups],
+            dependencies=dependencies.record().merge(DependencyRecord(directories=directories)),
+        )
+        return _unless_unchanged(result, etag, args.if_none_match)
 
-            errors = await read_and_render_file_contents(
-                category_files, category_dir, docroot, template_context, category_prefix=category_name
-            )
-            file_read_errors.extend(errors)
-            final_files.extend(category_files)
-
-        # Check for file read errors
-        if file_read_errors:
-            return create_file_read_error_result(
-                file_read_errors,
-                args.expression,
-                "content",
-                ERROR_FILE_READ,
-                INSTRUCTION_FILE_ERROR,
+    except ExpressionParseError as e:
+        return Result.failure(str(e), error_type=ERROR_NOT_FOUND, instruction=INSTRUCTION_NOTFOUND_ERROR)
+    except (CategoryNotFoundError, CollectionNotFoundError) as e:
+        return Result.failure(str(e), error_type=ERROR_NOT_FOUND, instruction=INSTRUCTION_NOTFOUND_ERROR)
+    except FileReadError as e:
+        return Result.failure(str(e), error_type=ERROR_FILE_READ, instruction=INSTRUCTION_FILE_ERROR)
+    except InvalidCursorError as e:
+        return Result.failure(str(e), error_type=ERROR_VALIDATION, instruction=INSTRUCTION_INVALID_CURSOR)
+
+
+async def _render_content(
+    session: "Session",
+    project: Project,
+    docroot: Path,
+    files: list[FileInfo],
+    category_groups: list[tuple[str, list[FileInfo]]],
+    expression: str,
+) -> Result[str]:
+    """Read, render and format gathered files grouped by category.
+
+    Raises:
+        CategoryNotFoundError, FileReadError: As for read_and_render_file_contents
+    """
+    final_files, file_read_errors = await _read_content(project, docroot, files, category_groups)
+
+    # Check for file read errors
+    if file_read_errors:
+        return create_file_read_error_result(
+            file_read_errors,
+            expression,
+            "content",
+            ERROR_FILE_READ,
+            INSTRUCTION_FILE_ERROR,
+        )
+
+    return await _format_content(session, docroot, final_files)
+
+
+async def _render_page(
+    session: "Session",
+    project: Project,
+    docroot: Path,
+    category_groups: list[tuple[str, list[FileInfo]]],
+    args: ContentArgs,
+    budget: int,
+    files_hash: Optional[str],
+) -> Result[str]:
+    """Read, render and format the page of gathered files selected by args.cursor.
+
+    Pages follow the category order of category_groups. Only the page's files are
+    rendered; trailing files are left for the next page while the formatted page
+    exceeds the budget, but a page always holds at least one file.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or the files changed since it was issued
+        CategoryNotFoundError, FileReadError: As for read_and_render_file_contents
+    """
+    ordered = [file for _, category_files in category_groups for file in category_files]
+    scope = cursor_scope(args.expression, args.pattern)
+    start = 0
+    if args.cursor:
+        cursor = decode_cursor(args.cursor)
+        if cursor.scope != scope or cursor.files_hash != files_hash or cursor.offset >= len(ordered):
+            raise InvalidCursorError(f"Cursor '{args.cursor}' does not match the current content")
+        start = cursor.offset
+
+    # Stored documents are sized by loading them, a batch at a time, so only the
+    # documents the page may hold are read
+    attempted: set[int] = set()
+    while True:
+        end = select_page(ordered, start, budget)
+        unloaded = [
+            file
+            for file in ordered[start:end]
+            if file.source == "store" and file.content_pending and id(file) not in attempted
+        ][:PAGE_PREFETCH_BATCH]
+        if not unloaded:
+            break
+        attempted.update(id(file) for file in unloaded)
+        await prefetch_stored_content(unloaded)
+    page = ordered[start:end]
+    positions = {id(file): start + index for index, file in enumerate(page)}
+    final_files, file_read_errors = await _read_content(project, docroot, page, _group_by_category(page, project))
+    if file_read_errors:
+        return create_file_read_error_result(
+            file_read_errors,
+            args.expression,
+            "content",
+            ERROR_FILE_READ,
+            INSTRUCTION_FILE_ERROR,
+        )
+
+    result = await _format_content(session, docroot, final_files)
+    while len(final_files) > 1 and len((result.value or "").encode()) > budget:
+        # Keep the rendered files that fit, dropping at least one, then format again
+        keep, total = 0, 0
+        for file in final_files[:-1]:
+            total += len((file.content or "").encode())
+            if keep and total > budget:
+                break
+            keep += 1
+        end = positions[id(final_files[keep])]
+        final_files = final_files[:keep]
+        result = await _format_content(session, docroot, final_files)
+
+    if end < len(ordered):
+        result.next_cursor = encode_cursor(PageCursor(offset=end, files_hash=files_hash, scope=scope))
+        result.message = (
+            f"Showing files {start + 1} to {end} of {len(ordered)}. "
+            f"Call get_content again with cursor '{result.next_cursor}' for the rest."
+        )
+    return result
+
+
+async def _read_content(
+    project: Project,
+    docroot: Path,
+    files: list[FileInfo],
+    category_groups: list[tuple[str, list[FileInfo]]],
+) -> tuple[list[FileInfo], list[str]]:
+    """Read and render gathered files grouped by category.
+
+    Returns:
+        The files remaining after requires-* filtering, in category order, and any read errors
+
+    Raises:
+        CategoryNotFoundError, FileReadError: As for read_and_render_file_contents
+    """
+    # Read content for each category group concurrently, all categories sharing one
+    # render budget; outcomes keep the category order of the gathered files
+    group_errors: list[list[str]] = [[] for _ in category_groups]
+    failures: list[Optional[Exception]] = [None] * len(category_groups)
+    limiter = anyio.CapacityLimiter(MAX_CONCURRENT_FILE_RENDERS)
+
+    async def _read_category(index: int, category_name: str, category_files: list[FileInfo]) -> None:
+        try:
+            category_dir = docroot / project.categories[category_name].dir
+            template_context = await get_template_context_if_needed(category_files, category_name)
+            group_errors[index] = await read_and_render_file_contents(
+                category_files,
+                category_dir,
+                docroot,
+                template_context,
+                category_prefix=category_name,
+                limiter=limiter,
             )
+        except Exception as e:
+            failures[index] = e
 
-        # Resolve content format flag
-        from mcp_guide.feature_flags.constants import FLAG_CONTENT_FORMAT
-        from mcp_guide.feature_flags.utils import get_resolved_flag_value
+    # Build the shared base context once, before the categories layer onto it
+    await get_template_context_if_needed(files)
+    async with anyio.create_task_group() as tg:
+        for index, (category_name, category_files) in enumerate(category_groups):
+            tg.start_soon(_read_category, index, category_name, category_files)
+    for failure in failures:
+        if failure is not None:
+            raise failure
 
-        flag_value = await get_resolved_flag_value(session, FLAG_CONTENT_FORMAT)
-        format_type = ContentFormat.from_flag_value(flag_value)
+    final_files: list[FileInfo] = [file for _, category_files in category_groups for file in category_files]
+    file_read_errors: list[str] = [error for errors in group_errors for error in errors]
+    return final_files, file_read_errors
 
-        # Format and return content
-        formatter = get_formatter_from_flag(format_type)
-        content = await formatter.format(final_files, docroot)
 
-        # Extract instructions from frontmatter
-        instruction = extract_and_deduplicate_instructions(final_files)
-        disposition = resolve_content_disposition(final_files)
+async def _format_content(session: "Session", docroot: Path, final_files: list[FileInfo]) -> Result[str]:
+    """Format rendered files with the content-format flag, with their instructions and disposition."""
+    # Resolve content format flag
+    from mcp_guide.feature_flags.constants import FLAG_CONTENT_FORMAT
+    from mcp_guide.feature_flags.utils import get_resolved_flag_value
 
-        return Result.ok(content, instruction=instruction, disposition=disposition)
+    flag_value = await get_resolved_flag_value(session, FLAG_CONTENT_FORMAT)
+    format_type = ContentFormat.from_flag_value(flag_value)
+
+    # Format and return content
+    formatter = get_formatter_from_flag(format_type)
+    content = await formatter.format(final_files, docroot)
+
+    # Extract instructions from frontmatter
+    instruction = extract_and_deduplicate_instructions(final_files)
+    disposition = resolve_content_disposition(final_files)
+
+    return Result.ok(content, instruction=instruction, disposition=disposition)
 
-    except ExpressionParseError as e:
-        return Result.failure(str(e), error_type=ERROR_NOT_FOUND, instruction=INSTRUCTION_NOTFOUND_ERROR)
-    except (CategoryNotFoundError, CollectionNotFoundError) as e:
-        return Result.failure(str(e), error_type=ERROR_NOT_FOUND, instruction=INSTRUCTION_NOTFOUND_ERROR)
-    except FileReadError as e:
-        return Result.failure(str(e), error_type=ERROR_FILE_READ, instruction=INSTRUCTION_FILE_ERROR)
+
+async def _content_budget(session: "Session") -> Optional[int]:
+    """Return the response budget in bytes from the content-budget flag, or None if unset."""
+    from mcp_guide.feature_flags.constants import FLAG_CONTENT_BUDGET
+    from mcp_guide.feature_flags.utils import get_resolved_flag_value
+
+    return parse_content_budget(await get_resolved_flag_value(session, FLAG_CONTENT_BUDGET))
+
+
+async def _flags_fingerprint(session: "Session") -> Hashable:
+    """Fingerprint the resolved feature flags of the session's project."""
+    from mcp_guide.feature_flags.types import to_raw_feature_value
+    from mcp_guide.models import resolve_all_flags
+
+    try:
+        flags = await resolve_all_flags(session)
+    except Exception as e:
+        # Unknown flags never match, so the response is neither reused nor reported unchanged
+        logger.debug(f"Failed to resolve flags for content etag: {e}")
+        return ("unresolved", time.time_ns())
+    return fingerprint(sorted((name, to_raw_feature_value(value)) for name, value in flags.items()))
+
+
+def _unless_unchanged(result: Result[str], etag: str, if_none_match: Optional[str]) -> Result[str]:
+    """Return a short reply if the caller already has this version, otherwise result with its ETag."""
+    if if_none_match is not None and if_none_match == etag:
+        unchanged = Result.ok(f"Content unchanged since {etag}", instruction=INSTRUCTION_CONTENT_UNCHANGED, etag=etag)
+        unchanged.next_cursor = result.next_cursor
+        return unchanged
+    result.etag = etag
+    return result
+
+
+def _group_by_category(files: list[FileInfo], project: Project) -> list[tuple[str, list[FileInfo]]]:
+    """Group gathered files by category, in the order categories first appear.
+
+    Raises:
+        CategoryNotFoundError: If a file's category is not part of the project
+    """
+    files_by_category: dict[str, list[FileInfo]] = {}
+    for file in files:
+        category_name = file.category.name if file.category else "unknown"  # Category is always set by gather_content
+        files_by_category.setdefault(category_name, []).append(file)
+    for category_name in files_by_category:
+        if category_name not in project.categories:
+            raise CategoryNotFoundError(f"Invalid category '{category_name}' found in FileInfo object")
+    return list(files_by_category.items())
+
+
+async def _exported_content_metadata(
+    session: "Session", project: Project, docroot: Path, args: ContentArgs
+) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return the instruction, disposition and metadata hash of the content behind an export.
+
+    Uses one discovery pass and reads only frontmatter: files are filtered by requires-*
+    and their instruction fields rendered, but no body is rendered. The instruction and
+    disposition are those a forced get_content would return, or None if it would fail.
+    """
+    try:
+        files = await gather_content(session, project, _build_expression(args.expression, args.pattern))
+        metadata_hash = compute_metadata_hash(files)
+        if not files:
+            return INSTRUCTION_PATTERN_ERROR, None, metadata_hash
+
+        category_groups = _group_by_category(files, project)
+        for category_name, category_files in category_groups:
+            template_context = await get_template_context_if_needed(category_files, category_name)
+            errors = await read_file_frontmatter(
+                category_files, docroot / project.categories[category_name].dir, docroot, template_context
+            )
+            if errors:
+                return None, None, metadata_hash
+    except (ExpressionParseError, CategoryNotFoundError, CollectionNotFoundError, FileReadError) as e:
+        logger.debug(f"Could not read exported content metadata for '{args.expression}': {e}")
+        return None, None, None
+
+    final_files = [file for _, category_files in category_groups for file in category_files]
+    return extract_and_deduplicate_instructions(final_files), resolve_content_disposition(final_files), metadata_hash
 
 
 @toolfunc(ContentArgs)
@@ -246,7 +592,7 @@ async def get_content(
     Searches collections first, then categories. Aggregates and deduplicates
     results from all matches. Supports pattern filtering for selective content retrieval.
     """
-    result = await internal_get_content(args, ctx)
+    result = await internal_get_content(args, ctx, paginate=True)
     return await tool_result("get_content", result)
 
 
@@ -352,11 +698,11 @@ async def export_content(
         return await tool_result("export_content", result)
 
     # Compute metadata hash by gathering files for this expression
-    gather_expression = _build_expression(args.expression, args.pattern)
-
-    gathered_files: list[FileInfo] = []
+    metadata_hash: Optional[str] = None
     try:
-        gathered_files = await gather_content(session, project, gather_expression)
+        _files, metadata_hash = await _gather_export_files(
+            session, project, await session.get_docroot(), args.expression, args.pattern
+        )
     except Exception as exc:
         logger.warning(
             "Failed to gather content for metadata hash for expression '%s' (pattern='%s'): %s",
@@ -365,7 +711,6 @@ async def export_content(
             exc,
             exc_info=True,
         )
-    metadata_hash = compute_metadata_hash(gathered_files)
 
     # Check staleness if not forced (path changes also require force=True)
     if not args.force and export_entry and metadata_hash is not None and metadata_hash == export_entry.metadata_hash:
@@ -454,6 +799,14 @@ async def list_exports(
     if project is None:
         return await tool_result("list_exports", await make_no_project_result(ctx))
 
+    # Staleness is answered from the tracker where docroot events keep it current
+    docroot = await session.get_docroot()
+    tracker = get_export_tracker()
+    config = _export_config(project)
+    store_generation = await get_store_generation()
+    scope = (docroot, project.name)
+    tracker.retain(scope, [(*scope, *key) for key in project.exports])
+
     # Build list of export dicts
     exports = []
     for (expression, pattern), exported_to in project.exports.items():
@@ -476,10 +829,14 @@ async def list_exports(
         # Compute staleness
         stale_state = StaleState.OK
         try:
-            gather_expression = _build_expression(expression, pattern)
-            files = await gather_content(session, project, gather_expression)
-            current_hash = compute_metadata_hash(files)
-            if current_hash is None:
+            tracked = tracker.lookup((*scope, expression, pattern), config, store_generation)
+            if tracked is not None:
+                current_hash = tracked.metadata_hash
+            else:
+                _files, current_hash = await _gather_export_files(session, project, docroot, expression, pattern)
+            if tracked is not None and tracked.changed:
+                stale_state = StaleState.STALE
+            elif current_hash is None:
                 stale_state = StaleState.UNKNOWN
             elif current_hash != exported_to.metadata_hash:
                 stale_state = StaleState.STALE
@@ -499,6 +856,14 @@ async def list_exports(
         }
         exports.append(export_dict)
 
+    # Periodically gather tracked exports again, without holding up this response
+    due = set(tracker.claim_due([(*scope, *key) for key in project.exports]))
+    if due:
+        exports_due = [key for key in project.exports if (*scope, *key) in due]
+        task = asyncio.create_task(_reverify_exports(session, project, docroot, exports_due))
+        _verification_tasks.add(task)
+        task.add_done_callback(_verification_tasks.discard)
+
     # Render using template if options provided
     if args.options:
         try:
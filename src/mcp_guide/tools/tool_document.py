@@ -9,7 +9,7 @@ from mcp_guide.core.arguments import Arguments as ToolArguments
 from mcp_guide.core.tool_decorator import toolfunc
 from mcp_guide.result import Result
 from mcp_guide.result_constants import ERROR_NOT_FOUND
-from mcp_guide.store.document_store import remove_document
+from mcp_guide.store.document_store import get_store_stats, remove_document
 from mcp_guide.tools.tool_result import tool_result
 
 
@@ -42,3 +42,26 @@ async def document_remove(args: DocumentRemoveArgs, ctx: Optional[Context] = Non
     """Remove a document from the store by category and name."""
     result = await internal_document_remove(args, ctx)
     return await tool_result("document_remove", result)
+
+
+class DocumentStatsArgs(ToolArguments):
+    """Arguments for document_stats tool."""
+
+
+async def internal_document_stats(
+    args: DocumentStatsArgs,
+    ctx: Optional[Context] = None,
+) -> Result[dict[str, Any]]:
+    """Report document store health."""
+    stats = await get_store_stats()
+    return Result.ok(
+        value=stats,
+        message=f"{stats['documents']} documents in {len(stats['categories'])} categories",
+    )
+
+
+@toolfunc(DocumentStatsArgs)
+async def document_stats(args: DocumentStatsArgs, ctx: Optional[Context] = None) -> str:
+    """Report document store statistics: row counts, sizes, page fragmentation and query latency percentiles."""
+    result = await internal_document_stats(args, ctx)
+    return await tool_result("document_stats", result)
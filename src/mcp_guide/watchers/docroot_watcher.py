@@ -0,0 +1,204 @@
+"""Docroot watcher that publishes a change generation for content caches."""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from anyio import Path as AsyncPath
+
+from mcp_guide.core.mcp_log import get_logger
+from mcp_guide.core.path_watcher import PathWatcher, WatcherCallback
+
+logger = get_logger(__name__)
+
+# Polling interval for docroot tree scans, in seconds
+DOCROOT_POLL_INTERVAL = 2.0
+
+# File path -> (mtime_ns, size)
+_TreeState = dict[str, tuple[int, int]]
+
+DocrootListener = Callable[[frozenset[str]], None]
+
+_generation = 0
+_listeners: list[DocrootListener] = []
+_watchers: dict[str, "DocrootWatcher"] = {}
+_lock = threading.Lock()
+
+
+def get_docroot_generation() -> int:
+    """Return a counter that increases whenever a watched docroot changes.
+
+    Caches of docroot content record the generation they were filled at and treat
+    entries from an earlier generation as stale.
+    """
+    return _generation
+
+
+def add_docroot_listener(listener: DocrootListener) -> None:
+    """Register a function called with the changed file paths after each docroot change."""
+    with _lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+
+def remove_docroot_listener(listener: DocrootListener) -> None:
+    """Unregister a listener added with add_docroot_listener."""
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def notify_docroot_changed(paths: frozenset[str] = frozenset()) -> int:
+    """Advance the docroot generation and notify listeners.
+
+    Args:
+        paths: Files added, modified or removed (empty when unknown)
+
+    Returns:
+        The new generation
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        generation = _generation
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(paths)
+        except Exception as e:
+            logger.exception(f"Error in docroot listener: {e}")
+    return generation
+
+
+def is_watched(path: Union[str, Path]) -> bool:
+    """Return True if path lies under a docroot with a running watcher."""
+    target = str(path)
+    with _lock:
+        watchers = list(_watchers.values())
+    return any(watcher.is_running() and watcher.covers(target) for watcher in watchers)
+
+
+async def watch_docroot(docroot: Union[str, Path]) -> Optional["DocrootWatcher"]:
+    """Start watching docroot unless it is already watched.
+
+    Returns:
+        The running watcher, or None if docroot does not exist
+    """
+    root = str(Path(docroot).resolve())
+    if not await AsyncPath(root).is_dir():
+        return None
+    with _lock:
+        watcher = _watchers.get(root)
+        if watcher is None:
+            watcher = _watchers[root] = DocrootWatcher(root)
+        # Callers may refer to the docroot through a symlink or unresolved path
+        watcher.add_alias(os.path.abspath(docroot))
+    if not watcher.is_running():
+        # Take the baseline now so edits made before the first poll are still seen
+        await watcher.has_changed()
+        await watcher.start()
+    return watcher
+
+
+async def stop_docroot_watchers() -> None:
+    """Stop and forget every docroot watcher."""
+    with _lock:
+        watchers = list(_watchers.values())
+        _watchers.clear()
+    for watcher in watchers:
+        await watcher.stop()
+
+
+def _scan(root: str) -> _TreeState:
+    """Stat every file below root, following symlinked directories as discovery does."""
+    state: _TreeState = {}
+    visited: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        # Guard against symlink cycles by tracking resolved paths
+        real = os.path.realpath(dirpath)
+        if real in visited:
+            dirnames[:] = []
+            continue
+        visited.add(real)
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+class DocrootWatcher(PathWatcher):
+    """Watch every file below a docroot, not just the directory entry itself.
+
+    Each poll scans the tree in a worker thread and compares file mtimes and
+    sizes, so edits inside nested category directories are seen as well as
+    additions and removals. Symlinked directories are followed, as discovery
+    follows them, and files are reported under their path below the docroot.
+    """
+
+    def __init__(
+        self,
+        docroot: Union[str, Path],
+        callback: Optional[WatcherCallback] = None,
+        poll_interval: float = DOCROOT_POLL_INTERVAL,
+    ):
+        """Initialize DocrootWatcher.
+
+        Args:
+            docroot: Document root directory (validated on first check)
+            callback: Optional callback for change notifications
+            poll_interval: Polling interval in seconds
+        """
+        super().__init__(docroot, callback, poll_interval)
+        self._state: _TreeState = {}
+        self._roots: tuple[str, ...] = (self.path,)
+
+    @property
+    def docroot(self) -> str:
+        """Get the watched docroot path."""
+        return self.path
+
+    def add_alias(self, path: str) -> None:
+        """Also treat paths below path as covered by this watcher."""
+        if path not in self._roots:
+            self._roots += (path,)
+
+    def covers(self, path: str) -> bool:
+        """Return True if path is the docroot or lies below it."""
+        return any(path == root or path.startswith(os.path.join(root, "")) for root in self._roots)
+
+    async def has_changed(self) -> bool:
+        """Scan the docroot and publish a new generation if any file changed."""
+        if not self._initialized:
+            if not await AsyncPath(self.path).is_dir():
+                raise FileNotFoundError(f"Path does not exist: {self.path}")
+            self._state = await asyncio.to_thread(_scan, self.path)
+            self._initialized = True
+            return False
+
+        state = await asyncio.to_thread(_scan, self.path)
+        if state == self._state:
+            return False
+
+        changed = frozenset(
+            path for path in state.keys() | self._state.keys() if state.get(path) != self._state.get(path)
+        )
+        self._state = state
+        if len(self._roots) > 1:
+            # Report each path under every name callers may use for the docroot
+            prefix = os.path.join(self.path, "")
+            changed |= frozenset(
+                os.path.join(alias, path[len(prefix) :])
+                for alias in self._roots[1:]
+                for path in changed
+                if path.startswith(prefix)
+            )
+        logger.debug(f"Docroot changed: {len(changed)} file(s) under {self.path}")
+        notify_docroot_changed(changed)
+        await self._invoke_callbacks()
+        return True
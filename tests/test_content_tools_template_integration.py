@@ -140,3 +140,51 @@ Current status: active""")
 
             # Verify file was skipped (not in files list)
             assert len(files) == 0
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("concurrency", [1, 3, 16])
+    async def test_read_and_render_keeps_input_order(self, tmp_path, concurrency):
+        """Concurrent processing keeps file and error order deterministic."""
+        files = []
+        for i in range(10):
+            name = f"doc{i}.md.mustache"
+            if i % 4 != 3:
+                (tmp_path / name).write_text(f"Doc {i} for {{{{name}}}}")
+            # Every fourth file is missing and reports an error instead
+            files.append(FileInfo(path=Path(name), size=0, content_size=0, mtime=datetime.now(), name=name))
+
+        errors = await read_and_render_file_contents(
+            files, tmp_path, tmp_path, TemplateContext({"name": "x"}), concurrency=concurrency
+        )
+
+        assert [f.content for f in files] == [f"Doc {i} for x" for i in range(10) if i % 4 != 3]
+        assert [error.split("'")[1] for error in errors] == ["doc3.md.mustache", "doc7.md.mustache"]
+
+    @pytest.mark.anyio
+    async def test_read_and_render_file_contents_leaves_lazy_sections_unbuilt(self, tmp_path):
+        """Test that rendering a template that does not use tasks or openspec never builds them."""
+        from functools import partial
+        from unittest.mock import MagicMock
+
+        from mcp_guide.render.cache import TemplateContextCache
+        from mcp_guide.render.context import LazyValue
+
+        (tmp_path / "hello.md.mustache").write_text("Hello {{name}}")
+        file_info = FileInfo(
+            path=Path("hello.md.mustache"), size=14, content_size=14, mtime=datetime.now(), name="hello.md"
+        )
+        task_manager = MagicMock()
+        context = TemplateContext(
+            {
+                "name": "World",
+                "tasks": LazyValue(partial(TemplateContextCache._build_task_statistics, task_manager)),
+                "openspec": LazyValue(partial(TemplateContextCache._build_openspec_context, task_manager)),
+            }
+        )
+
+        errors = await read_and_render_file_contents([file_info], tmp_path, tmp_path, context)
+
+        assert errors == []
+        assert file_info.content == "Hello World"
+        task_manager.get_task_statistics.assert_not_called()
+        task_manager.get_task_by_type.assert_not_called()
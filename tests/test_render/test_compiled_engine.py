@@ -0,0 +1,197 @@
+"""Conformance tests: the compiled Mustache engine must render exactly like chevron."""
+
+from pathlib import Path
+
+import chevron
+import pytest
+
+from mcp_guide.render.cache import get_template_contexts
+from mcp_guide.render.compiler import render_compiled
+from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.engine import (
+    ENGINE_CHEVRON,
+    ENGINE_COMPILED,
+    get_template_engine,
+    render_mustache,
+    set_template_engine,
+)
+from mcp_guide.render.frontmatter import parse_content_with_frontmatter
+from mcp_guide.render.renderer import render_template_content
+
+TEMPLATES_DIR = Path(__file__).parents[2] / "src" / "mcp_guide" / "templates"
+
+
+def _upper(text, render):
+    return render(text).upper()
+
+
+def _raw(text, render):
+    return f"<{text}>"
+
+
+def _nested_render(text, render):
+    return render("[{{x}}]") + render(text)
+
+
+# Cases modelled on the Mustache spec (interpolation, sections, inverted,
+# partials, delimiters, comments, lambdas) plus chevron-specific behaviour.
+SPEC_CASES = [
+    ("no tags", "Hello from {Mustache}!", {}, {}),
+    ("escaped", "{{x}} {{{x}}} {{&x}}", {"x": "& \" < > '"}, {}),
+    (
+        "numbers",
+        "{{i}} {{f}} {{zero}} {{false}} {{none}}",
+        {"i": 85, "f": 1.21, "zero": 0, "false": False, "none": None},
+        {},
+    ),
+    ("dotted", "{{a.b.c}} {{a.missing}} {{#a}}{{b.c}}{{/a}}", {"a": {"b": {"c": "deep"}}}, {}),
+    ("context miss", "[{{missing}}]", {}, {}),
+    ("implicit iterator", "{{#list}}({{.}}){{/list}}", {"list": ["a", 1, True, "b"]}, {}),
+    ("falsy list items", "{{#list}}[{{.}}]{{/list}}", {"list": [0, "", None, False, "x", []]}, {}),
+    (
+        "list of dicts",
+        "{{#items}}{{name}}:{{#tags}}{{.}},{{/tags}};{{/items}}",
+        {"items": [{"name": "a", "tags": ["t1", "t2"]}, {"name": "b", "tags": []}]},
+        {},
+    ),
+    ("truthy section", "{{#t}}yes{{/t}}{{#f}}no{{/f}}{{#s}}{{.}}{{/s}}", {"t": True, "f": False, "s": "str"}, {}),
+    ("dict section", "{{#d}}{{k}}-{{outer}}{{/d}}", {"d": {"k": "v"}, "outer": "o"}, {}),
+    ("empty dict and list", "{{#d}}x{{/d}}{{#l}}y{{/l}}{{^d}}D{{/d}}{{^l}}L{{/l}}", {"d": {}, "l": []}, {}),
+    ("inverted dot", "{{^missing}}[{{.}}]{{/missing}}", {"v": 1}, {}),
+    ("nested falsy", "{{#a}}{{#b}}x{{/b}}{{^b}}y{{/b}}{{/a}}", {"a": False, "b": True}, {}),
+    ("standalone lines", "Begin.\n{{#b}}\nInside\n{{/b}}\n  {{! comment }}\nEnd.\n", {"b": True}, {}),
+    ("standalone inverted", "|\n  {{^b}}\n  x\n  {{/b}}\n|", {"b": False}, {}),
+    ("crlf", "|\r\n{{#b}}\r\nx\r\n{{/b}}\r\n|", {"b": True}, {}),
+    ("comment", "12345{{! Comment Block! }}67890", {}, {}),
+    ("delimiters", "{{=<% %>=}}(<%text%>) <%={{ }}=%>{{text}}", {"text": "Hey!"}, {}),
+    ("partial", '"{{>text}}"', {}, {"text": "from partial"}),
+    ("partial context", "{{#d}}{{>p}}{{/d}}", {"d": {"x": "in"}}, {"p": "*{{x}}*"}),
+    ("partial standalone indent", "\\\n  {{>p}}\n/", {"c": "<\n->"}, {"p": "|\n{{{c}}}\n|\n"}),
+    ("partial inline indent", "  x {{>p}}|", {}, {"p": "a\nb"}),
+    ("partial in list", "{{#l}}\n  {{>p}}\n{{/l}}", {"l": [{"n": 1}, {"n": 2}]}, {"p": "n={{n}}\nnext\n"}),
+    (
+        "recursive partial",
+        "{{>node}}",
+        {"content": "X", "nodes": [{"content": "Y", "nodes": []}]},
+        {"node": "{{content}}<{{#nodes}}{{>node}}{{/nodes}}>"},
+    ),
+    ("missing partial", "[{{>nope}}]", {}, {}),
+    ("lambda", "{{#upper}}hi {{name}}{{/upper}}", {"upper": _upper, "name": "bob"}, {}),
+    ("lambda raw text", "{{#raw}}a {{b}} {{&c}} {{#d}}e{{/d}} {{^f}}g{{/f}} {{>h}}{{/raw}}", {"raw": _raw}, {}),
+    ("lambda nested render", "{{#l}}{{#n}}{{x}}{{/n}}{{/l}}", {"l": {"n": _nested_render, "x": "1"}, "x": "0"}, {}),
+    ("lambda as variable", "{{fn}}", {"fn": _raw}, {}),
+    (
+        "same key nesting",
+        "{{#q}}Q: {{#q}}{{value}}{{^last}}, {{/last}}{{/q}}{{/q}}",
+        {"q": [{"value": "a", "last": False}, {"value": "b", "last": True}]},
+        {},
+    ),
+    ("same key nesting dict", "{{#a}}{{#a}}x{{/a}}{{/a}}", {"a": {"a": 1}}, {}),
+    ("same key inverted in list", "{{#a}}{{^a}}n{{/a}}y{{/a}}|", {"a": [1, 2]}, {}),
+    ("same key lambda", "{{#a}}{{#a}}x{{/a}}{{/a}}|", {"a": _raw}, {}),
+]
+
+
+@pytest.mark.parametrize("template,data,partials", [c[1:] for c in SPEC_CASES], ids=[c[0] for c in SPEC_CASES])
+def test_spec_cases_match_chevron(template, data, partials):
+    def outcome(render):
+        # Some chevron quirks end in an exception; the compiled engine must fail the same way
+        try:
+            return render()
+        except Exception as e:
+            return type(e)
+
+    expected = outcome(lambda: chevron.render(template, data, partials_dict=dict(partials)))
+    assert outcome(lambda: render_compiled(template, data, dict(partials))) == expected
+
+
+def test_same_key_lambda_calls_match_chevron():
+    """A template handed to chevron must not have already run its earlier lambdas."""
+    template = "{{#fn}}A{{/fn}}|{{#fn}}B{{#fn}}C{{/fn}}{{/fn}}"
+
+    def calls(render):
+        texts = []
+
+        def fn(text, render_text):
+            texts.append(text)
+            return render_text(text)
+
+        output = render(template, {"fn": fn})
+        return output, texts
+
+    assert calls(lambda t, d: render_compiled(t, d, {})) == calls(lambda t, d: chevron.render(t, d))
+
+
+def test_context_chain_matches_chevron():
+    context = TemplateContext({"project": {"name": "p"}, "items": [1, 2]}).new_child({"local": "l"})
+    template = (
+        "{{project.name}} {{local}} {{#items}}{{value}}{{^last}},{{/last}}{{/items}} {{items.length}} {{items.1.value}}"
+    )
+    assert render_compiled(template, context, {}) == chevron.render(template, context)
+
+
+def test_render_mustache_uses_selected_engine():
+    original = get_template_engine()
+    try:
+        set_template_engine(ENGINE_CHEVRON)
+        assert render_mustache("{{x}}", {"x": 1}) == "1"
+        set_template_engine(ENGINE_COMPILED)
+        assert render_mustache("{{x}}", {"x": 1}) == "1"
+        with pytest.raises(ValueError):
+            set_template_engine("handlebars")
+    finally:
+        set_template_engine(original)
+
+
+def _template_files() -> list[Path]:
+    return sorted(TEMPLATES_DIR.rglob("*.mustache"))
+
+
+def _overlay() -> dict:
+    """Populated values so conditional sections in the bundled templates are exercised."""
+    return {
+        "workflow": {
+            "file": ".guide.yaml",
+            "issue": "issue-1",
+            "description": "desc",
+            "plan": "plan.md",
+            "queue": ["a", "b"],
+            "phase": "discussion",
+            "phases": {"discussion": True, "planning": True, "implementation": True, "check": True, "review": True},
+            "consent": {"entry": True, "exit": True},
+            "next": {"value": "planning"},
+        },
+        "openspec": {"enabled": True, "version": "1.0"},
+        "args": ["one", "two"],
+        "kwargs": {"verbose": True},
+        "category": {"name": "docs", "dir": "docs/", "patterns": ["*.md"]},
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("populated", [False, True], ids=["base", "populated"])
+async def test_bundled_templates_match_chevron(populated):
+    base = await get_template_contexts()
+    context = base.new_child(_overlay()) if populated else base
+    original = get_template_engine()
+    mismatches = []
+    try:
+        for path in _template_files():
+            parsed = parse_content_with_frontmatter(path.read_text(encoding="utf-8"))
+            outputs = []
+            for engine in (ENGINE_CHEVRON, ENGINE_COMPILED):
+                set_template_engine(engine)
+                result = await render_template_content(
+                    parsed.content,
+                    context,
+                    file_path=str(path),
+                    metadata=dict(parsed.frontmatter),
+                    base_dir=path.parent,
+                )
+                outputs.append((result.success, result.value if result.success else result.error))
+            if outputs[0] != outputs[1]:
+                mismatches.append(str(path.relative_to(TEMPLATES_DIR)))
+    finally:
+        set_template_engine(original)
+    assert _template_files()
+    assert mismatches == []
@@ -0,0 +1,143 @@
+"""Tests for render dependency records and the dependency graph."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from mcp_guide.discovery.files import FileInfo
+from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.dependencies import (
+    DependencyFlagListener,
+    DependencyGraph,
+    DependencyRecord,
+    collect_dependencies,
+    note_dependencies,
+)
+from mcp_guide.render.memo import clear_output_cache
+from mcp_guide.render.partials import clear_partial_cache
+from mcp_guide.render.template import render_template
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    clear_output_cache()
+    clear_partial_cache()
+    yield
+    clear_output_cache()
+    clear_partial_cache()
+
+
+def _file_info(path) -> FileInfo:
+    return FileInfo(
+        path=path,
+        size=path.stat().st_size,
+        content_size=0,
+        mtime=datetime.fromtimestamp(path.stat().st_mtime),
+        name=path.name,
+    )
+
+
+def test_nested_collectors_share_dependencies():
+    with collect_dependencies() as outer:
+        note_dependencies(files=("/a",))
+        with collect_dependencies() as inner:
+            note_dependencies(partials=("/b",), flags=("openspec",))
+
+    assert inner.record() == DependencyRecord(
+        files=frozenset({"/b"}), partials=frozenset({"/b"}), flags=frozenset({"openspec"})
+    )
+    assert outer.record().files == {"/a", "/b"}
+
+
+def test_note_without_collector_is_noop():
+    note_dependencies(files=("/a",))
+
+
+@pytest.mark.anyio
+async def test_rendered_content_records_dependencies(tmp_path):
+    (tmp_path / "_note.md").write_text("---\nrequires-openspec: true\n---\nNote")
+    template = tmp_path / "doc.md.mustache"
+    template.write_text("---\nrequires-workflow: true\nincludes:\n  - _note\n---\n{{name}} {{>note}}")
+
+    result = await render_template(
+        file_info=_file_info(template),
+        base_dir=tmp_path,
+        project_flags={"workflow": True, "openspec": True},
+        context=TemplateContext({"name": "World"}),
+    )
+
+    assert result is not None
+    dependencies = result.dependencies
+    assert str(template) in dependencies.files
+    assert dependencies.partials == {str(tmp_path / "_note.md")}
+    assert dependencies.flags == {"workflow", "openspec"}
+    assert "name" in dependencies.context_keys
+
+
+def test_file_change_invalidates_dependents():
+    graph = DependencyGraph()
+    invalidated = []
+    graph.subscribe(invalidated.append)
+    graph.record("a", DependencyRecord(files=frozenset({"/docs/a.md"})))
+    graph.record("b", DependencyRecord(files=frozenset({"/docs/b.md"})))
+
+    assert graph.files_changed(frozenset({"/docs/a.md"})) == {"a"}
+    assert invalidated == [frozenset({"a"})]
+    assert graph.get_record("a") is None
+    assert graph.get_record("b") is not None
+
+
+def test_new_file_invalidates_directory_dependents():
+    graph = DependencyGraph()
+    graph.record("topic", DependencyRecord(directories=frozenset({"/docs/policies/git/"})))
+    graph.record("other", DependencyRecord(directories=frozenset({"/docs/policies/style"})))
+
+    assert graph.files_changed(frozenset({"/docs/policies/git/ops/new.md"})) == {"topic"}
+
+
+def test_unknown_change_invalidates_everything():
+    graph = DependencyGraph()
+    graph.record("a", DependencyRecord(files=frozenset({"/a"})))
+    graph.record("b", DependencyRecord())
+
+    assert graph.files_changed(frozenset()) == {"a", "b"}
+    assert graph.get_stats() == {"invalidated": 2, "records": 0}
+
+
+def test_flag_change_invalidates_flag_dependents():
+    graph = DependencyGraph()
+    graph.record("openspec", DependencyRecord(flags=frozenset({"openspec"})))
+    graph.record("workflow", DependencyRecord(flags=frozenset({"workflow"})))
+    graph.record("reads_flags", DependencyRecord(context_keys=frozenset({"feature_flags"})))
+    graph.record("plain", DependencyRecord(context_keys=frozenset({"name"})))
+
+    assert graph.flags_changed({"openspec"}) == {"openspec", "reads_flags"}
+    assert graph.flags_changed() == {"workflow"}
+    assert graph.get_record("plain") is not None
+
+
+@pytest.mark.anyio
+async def test_flag_listener_reports_changed_flags():
+    graph = DependencyGraph()
+    flags = {"openspec": True, "workflow": False}
+
+    async def resolve(session):
+        return dict(flags)
+
+    listener = DependencyFlagListener()
+    with (
+        patch("mcp_guide.render.dependencies.get_dependency_graph", return_value=graph),
+        patch("mcp_guide.models.resolve_all_flags", resolve),
+        patch.object(graph, "flags_changed") as flags_changed,
+    ):
+        await listener.on_config_changed(None)
+        flags_changed.assert_called_once_with()
+
+        flags["workflow"] = True
+        await listener.on_config_changed(None)
+        flags_changed.assert_called_with({"workflow"})
+
+        flags_changed.reset_mock()
+        await listener.on_project_changed(None, "a", "a")
+        flags_changed.assert_not_called()
@@ -0,0 +1,118 @@
+"""Tests for rendered-output memoisation."""
+
+import time
+
+import pytest
+
+from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.memo import clear_output_cache, get_output_cache_stats, impure, is_impure
+from mcp_guide.render.renderer import render_template_content
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo():
+    clear_output_cache()
+    yield
+    clear_output_cache()
+
+
+async def _render(content: str, data: dict, **kwargs) -> str:
+    result = await render_template_content(content, TemplateContext(data), **kwargs)
+    assert result.success, result.error
+    return result.value[0]
+
+
+@pytest.mark.anyio
+async def test_repeat_render_served_from_memo():
+    assert await _render("Hi {{project.name}}", {"project": {"name": "demo"}}) == "Hi demo"
+    assert await _render("Hi {{project.name}}", {"project": {"name": "demo"}}) == "Hi demo"
+
+    stats = get_output_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+
+@pytest.mark.anyio
+async def test_changed_read_value_renders_again():
+    assert await _render("Hi {{project.name}}", {"project": {"name": "one"}}) == "Hi one"
+    assert await _render("Hi {{project.name}}", {"project": {"name": "two"}}) == "Hi two"
+
+    assert get_output_cache_stats()["hits"] == 0
+
+
+@pytest.mark.anyio
+async def test_unread_values_do_not_affect_memo():
+    await _render("Hi {{name}}", {"name": "demo", "other": 1})
+    assert await _render("Hi {{name}}", {"name": "demo", "other": 2}) == "Hi demo"
+
+    assert get_output_cache_stats()["hits"] == 1
+
+
+@pytest.mark.anyio
+async def test_branch_reads_tracked():
+    template = "{{#flag}}{{a}}{{/flag}}{{^flag}}{{b}}{{/flag}}"
+    assert await _render(template, {"flag": True, "a": "A", "b": "B1"}) == "A"
+    # b is not read while flag is set
+    assert await _render(template, {"flag": True, "a": "A", "b": "B2"}) == "A"
+    assert await _render(template, {"flag": False, "a": "A", "b": "B2"}) == "B2"
+    assert await _render(template, {"flag": False, "a": "A", "b": "B3"}) == "B3"
+
+    assert get_output_cache_stats()["hits"] == 1
+
+
+@pytest.mark.anyio
+async def test_values_rendering_differently_are_distinct():
+    assert await _render("{{v}}", {"v": 1}) == "1"
+    assert await _render("{{v}}", {"v": True}) == "True"
+    assert await _render("{{v}}", {"v": 1.0}) == "1.0"
+
+
+@pytest.mark.anyio
+async def test_lambda_context_reads_tracked():
+    template = "{{#equals}}prod{{env}}live{{/equals}}"
+    assert await _render(template, {"env": "prod"}) == "live"
+    assert await _render(template, {"env": "dev"}) == ""
+    assert await _render(template, {"env": "prod"}) == "live"
+
+    assert get_output_cache_stats()["hits"] == 1
+
+
+@pytest.mark.anyio
+async def test_impure_lambda_bypasses_memo():
+    template = "{{#time_ago}}{{at}}{{/time_ago}}"
+    data = {"at": time.time() - 3 * 3600}
+
+    assert await _render(template, data) == await _render(template, data)
+
+    stats = get_output_cache_stats()
+    assert stats["bypassed"] == 2
+    assert stats["entries"] == 0
+
+
+def test_impure_marker():
+    @impure
+    def lam(text, render):
+        return text
+
+    assert is_impure(lam)
+    assert not is_impure(lambda text, render: text)
+
+
+@pytest.mark.anyio
+async def test_errors_and_partials_replayed_from_memo():
+    kwargs = {"partials": {"part": "[{{x}}]"}}
+    template = "{{>part}}{{#_error}}bad {{x}}{{/_error}}"
+
+    first = await render_template_content(template, TemplateContext({"x": "1"}), **kwargs)
+    second = await render_template_content(template, TemplateContext({"x": "1"}), **kwargs)
+
+    assert get_output_cache_stats()["hits"] == 1
+    assert first.value == second.value
+    assert second.value[0] == "[1]"
+    assert second.value[2] == ["bad 1"]
+
+
+@pytest.mark.anyio
+async def test_partial_content_is_part_of_identity():
+    assert await _render("{{>p}}", {"x": "1"}, partials={"p": "a{{x}}"}) == "a1"
+    assert await _render("{{>p}}", {"x": "1"}, partials={"p": "b{{x}}"}) == "b1"
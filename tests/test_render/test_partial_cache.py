@@ -0,0 +1,90 @@
+"""Tests for the process-wide partial cache."""
+
+import os
+
+import pytest
+
+from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.partials import clear_partial_cache, get_partial_cache_stats, load_partial_content
+from mcp_guide.watchers.docroot_watcher import stop_docroot_watchers, watch_docroot
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_partial_cache()
+    yield
+    clear_partial_cache()
+
+
+def _write(path, text: str) -> None:
+    """Write text and move the mtime forward so the change is always visible."""
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.anyio
+async def test_repeat_load_served_from_cache(tmp_path):
+    _write(tmp_path / "_part.md", "---\ntype: user/information\n---\nBody")
+
+    first = await load_partial_content(tmp_path / "_part", tmp_path)
+    second = await load_partial_content(tmp_path / "_part", tmp_path)
+
+    assert first == second == ("Body", {"type": "user/information"})
+    stats = get_partial_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+@pytest.mark.anyio
+async def test_unwatched_edit_detected_by_stat(tmp_path):
+    partial = tmp_path / "_part.md"
+    _write(partial, "one")
+    assert (await load_partial_content(partial, tmp_path))[0] == "one"
+
+    _write(partial, "two")
+    assert (await load_partial_content(partial, tmp_path))[0] == "two"
+
+
+@pytest.mark.anyio
+async def test_watched_edit_invalidated_by_watcher(tmp_path):
+    partial = tmp_path / "_part.md"
+    _write(partial, "one")
+    try:
+        watcher = await watch_docroot(tmp_path)
+        assert watcher is not None
+        assert (await load_partial_content(tmp_path / "_part", tmp_path))[0] == "one"
+
+        _write(partial, "two")
+        await watcher.has_changed()
+        assert (await load_partial_content(tmp_path / "_part", tmp_path))[0] == "two"
+
+        # A higher-priority file appearing changes how the partial resolves
+        _write(tmp_path / "_part", "exact")
+        await watcher.has_changed()
+        assert (await load_partial_content(tmp_path / "_part", tmp_path))[0] == "exact"
+    finally:
+        await stop_docroot_watchers()
+
+
+@pytest.mark.anyio
+async def test_requirements_evaluated_per_flag_values(tmp_path):
+    _write(tmp_path / "_part.md", "---\nrequires-feature: true\n---\nShown")
+
+    assert (await load_partial_content(tmp_path / "_part", tmp_path, {"feature": True}))[0] == "Shown"
+    assert (await load_partial_content(tmp_path / "_part", tmp_path, {"feature": False}))[0] == ""
+    assert (await load_partial_content(tmp_path / "_part", tmp_path, {"feature": True}))[0] == "Shown"
+    assert (await load_partial_content(tmp_path / "_part", tmp_path, {}))[0] == ""
+
+
+@pytest.mark.anyio
+async def test_rendered_fields_do_not_leak_into_cache(tmp_path):
+    _write(tmp_path / "_part.md", "---\ninstruction: Use {{name}}\n---\nBody")
+
+    _, first = await load_partial_content(tmp_path / "_part", tmp_path, TemplateContext({"name": "one"}))
+    _, second = await load_partial_content(tmp_path / "_part", tmp_path, TemplateContext({"name": "two"}))
+    _, raw = await load_partial_content(tmp_path / "_part", tmp_path)
+
+    assert first["instruction"] == "Use one"
+    assert second["instruction"] == "Use two"
+    assert raw["instruction"] == "Use {{name}}"
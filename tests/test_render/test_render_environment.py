@@ -0,0 +1,77 @@
+"""Tests for the shared render environment and its lambda table."""
+
+from collections import ChainMap
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.environment import RenderEnvironment, get_render_environment
+from mcp_guide.render.memo import clear_output_cache, is_impure
+from mcp_guide.render.renderer import render_template_content
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo():
+    clear_output_cache()
+    yield
+    clear_output_cache()
+
+
+def test_environment_is_shared():
+    assert get_render_environment() is get_render_environment()
+
+
+def test_highlighter_probed_once_per_environment():
+    with patch("importlib.util.find_spec", return_value=None) as find_spec:
+        environment = RenderEnvironment()
+        for _ in range(3):
+            environment.functions(ChainMap({}))
+
+    assert find_spec.call_count == 1
+    assert environment.functions(ChainMap({})).highlighter is environment.highlighter
+
+
+def test_lambda_table_keeps_purity():
+    lambdas = get_render_environment().lambdas
+
+    assert is_impure(lambdas["time_ago"])
+    assert not is_impure(lambdas["equals"])
+
+
+def test_lambda_outside_render_raises():
+    with pytest.raises(RuntimeError):
+        get_render_environment().lambdas["_error"]("message")
+
+
+def test_template_context_reuses_lambda_table():
+    environment = get_render_environment()
+    first = environment.template_context(TemplateContext({"a": 1}), {"template_name": "one"})
+    second = environment.template_context(TemplateContext({"a": 2}), {"template_name": "two"})
+
+    assert first.maps[1] is second.maps[1]
+    assert first["equals"] is second["equals"]
+    assert (first["a"], second["template_name"]) == (1, "two")
+
+
+@pytest.mark.anyio
+async def test_concurrent_renders_keep_their_own_state():
+    results = {}
+
+    async def render(name: str) -> None:
+        await anyio.sleep(0)
+        result = await render_template_content(
+            "{{#equals}}x{{v}}{{name}}{{/equals}}{{#_error}}failed {{name}}{{/_error}}",
+            TemplateContext({"v": "x", "name": name}),
+        )
+        results[name] = result.value
+
+    async with anyio.create_task_group() as tg:
+        for name in ("a", "b", "c"):
+            tg.start_soon(render, name)
+
+    for name in ("a", "b", "c"):
+        rendered, _, errors = results[name]
+        assert rendered == name
+        assert errors == [f"failed {name}"]
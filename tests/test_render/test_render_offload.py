@@ -0,0 +1,98 @@
+"""Tests for offloading large template renders to worker threads."""
+
+import threading
+
+import pytest
+
+from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.memo import clear_output_cache, get_output_cache_stats
+from mcp_guide.render.offload import (
+    clear_render_offload_stats,
+    get_render_offload_stats,
+    get_render_offload_thresholds,
+    set_render_offload_thresholds,
+    should_offload,
+)
+from mcp_guide.render.renderer import render_template_content
+
+
+@pytest.fixture(autouse=True)
+def offload_state():
+    thresholds = get_render_offload_thresholds()
+    clear_render_offload_stats()
+    clear_output_cache()
+    yield
+    set_render_offload_thresholds(*thresholds)
+    clear_render_offload_stats()
+    clear_output_cache()
+
+
+async def _render(content: str, data: dict, **kwargs) -> str:
+    result = await render_template_content(content, TemplateContext(data), **kwargs)
+    assert result.success, result.error
+    return result.value[0]
+
+
+def test_should_offload_thresholds():
+    set_render_offload_thresholds(chars=20, tokens=0)
+    assert not should_offload("{{a}}", {})
+    assert should_offload("{{a}}", {"p": "x" * 20})
+
+    set_render_offload_thresholds(chars=0, tokens=4)
+    assert not should_offload("{{a}}{{b}}", {})
+    assert should_offload("{{a}}{{b}}", {"p": "{{c}}{{d}}"})
+
+    set_render_offload_thresholds(chars=0, tokens=0)
+    assert not should_offload("x" * 100_000, {})
+
+
+def test_negative_threshold_rejected():
+    with pytest.raises(ValueError):
+        set_render_offload_thresholds(chars=-1, tokens=0)
+
+
+@pytest.mark.anyio
+async def test_small_render_stays_inline():
+    set_render_offload_thresholds(chars=1000, tokens=1000)
+    assert await _render("Hi {{name}}", {"name": "demo"}) == "Hi demo"
+
+    stats = get_render_offload_stats()
+    assert stats["inline"] == 1
+    assert stats["offloaded"] == 0
+
+
+@pytest.mark.anyio
+async def test_large_render_runs_on_worker_thread():
+    set_render_offload_thresholds(chars=0, tokens=1)
+    threads = []
+
+    def where(text, render):
+        threads.append(threading.current_thread())
+        return render(text)
+
+    assert await _render("{{#where}}Hi {{name}}{{/where}}", {"name": "demo", "where": where}) == "Hi demo"
+
+    assert threads and threads[0] is not threading.main_thread()
+    stats = get_render_offload_stats()
+    assert stats["offloaded"] == 1
+    assert stats["inline"] == 0
+
+
+@pytest.mark.anyio
+async def test_offloaded_render_records_memo_reads():
+    set_render_offload_thresholds(chars=1, tokens=0)
+    assert await _render("Hi {{name}}", {"name": "demo"}) == "Hi demo"
+    assert await _render("Hi {{name}}", {"name": "demo"}) == "Hi demo"
+    assert await _render("Hi {{name}}", {"name": "other"}) == "Hi other"
+
+    assert get_output_cache_stats()["hits"] == 1
+    assert get_render_offload_stats()["offloaded"] == 2
+
+
+@pytest.mark.anyio
+async def test_offloaded_syntax_error_reported():
+    set_render_offload_thresholds(chars=1, tokens=0)
+    result = await render_template_content("{{#open}}", TemplateContext({}))
+
+    assert not result.success
+    assert "Template syntax error" in result.error
@@ -0,0 +1,86 @@
+"""Tests for compiled requires-* predicates and flag-state generations."""
+
+import pytest
+
+from mcp_guide.render.frontmatter import check_frontmatter_requirements
+from mcp_guide.render.requires import (
+    FlagState,
+    check_requires_directive,
+    clear_requirement_cache,
+    compile_requirements,
+    get_requirement_cache_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_requirement_cache()
+    yield
+    clear_requirement_cache()
+
+
+@pytest.mark.parametrize(
+    ("required", "actual", "expected"),
+    [
+        (True, "value", True),
+        (True, None, False),
+        (False, None, True),
+        (["discussion"], ["discussion", "planning"], True),
+        (["deployment"], ["discussion", "planning"], False),
+        (["implementation"], {"implementation": ["entry"]}, True),
+        (["a", "b"], "b", True),
+        ("exact", "exact", True),
+        ("exact", "other", False),
+    ],
+)
+def test_compiled_predicate_matches_directive(required, actual, expected):
+    assert check_requires_directive(required, actual) is expected
+    requirements = compile_requirements({"requires-flag": required})
+    assert requirements.evaluate({"flag": actual}) is expected
+    assert requirements.evaluate(FlagState({"flag": actual})) is expected
+
+
+def test_equal_directives_share_compiled_set():
+    first = compile_requirements({"description": "one", "requires-openspec": True})
+    second = compile_requirements({"description": "two", "requires-openspec": True})
+
+    assert first is second
+    assert first.flags == ("openspec",)
+    assert get_requirement_cache_stats()["hits"] == 1
+
+
+def test_no_directives_always_met():
+    assert compile_requirements({"description": "x"}).evaluate(FlagState({})) is True
+
+
+def test_equal_flag_states_share_generation():
+    first = FlagState({"openspec": True, "workflow": ["discussion"]})
+    second = FlagState({"workflow": ["discussion"], "openspec": True})
+    changed = FlagState({"openspec": False, "workflow": ["discussion"]})
+
+    assert first.generation == second.generation
+    assert changed.generation != first.generation
+
+
+def test_outcome_memoised_per_generation(monkeypatch):
+    requirements = compile_requirements({"requires-openspec": True})
+    calls = []
+
+    def counting(flag_name, value):
+        calls.append(flag_name)
+        return value
+
+    monkeypatch.setattr("mcp_guide.render.requires.normalize_requires_value", counting)
+
+    assert requirements.evaluate(FlagState({"openspec": True}))
+    assert requirements.evaluate(FlagState({"openspec": True}))
+    assert not requirements.evaluate(FlagState({"openspec": False}))
+
+    assert calls == ["openspec", "openspec"]
+
+
+def test_workflow_flag_normalised():
+    frontmatter = {"requires-workflow": ["discussion"]}
+
+    assert check_frontmatter_requirements(frontmatter, FlagState({"workflow": True}))
+    assert not check_frontmatter_requirements(frontmatter, FlagState({"workflow": False}))
@@ -0,0 +1,63 @@
+"""Tests for the tokenised template cache."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from chevron import ChevronError
+
+from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.renderer import render_template_content
+from mcp_guide.render.tokens import clear_token_cache, file_key, get_token_cache_stats, get_tokens
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+def test_inline_text_tokenised_once():
+    first = get_tokens("Hello {{name}}")
+    second = get_tokens("Hello {{name}}")
+
+    assert first is second
+    assert get_token_cache_stats()["misses"] == 1
+    assert get_token_cache_stats()["hits"] == 1
+
+
+def test_file_key_changes_with_file_version():
+    mtime = datetime(2026, 1, 1)
+    key = file_key(Path("/docs/a.md.mustache"), mtime, 10, "body")
+
+    assert key == file_key(Path("/docs/a.md.mustache"), mtime, 10, "body")
+    assert key != file_key(Path("/docs/a.md.mustache"), datetime(2026, 1, 2), 10, "body")
+    assert key != file_key(Path("/docs/a.md.mustache"), mtime, 11, "body")
+    assert key != file_key(Path("/docs/a.md.mustache"), mtime, 10, "changed")
+
+
+def test_syntax_errors_not_cached():
+    with pytest.raises(ChevronError):
+        get_tokens("{{#open}}")
+    assert get_token_cache_stats()["entries"] == 0
+
+
+@pytest.mark.anyio
+async def test_render_reuses_template_and_partial_tokens():
+    key = file_key(Path("/docs/t.md.mustache"), datetime(2026, 1, 1), 20, "A {{>part}} {{x}}")
+
+    # A different value each time so the output memo cannot answer the render
+    for x in range(3):
+        context = TemplateContext({"x": str(x), "y": "2"})
+        result = await render_template_content(
+            "A {{>part}} {{x}}", context, partials={"part": "[{{y}}]"}, template_key=key
+        )
+        assert result.success
+        assert result.value[0] == f"A [2] {x}"
+
+    # Template and partial are each tokenised once; every later lookup is a hit
+    stats = get_token_cache_stats()
+    assert stats["misses"] == 2
+    assert stats["entries"] == 2
+    assert stats["hits"] >= 4
@@ -4,7 +4,8 @@ from collections import ChainMap
 
 import pytest
 
-from mcp_guide.render.context import TemplateContext
+from mcp_guide.render.context import IndexedList, LazyValue, TemplateContext
+from mcp_guide.render.renderer import render_template_content
 
 
 class TestTemplateContext:
@@ -114,3 +115,143 @@ class TestTemplateContext:
         # Grandchild should also have TemplateContext parents
         grandchild = child.new_child({"grandchild": "value"})
         assert isinstance(grandchild.parents, TemplateContext)
+
+    def test_new_child_reuses_parent_layers(self):
+        """Test that new_child() shares the parent's layers instead of rebuilding them."""
+        parent = TemplateContext({"items": ["a", "b"]}, {"base": "value"})
+        child = parent.new_child({"child": "value"})
+
+        assert child.maps[1:] == parent.maps
+        assert all(mine is theirs for mine, theirs in zip(child.maps[1:], parent.maps))
+
+    def test_lists_converted_once_on_first_access(self):
+        """Test that lists are wrapped lazily and the wrapped value is shared by children."""
+        parent = TemplateContext({"items": ["a", "b"]})
+        assert dict.__getitem__(parent.maps[0], "items") == ["a", "b"]
+
+        items = parent.new_child({})["items"]
+        assert items[0] == {"value": "a", "first": True, "last": False}
+        assert parent["items"] is items
+
+    def test_template_context_as_map_is_flattened(self):
+        """Test that a TemplateContext passed as a map contributes its layers directly."""
+        inner = TemplateContext({"a": 1}, {"b": 2})
+        outer = TemplateContext({"c": 3}).new_child(inner)
+
+        assert len(outer.maps) == 3
+        assert (outer["a"], outer["b"], outer["c"]) == (1, 2, 3)
+
+    def test_snapshot_flattens_and_shares_values(self):
+        """Test that snapshot() gives one read-only layer sharing the source values."""
+        nested = {"name": "demo"}
+        context = TemplateContext({"project": nested, "a": 1}).new_child({"a": 2})
+        items = TemplateContext({"items": ["x"]})
+        converted = items["items"]
+
+        snapshot = context.new_child(items).snapshot()
+
+        assert len(snapshot.maps) == 1
+        assert snapshot["a"] == 2
+        assert snapshot["project"] is nested
+        assert snapshot["items"] is converted
+        with pytest.raises(TypeError, match="read-only"):
+            snapshot["a"] = 3
+        with pytest.raises(TypeError, match="read-only"):
+            del snapshot["a"]
+
+
+class TestIndexedList:
+    """Test the lazy IndexedList view."""
+
+    def test_attribute_access_resolves_on_demand(self):
+        """Test that .N, .length, first and last resolve without stored attributes."""
+        items = IndexedList(["a", {"name": "b"}])
+
+        assert items.length == 2
+        assert getattr(items, "0") == {"value": "a", "first": True, "last": False}
+        assert getattr(items, "1") == {"name": "b", "first": False, "last": True}
+        assert not hasattr(items, "2")
+        assert not hasattr(items, "__dict__")
+
+    def test_wraps_without_copying(self):
+        """Test that the underlying list is shared and nested lists are wrapped on access."""
+        raw = [{"tags": ["x", "y"]}]
+        items = IndexedList(raw)
+        raw.append("late")
+
+        assert len(items) == 2
+        assert isinstance(items[0]["tags"], IndexedList)
+        assert items[0]["tags"][1] == {"value": "y", "first": False, "last": True}
+        assert raw[0]["tags"] == ["x", "y"]
+
+    def test_sequence_behaviour(self):
+        """Test indexing, iteration and comparison match the previous list semantics."""
+        items = IndexedList(["a", "b"])
+
+        assert items[-1]["value"] == "b"
+        assert [item["value"] for item in items] == ["a", "b"]
+        assert items == [{"value": "a", "first": True, "last": False}, {"value": "b", "first": False, "last": True}]
+        assert not IndexedList([])
+        with pytest.raises(TypeError):
+            items["0"]
+        with pytest.raises(IndexError):
+            items[2]
+
+
+class TestLazyValue:
+    """Test lazily provided context values."""
+
+    def test_sync_provider_runs_once_on_first_access(self):
+        """Test that a sync provider runs only when the value is first dereferenced."""
+        calls = []
+
+        def provider():
+            calls.append(1)
+            return ["a"]
+
+        context = TemplateContext({"tasks": LazyValue(provider)}).new_child({})
+        assert calls == []
+
+        assert context["tasks"][0]["value"] == "a"
+        assert context["tasks"] is context["tasks"]
+        assert calls == [1]
+
+    @pytest.mark.anyio
+    async def test_async_provider_resolved_by_name(self):
+        """Test that async providers show their default until resolved, and only named ones resolve."""
+        calls = []
+
+        async def projects():
+            calls.append("projects")
+            return {"projects": ["p"]}
+
+        async def other():
+            calls.append("other")
+            return 1
+
+        context = TemplateContext({"projects": LazyValue(projects, {}), "other": LazyValue(other, 0)})
+        assert context["projects"] == {}
+
+        await context.resolve_lazy({"projects", "missing"})
+        assert calls == ["projects"]
+        assert context["projects"]["projects"][0]["value"] == "p"
+        assert context["other"] == 0
+
+    @pytest.mark.anyio
+    async def test_render_resolves_only_referenced_sections(self):
+        """Test that rendering fetches async sections named by the template or its partials."""
+        calls = []
+
+        async def provider():
+            calls.append(1)
+            return 3
+
+        base = TemplateContext({"projects_count": LazyValue(provider, 0)})
+
+        result = await render_template_content("Hello", base)
+        assert result.value[0] == "Hello"
+        assert calls == []
+
+        result = await render_template_content("{{>count}}", base, partials={"count": "{{projects_count}} projects"})
+        assert result.value[0] == "3 projects"
+        assert calls == [1]
@@ -6,6 +6,7 @@ import pytest
 
 from mcp_guide.feature_flags.types import FeatureValue
 from mcp_guide.render.cache import TemplateContextCache
+from mcp_guide.render.context import IndexedList
 
 
 class TestTemplateContextCache:
@@ -95,7 +96,7 @@ class TestTemplateContextCache:
             assert "project" in context
             assert "project_flag_values" in context["project"]
             flags_list = context["project"]["project_flag_values"]
-            assert isinstance(flags_list, list)
+            assert isinstance(flags_list, IndexedList)
 
             # Convert back to dict for easier testing
             flags_dict = {item["key"]: item["value"] for item in flags_list}
@@ -325,6 +326,68 @@ class TestTemplateContextCache:
             assert "project" in context
             assert context["project"]["name"] == "integration-test"
 
+    @pytest.mark.anyio
+    async def test_cached_context_is_flat_read_only_snapshot(self) -> None:
+        """Test that the cached base context is one read-only layer reused until invalidated."""
+        from unittest.mock import patch
+
+        from mcp_guide.models import Project
+
+        cache = TemplateContextCache()
+        mock_session = Mock()
+        mock_session.agent_info = None
+        mock_session.get_project = AsyncMock(return_value=Project(name="snap", categories={}, collections={}))
+
+        with patch("mcp_guide.session.get_session", return_value=mock_session):
+            context = await cache.get_template_contexts()
+            assert await cache.get_template_contexts() is context
+
+        assert len(context.maps) == 1
+        assert context["project"]["name"] == "snap"
+        assert "server" in context
+        with pytest.raises(TypeError, match="read-only"):
+            context["project"] = {}
+
+        child = context.new_child({"project": {"name": "overlay"}})
+        assert child["project"]["name"] == "overlay"
+        assert context["project"]["name"] == "snap"
+
+        cache.invalidate()
+        with patch("mcp_guide.session.get_session", return_value=mock_session):
+            assert await cache.get_template_contexts() is not context
+
+    @pytest.mark.anyio
+    async def test_category_context_layers_on_cached_snapshot(self) -> None:
+        """Test that category contexts share the cached base snapshot instead of rebuilding it."""
+        from unittest.mock import patch
+
+        from mcp_guide.models import Category, Project
+
+        cache = TemplateContextCache()
+        mock_session = Mock()
+        mock_session.agent_info = None
+        mock_session.get_project = AsyncMock(
+            return_value=Project(
+                name="snap",
+                categories={
+                    "docs": Category(dir="docs", patterns=["*.md"]),
+                    "guide": Category(dir="guide", patterns=["*.md"]),
+                },
+                collections={},
+            )
+        )
+
+        with patch("mcp_guide.session.get_session", return_value=mock_session):
+            docs = await cache.get_template_contexts("docs")
+            guide = await cache.get_template_contexts("guide")
+            base = await cache.get_template_contexts()
+
+        assert docs["category"]["name"] == "docs"
+        assert guide["category"]["name"] == "guide"
+        assert docs["project"]["name"] == "snap"
+        assert docs.maps[0] is base.maps[0]
+        assert guide.maps[0] is base.maps[0]
+
     def test_get_transient_context_structure(self) -> None:
         """Test that get_transient_context returns correct structure and types."""
         from mcp_guide.render.context import TemplateContext
@@ -0,0 +1,122 @@
+"""Tests for DocrootWatcher and the docroot change generation."""
+
+import os
+
+import pytest
+
+from mcp_guide.watchers.docroot_watcher import (
+    DocrootWatcher,
+    add_docroot_listener,
+    get_docroot_generation,
+    is_watched,
+    remove_docroot_listener,
+    stop_docroot_watchers,
+    watch_docroot,
+)
+
+
+def _touch(path, text: str) -> None:
+    """Write text and move the mtime forward so the change is always visible."""
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestDocrootWatcher:
+    """Test DocrootWatcher change detection."""
+
+    @pytest.mark.anyio
+    async def test_requires_existing_directory(self, tmp_path):
+        watcher = DocrootWatcher(tmp_path / "missing")
+        with pytest.raises(FileNotFoundError, match="Path does not exist"):
+            await watcher.has_changed()
+
+    @pytest.mark.anyio
+    async def test_nested_edit_advances_generation(self, tmp_path):
+        nested = tmp_path / "category" / "_part.md"
+        nested.parent.mkdir()
+        nested.write_text("one")
+
+        changes = []
+        add_docroot_listener(changes.append)
+        try:
+            watcher = DocrootWatcher(tmp_path)
+            assert await watcher.has_changed() is False
+            assert await watcher.has_changed() is False
+
+            generation = get_docroot_generation()
+            _touch(nested, "two")
+            assert await watcher.has_changed() is True
+        finally:
+            remove_docroot_listener(changes.append)
+
+        assert get_docroot_generation() == generation + 1
+        assert changes == [frozenset({str(nested)})]
+
+    @pytest.mark.anyio
+    async def test_added_and_removed_files_detected(self, tmp_path):
+        existing = tmp_path / "old.md"
+        existing.write_text("old")
+        watcher = DocrootWatcher(tmp_path)
+        await watcher.has_changed()
+
+        existing.unlink()
+        (tmp_path / "new.md").write_text("new")
+
+        changes = []
+        add_docroot_listener(changes.append)
+        try:
+            assert await watcher.has_changed() is True
+        finally:
+            remove_docroot_listener(changes.append)
+
+        assert changes == [frozenset({str(existing), str(tmp_path / "new.md")})]
+
+    @pytest.mark.anyio
+    async def test_symlinked_category_edit_detected(self, tmp_path):
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        partial = templates / "_part.md"
+        partial.write_text("one")
+        # A cycle back into the linked tree must not be followed forever
+        (templates / "loop").symlink_to(templates, target_is_directory=True)
+        docroot = tmp_path / "docroot"
+        docroot.mkdir()
+        (docroot / "category").symlink_to(templates, target_is_directory=True)
+
+        changes = []
+        add_docroot_listener(changes.append)
+        try:
+            watcher = DocrootWatcher(docroot)
+            await watcher.has_changed()
+
+            generation = get_docroot_generation()
+            _touch(partial, "two")
+            assert await watcher.has_changed() is True
+        finally:
+            remove_docroot_listener(changes.append)
+
+        assert get_docroot_generation() == generation + 1
+        assert changes == [frozenset({str(docroot / "category" / "_part.md")})]
+
+
+class TestWatchDocroot:
+    """Test the process-wide docroot watchers."""
+
+    @pytest.mark.anyio
+    async def test_watch_docroot_covers_paths_below_it(self, tmp_path):
+        try:
+            watcher = await watch_docroot(tmp_path)
+            assert watcher is not None and watcher.is_running()
+            assert await watch_docroot(tmp_path) is watcher
+
+            assert is_watched(tmp_path / "category" / "_part.md")
+            assert not is_watched(tmp_path.parent / "elsewhere.md")
+        finally:
+            await stop_docroot_watchers()
+
+        assert not is_watched(tmp_path / "category" / "_part.md")
+
+    @pytest.mark.anyio
+    async def test_missing_docroot_not_watched(self, tmp_path):
+        assert await watch_docroot(tmp_path / "missing") is None
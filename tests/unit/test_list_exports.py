@@ -150,3 +150,44 @@ async def test_list_exports_glob_filter(session_temp_dir, tmp_path, monkeypatch)
     exports = data["value"]
     assert len(exports) == 1
     assert exports[0]["expression"] == "api"
+
+
+@pytest.mark.anyio
+async def test_list_exports_answers_tracked_exports_from_memory(session_temp_dir, tmp_path, monkeypatch):
+    """Test list_exports reuses tracked file sets until a docroot event marks them changed."""
+    from mcp_guide.content import exports as export_tracking
+    from mcp_guide.content.gathering import gather_content
+    from mcp_guide.models.project import Category
+    from mcp_guide.tools.tool_content import compute_metadata_hash
+    from mcp_guide.watchers.docroot_watcher import notify_docroot_changed
+
+    monkeypatch.setattr(export_tracking, "is_watched", lambda path: True)
+    export_tracking.get_export_tracker().clear()
+
+    test_file = tmp_path / "tracked.md"
+    test_file.write_text("original content")
+    category = Category(name="tracked-cat", dir=str(tmp_path), patterns=["tracked.md"])
+
+    session = await get_session()
+    project = await session.get_project()
+    await session.update_config(lambda _: dc_replace(project, categories={"tracked-cat": category}, exports={}))
+
+    project = await session.get_project()
+    files = await gather_content(session, project, "tracked-cat", prefetch=False)
+    updated = project.upsert_export_entry("tracked-cat", None, str(tmp_path / "out.md"), compute_metadata_hash(files))
+    await session.update_config(lambda _: updated)
+
+    # First call gathers and tracks the export
+    data = json.loads(await list_exports(ListExportsArgs()))
+    assert data["value"][0]["stale_state"] == "ok"
+
+    # Later calls answer from the tracker without gathering
+    gather = AsyncMock(side_effect=AssertionError("gathered"))
+    monkeypatch.setattr("mcp_guide.tools.tool_content.gather_content", gather)
+    data = json.loads(await list_exports(ListExportsArgs()))
+    assert data["value"][0]["stale_state"] == "ok"
+
+    notify_docroot_changed(frozenset({str(test_file)}))
+    data = json.loads(await list_exports(ListExportsArgs()))
+    assert data["value"][0]["stale_state"] == "stale"
+    gather.assert_not_called()
@@ -0,0 +1,126 @@
+"""Tests for export staleness tracking."""
+
+import pytest
+
+from mcp_guide.content import exports
+from mcp_guide.content.exports import ExportTracker
+from mcp_guide.watchers.docroot_watcher import get_docroot_generation
+
+KEY = ("/docs", "project", "guide", None)
+STORE_GENERATION = 7
+
+
+@pytest.fixture
+def watched(monkeypatch):
+    monkeypatch.setattr(exports, "is_watched", lambda path: True)
+
+
+def _record(tracker: ExportTracker, **overrides) -> bool:
+    values = {
+        "metadata_hash": "abcd1234",
+        "files": ["/docs/guide/intro.md"],
+        "directories": ["/docs/guide/"],
+        "config": "config",
+        "store_generation": STORE_GENERATION,
+        "docroot_generation": get_docroot_generation(),
+    }
+    values.update(overrides)
+    return tracker.record(KEY, **values)
+
+
+def test_tracked_export_answers_lookup(watched):
+    tracker = ExportTracker()
+    assert _record(tracker)
+
+    entry = tracker.lookup(KEY, "config", STORE_GENERATION)
+
+    assert entry is not None
+    assert entry.metadata_hash == "abcd1234"
+    assert not entry.changed
+    assert tracker.get_stats() == {"hits": 1, "misses": 0, "invalidated": 0, "tracked": 1}
+
+
+def test_changed_file_marks_export_changed(watched):
+    tracker = ExportTracker()
+    _record(tracker)
+
+    tracker.files_changed(frozenset({"/docs/guide/intro.md"}))
+
+    entry = tracker.lookup(KEY, "config", STORE_GENERATION)
+    assert entry is not None
+    assert entry.changed
+
+
+def test_added_file_requires_gathering_again(watched):
+    tracker = ExportTracker()
+    _record(tracker)
+
+    tracker.files_changed(frozenset({"/docs/guide/new.md"}))
+
+    assert tracker.lookup(KEY, "config", STORE_GENERATION) is None
+
+
+def test_changes_elsewhere_are_ignored(watched):
+    tracker = ExportTracker()
+    _record(tracker)
+
+    tracker.files_changed(frozenset({"/docs/guidelines/intro.md", "/other/guide/intro.md"}))
+
+    entry = tracker.lookup(KEY, "config", STORE_GENERATION)
+    assert entry is not None
+    assert not entry.changed
+
+
+def test_unknown_change_requires_gathering_again(watched):
+    tracker = ExportTracker()
+    _record(tracker)
+
+    tracker.files_changed(frozenset())
+
+    assert tracker.lookup(KEY, "config", STORE_GENERATION) is None
+
+
+def test_other_configuration_or_store_generation_misses(watched):
+    tracker = ExportTracker()
+    _record(tracker, store_generation=STORE_GENERATION - 1)
+    assert tracker.lookup(KEY, "config", STORE_GENERATION) is None
+
+    _record(tracker)
+    assert tracker.lookup(KEY, "other config", STORE_GENERATION) is None
+
+
+def test_change_while_gathering_requires_gathering_again(watched):
+    tracker = ExportTracker()
+
+    _record(tracker, docroot_generation=get_docroot_generation() - 1)
+
+    assert tracker.lookup(KEY, "config", STORE_GENERATION) is None
+
+
+def test_unwatched_directory_is_not_tracked(monkeypatch):
+    monkeypatch.setattr(exports, "is_watched", lambda path: path != "/docs/guide")
+    tracker = ExportTracker()
+
+    assert not _record(tracker)
+    assert tracker.get_stats()["tracked"] == 0
+
+
+def test_claim_due_restarts_interval(watched):
+    tracker = ExportTracker(verify_interval=60.0)
+    _record(tracker)
+    assert tracker.claim_due([KEY]) == []
+
+    tracker.verify_interval = 0.0
+    assert tracker.claim_due([KEY]) == [KEY]
+
+    tracker.verify_interval = 60.0
+    assert tracker.claim_due([KEY]) == []
+
+
+def test_retain_forgets_removed_exports(watched):
+    tracker = ExportTracker()
+    _record(tracker)
+
+    tracker.retain(("/docs", "project"), [("/docs", "project", "other", None)])
+
+    assert tracker.get_stats()["tracked"] == 0
@@ -2,16 +2,29 @@
 
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
-from mcp_guide.content.gathering import gather_category_fileinfos, gather_content
-from mcp_guide.content.utils import _gather_policy_partials, render_missing_policy
+from mcp_guide.content.gathering import (
+    clear_gather_cache,
+    gather_category_fileinfos,
+    gather_content,
+    get_gather_cache_stats,
+)
+from mcp_guide.content.utils import (
+    _gather_policy_partials,
+    _policy_values,
+    clear_policy_cache,
+    get_policy_cache_stats,
+    render_missing_policy,
+)
 from mcp_guide.discovery.files import FileInfo
 from mcp_guide.models import Category, Collection, Project
 from mcp_guide.models.exceptions import NoProjectError
 from mcp_guide.render.context import TemplateContext
 from mcp_guide.result_constants import INSTRUCTION_MISSING_POLICY
+from mcp_guide.watchers.docroot_watcher import stop_docroot_watchers, watch_docroot
 
 
 def _make_file(name: str, *, source: str = "file") -> FileInfo:
@@ -102,6 +115,143 @@ async def test_stored_doc_deduped_across_overlapping_collections(tmp_path, monke
     assert len(stored_results) == 1
 
 
+@pytest.mark.anyio
+async def test_stored_content_prefetched_in_one_query(tmp_path, monkeypatch):
+    """Stored documents are loaded with one batched query instead of one per file."""
+    from unittest.mock import AsyncMock
+
+    from mcp_guide.store.document_store import DocumentRecord
+
+    (tmp_path / "docs").mkdir()
+    project = Project(
+        name="test",
+        categories={"docs": Category(dir="docs", name="docs", patterns=["*.md"])},
+    )
+    per_file_loader = AsyncMock(return_value="loaded individually")
+
+    async def mock_discover(category_dir, patterns, category=None):
+        return [
+            FileInfo(
+                path=Path(name),
+                size=0,
+                content_size=0,
+                mtime=datetime(2024, 1, 1),
+                name=name,
+                source="store",
+                content_loader=per_file_loader,
+            )
+            for name in ("a.md", "b.md")
+        ]
+
+    def _record(name: str) -> DocumentRecord:
+        return DocumentRecord(
+            id=1,
+            category="docs",
+            name=name,
+            source="x",
+            source_type="file",
+            metadata={},
+            created_at="2024-01-01T00:00:00",
+            updated_at="2024-01-01T00:00:00",
+            content=f"stored {name}",
+        )
+
+    batched = AsyncMock(return_value={"a.md": _record("a.md"), "b.md": _record("b.md")})
+    monkeypatch.setattr("mcp_guide.content.gathering.discover_documents", mock_discover)
+    monkeypatch.setattr("mcp_guide.content.gathering.get_documents", batched)
+
+    result = await gather_content(_MockSession(str(tmp_path)), project, "docs")
+
+    batched.assert_awaited_once_with("docs", ["a.md", "b.md"])
+    assert [await f.get_content() for f in result] == ["stored a.md", "stored b.md"]
+    assert [await f.read_raw() for f in result] == ["stored a.md", "stored b.md"]
+    per_file_loader.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_prefetch_disabled_leaves_content_unloaded(tmp_path, monkeypatch):
+    """Metadata-only callers can skip the content prefetch."""
+    from unittest.mock import AsyncMock
+
+    (tmp_path / "docs").mkdir()
+    project = Project(
+        name="test",
+        categories={"docs": Category(dir="docs", name="docs", patterns=["*.md"])},
+    )
+
+    async def mock_discover(category_dir, patterns, category=None):
+        return [
+            FileInfo(
+                path=Path("a.md"),
+                size=0,
+                content_size=0,
+                mtime=datetime(2024, 1, 1),
+                name="a.md",
+                source="store",
+                content_loader=AsyncMock(return_value="x"),
+            )
+        ]
+
+    batched = AsyncMock(return_value={})
+    monkeypatch.setattr("mcp_guide.content.gathering.discover_documents", mock_discover)
+    monkeypatch.setattr("mcp_guide.content.gathering.get_documents", batched)
+
+    result = await gather_content(_MockSession(str(tmp_path)), project, "docs", prefetch=False)
+
+    batched.assert_not_called()
+    assert result[0].content_pending
+
+
+@pytest.mark.anyio
+async def test_categories_discovered_concurrently_in_expression_order(tmp_path, monkeypatch):
+    """Categories are discovered at the same time, but results keep expression order."""
+    import anyio
+
+    names = ["slow", "fast", "mid"]
+    project = Project(
+        name="test",
+        categories={name: Category(dir=name, name=name, patterns=["*.md"]) for name in names},
+        collections={"all": Collection(categories=names)},
+    )
+    delays = {"slow": 0.05, "fast": 0.0, "mid": 0.02}
+    running = 0
+    peak = 0
+
+    async def mock_discover(category_dir, patterns, category=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await anyio.sleep(delays[category])
+        running -= 1
+        return [_make_file(f"{category}.md")]
+
+    monkeypatch.setattr("mcp_guide.content.gathering.discover_documents", mock_discover)
+
+    result = await gather_content(_MockSession(str(tmp_path)), project, "all", prefetch=False)
+
+    assert [f.name for f in result] == ["slow.md", "fast.md", "mid.md"]
+    assert peak == 3
+
+
+@pytest.mark.anyio
+async def test_first_discovery_failure_in_expression_order_is_raised(tmp_path, monkeypatch):
+    """A failing category raises its own exception, not an exception group."""
+    project = Project(
+        name="test",
+        categories={name: Category(dir=name, name=name, patterns=["*.md"]) for name in ("a", "b", "c")},
+    )
+
+    async def mock_discover(category_dir, patterns, category=None):
+        if category == "a":
+            return [_make_file("a.md")]
+        raise FileNotFoundError(f"Base directory not found: {category_dir}")
+
+    monkeypatch.setattr("mcp_guide.content.gathering.discover_documents", mock_discover)
+
+    with pytest.raises(FileNotFoundError, match="/b"):
+        await gather_content(_MockSession(str(tmp_path)), project, "a,b,c")
+
+
 # --- Tests for _ prefix exclusion in gather_category_fileinfos ---
 
 
@@ -455,3 +605,106 @@ async def test_gather_policy_partials_matching_topic_renders_content(tmp_path, m
 
     assert "git/ops" in result
     assert "Use conservative git ops." in result["git/ops"]
+
+
+@pytest.mark.anyio
+async def test_gather_policy_partials_cached_while_docroot_unchanged(tmp_path, monkeypatch):
+    """Watched docroot → a topic renders once until its files change, per flag set and read values."""
+    doc_file = tmp_path / "doc.md.mustache"
+    doc_file.write_text("---\npolicies:\n  - git/ops\n---\nContent.")
+    file_info = FileInfo(
+        path=doc_file,
+        size=doc_file.stat().st_size,
+        content_size=0,
+        mtime=datetime(2024, 1, 1),
+        name="doc.md",
+    )
+
+    policy = tmp_path / "policies" / "git" / "ops" / "conservative.md.mustache"
+    policy.parent.mkdir(parents=True)
+    policy.write_text("Be careful in {{repo}}.")
+
+    project = Project(
+        name="test",
+        categories={"policies": Category(dir="policies", name="policies", patterns=["git/ops/conservative*"])},
+    )
+    session = _MockSession(str(tmp_path), project=project)
+    monkeypatch.setattr("mcp_guide.content.utils.get_active_session", lambda: session)
+
+    clear_policy_cache()
+    try:
+        watcher = await watch_docroot(tmp_path)
+        assert watcher is not None
+
+        context = TemplateContext({"repo": "one"})
+        first = await _gather_policy_partials(file_info, context, {})
+        second = await _gather_policy_partials(file_info, context, {})
+        assert first == second
+        assert "Be careful in one." in first["git/ops"]
+        assert get_policy_cache_stats()["hits"] == 1
+
+        # A different value for a name the policy reads renders again
+        other = await _gather_policy_partials(file_info, TemplateContext({"repo": "two"}), {})
+        assert "Be careful in two." in other["git/ops"]
+
+        # Editing the policy invalidates the topic through the dependency graph
+        policy.write_text("Be bold in {{repo}}.")
+        await watcher.has_changed()
+        edited = await _gather_policy_partials(file_info, context, {})
+        assert "Be bold in one." in edited["git/ops"]
+        assert get_policy_cache_stats()["hits"] == 1
+    finally:
+        await stop_docroot_watchers()
+        clear_policy_cache()
+
+
+@pytest.mark.anyio
+async def test_gathered_files_cached_while_docroot_unchanged(tmp_path):
+    """Watched docroot → an expression is discovered once until a file changes; callers get independent copies."""
+    category_dir = tmp_path / "docs"
+    category_dir.mkdir()
+    (category_dir / "intro.md").write_text("Intro")
+
+    project = Project(name="test", categories={"docs": Category(dir="docs", name="docs", patterns=["*.md"])})
+    session = _MockSession(str(tmp_path))
+
+    clear_gather_cache()
+    try:
+        # Unwatched directories are discovered every time
+        await gather_content(session, project, "docs")
+        assert get_gather_cache_stats()["bypassed"] == 1
+
+        watcher = await watch_docroot(tmp_path)
+        assert watcher is not None
+
+        first = await gather_content(session, project, "docs")
+        first[0].content = "Changed by caller"
+        second = await gather_content(session, project, "docs")
+        assert [f.name for f in second] == ["intro.md"]
+        assert second[0] is not first[0]
+        assert second[0].content is None
+        assert get_gather_cache_stats()["hits"] == 1
+
+        # A different configuration is a different file set
+        other = Project(name="test", categories={"docs": Category(dir="docs", name="docs", patterns=["none*"])})
+        assert await gather_content(session, other, "docs") == []
+
+        (category_dir / "usage.md").write_text("Usage")
+        await watcher.has_changed()
+        assert get_gather_cache_stats()["entries"] == 0
+        third = await gather_content(session, project, "docs")
+        assert sorted(f.name for f in third) == ["intro.md", "usage.md"]
+        assert get_gather_cache_stats()["hits"] == 1
+    finally:
+        await stop_docroot_watchers()
+        clear_gather_cache()
+
+
+def test_policy_values_checks_lambdas_by_injected_name(monkeypatch):
+    """Impure lambdas are found through the lambda table, whatever their context name."""
+    monkeypatch.setattr(
+        "mcp_guide.content.utils.TEMPLATE_LAMBDAS", MappingProxyType({"ago": "time_ago", "upper": "truncate"})
+    )
+
+    assert _policy_values(frozenset({"ago"}), {}) is None
+    assert _policy_values(frozenset({"upper", "repo"}), {"repo": "one"}) is not None
@@ -0,0 +1,70 @@
+"""Tests for get_content response budgets and cursors."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from mcp_guide.content.pagination import (
+    BYTES_PER_TOKEN,
+    InvalidCursorError,
+    PageCursor,
+    decode_cursor,
+    encode_cursor,
+    parse_content_budget,
+    select_page,
+)
+from mcp_guide.discovery.files import FileInfo
+from mcp_guide.feature_flags.types import FeatureValue
+from mcp_guide.feature_flags.validators import validate_content_budget
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("48000", 48000),
+        ("48000 bytes", 48000),
+        ("12000 tokens", 12000 * BYTES_PER_TOKEN),
+        (FeatureValue("300 Tokens"), 300 * BYTES_PER_TOKEN),
+        ("100", None),
+        ("lots", None),
+        (True, None),
+        (None, None),
+    ],
+)
+def test_parse_content_budget(value, expected):
+    assert parse_content_budget(value) == expected
+
+
+def test_validate_content_budget():
+    assert validate_content_budget("2000 tokens", is_project=True)
+    assert not validate_content_budget("unlimited", is_project=False)
+
+
+def test_cursor_round_trip():
+    cursor = PageCursor(offset=3, files_hash="abcd1234", scope="0123456789ab")
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "WzEsLTEsbnVsbCwiIl0", "WzIsMSxudWxsLCIiXQ"])
+def test_malformed_cursor_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def _file(name: str, size: int) -> FileInfo:
+    return FileInfo(path=Path(name), size=size, content_size=size, mtime=datetime.now(), name=name)
+
+
+def test_select_page_fills_budget():
+    files = [_file("a", 100), _file("b", 100), _file("c", 100)]
+
+    assert select_page(files, 0, 250) == 2
+    assert select_page(files, 2, 250) == 3
+
+
+def test_select_page_holds_at_least_one_file():
+    files = [_file("a", 1000), _file("b", 10)]
+
+    assert select_page(files, 0, 500) == 1
@@ -0,0 +1,146 @@
+"""Tests for the precompiled docroot bundle."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mcp_guide.discovery.bundle import (
+    BUNDLE_FILE,
+    get_bundled_command,
+    get_bundled_text,
+    load_docroot_bundle,
+    read_docroot_text,
+    unload_docroot_bundles,
+    write_docroot_bundle,
+)
+from mcp_guide.discovery.commands import build_command_metadata
+from mcp_guide.installer.core import write_version
+from mcp_guide.render.frontmatter import clear_parsed_seeds, parse_content_with_frontmatter
+from mcp_guide.render.tokens import clear_token_cache, clear_token_seeds, get_token_cache_stats, get_tokens
+
+COMMAND = "---\ndescription: Show help\naliases:\n  - h\n  - 'info?verbose'\n---\nHelp for {{name}}\n"
+
+
+@pytest.fixture(autouse=True)
+def fresh_bundles():
+    unload_docroot_bundles()
+    yield
+    unload_docroot_bundles()
+    clear_parsed_seeds()
+    clear_token_seeds()
+    clear_token_cache()
+
+
+@pytest.fixture
+async def docroot(tmp_path: Path) -> Path:
+    root = tmp_path / "docs"
+    (root / "_commands").mkdir(parents=True)
+    (root / "_commands" / "help.mustache").write_text(COMMAND)
+    (root / "guide").mkdir()
+    (root / "guide" / "intro.md").write_text("---\ntype: user/information\n---\nIntro\n")
+    (root / "guide" / "dated.md").write_text("---\ncreated: 2024-01-01\n---\nDated\n")
+    await write_version(root, "1.0.0")
+    await write_docroot_bundle(root, "1.0.0")
+    return root
+
+
+def _touch(path: Path, text: str) -> None:
+    """Write text and move the mtime forward so the change is always visible."""
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.anyio
+async def test_bundle_serves_unmodified_files(docroot: Path):
+    bundle = await load_docroot_bundle(docroot)
+
+    assert bundle is not None
+    assert len(bundle) == 3
+    assert get_bundled_text(docroot / "guide" / "intro.md") == "---\ntype: user/information\n---\nIntro\n"
+    assert await read_docroot_text(docroot / "_commands" / "help.mustache") == COMMAND
+
+
+@pytest.mark.anyio
+async def test_bundled_frontmatter_skips_yaml(docroot: Path):
+    await load_docroot_bundle(docroot)
+
+    with patch("mcp_guide.render.frontmatter.yaml.safe_load", side_effect=AssertionError("parsed")):
+        parsed = parse_content_with_frontmatter(COMMAND)
+        parsed.frontmatter["description"] = "changed"
+        again = parse_content_with_frontmatter(COMMAND)
+
+    assert again.frontmatter["description"] == "Show help"
+    assert again.content == "Help for {{name}}\n"
+
+
+@pytest.mark.anyio
+async def test_bundled_tokens_seed_token_cache(docroot: Path):
+    await load_docroot_bundle(docroot)
+
+    tokens = get_tokens("Help for {{name}}\n", key=("file", "help"))
+
+    assert ("variable", "name") in tokens
+    assert get_token_cache_stats()["seeded"] == 1
+
+
+@pytest.mark.anyio
+async def test_non_json_frontmatter_parsed_at_runtime(docroot: Path):
+    files = json.loads((docroot / BUNDLE_FILE).read_text())["files"]
+
+    assert "frontmatter" not in files["guide/dated.md"]
+    assert "frontmatter" in files["guide/intro.md"]
+
+
+@pytest.mark.anyio
+async def test_bundled_command_matches_discovery(docroot: Path):
+    await load_docroot_bundle(docroot)
+    path = docroot / "_commands" / "help.mustache"
+
+    expected = build_command_metadata("help", path, parse_content_with_frontmatter(COMMAND).frontmatter)
+
+    assert get_bundled_command(path) == expected
+    assert expected["aliases"] == ["h", "info?verbose"]
+
+
+@pytest.mark.anyio
+async def test_file_modified_before_load_read_from_disk(docroot: Path):
+    _touch(docroot / "guide" / "intro.md", "Edited\n")
+
+    bundle = await load_docroot_bundle(docroot)
+
+    assert bundle is not None
+    assert len(bundle) == 2
+    assert get_bundled_text(docroot / "guide" / "intro.md") is None
+    assert await read_docroot_text(docroot / "guide" / "intro.md") == "Edited\n"
+
+
+@pytest.mark.anyio
+async def test_file_modified_after_load_read_from_disk(docroot: Path):
+    await load_docroot_bundle(docroot)
+    path = docroot / "_commands" / "help.mustache"
+
+    _touch(path, "---\ndescription: New\n---\n")
+
+    assert await read_docroot_text(path) == "---\ndescription: New\n---\n"
+    assert get_bundled_command(path) is None
+
+
+@pytest.mark.anyio
+async def test_bundle_for_other_version_ignored(docroot: Path):
+    await write_version(docroot, "2.0.0")
+
+    assert await load_docroot_bundle(docroot) is None
+    assert get_bundled_text(docroot / "guide" / "intro.md") is None
+
+
+@pytest.mark.anyio
+async def test_unchanged_docroot_writes_identical_bundle(docroot: Path):
+    first = (docroot / BUNDLE_FILE).read_bytes()
+
+    await write_docroot_bundle(docroot, "1.0.0")
+
+    assert (docroot / BUNDLE_FILE).read_bytes() == first
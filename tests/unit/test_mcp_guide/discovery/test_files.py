@@ -1,10 +1,11 @@
 """Tests for file discovery utilities."""
 
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 import pytest
 
+from mcp_guide.config_constants import MAX_DOCUMENTS_PER_GLOB
 from mcp_guide.discovery.files import FileInfo, discover_document_files
 
 
@@ -430,20 +431,15 @@ async def test_discover_document_stored_returns_matching_records():
             created_at="2025-01-01T00:00:00",
             updated_at="2025-06-01T00:00:00",
         ),
-        DocumentRecord(
-            id=2,
-            category="docs",
-            name="notes.txt",
-            source="manual",
-            source_type="text",
-            metadata={},
-            created_at="2025-01-01T00:00:00",
-            updated_at="2025-06-01T00:00:00",
-        ),
     ]
-    with patch("mcp_guide.discovery.files.list_documents", new=AsyncMock(return_value=records)):
+    with patch("mcp_guide.discovery.files.list_documents", new=AsyncMock(return_value=records)) as mock_list:
         result = await discover_document_stored("docs", ["*.md"])
 
+    # Matching and the per-glob limit are delegated to the store
+    mock_list.assert_awaited_once()
+    assert mock_list.call_args.args == ("docs",)
+    assert "*.md" in mock_list.call_args.kwargs["patterns"]
+    assert mock_list.call_args.kwargs["limit"] == MAX_DOCUMENTS_PER_GLOB
     assert len(result) == 1
     assert result[0].name == "guide.md"
     assert result[0].source == "store"
@@ -504,24 +500,14 @@ async def test_discover_document_stored_empty_when_no_match():
     from unittest.mock import AsyncMock, patch
 
     from mcp_guide.discovery.files import discover_document_stored
-    from mcp_guide.store.document_store import DocumentRecord
 
-    records = [
-        DocumentRecord(
-            id=1,
-            category="docs",
-            name="guide.md",
-            source="x",
-            source_type="url",
-            metadata={},
-            created_at="2025-01-01T00:00:00",
-            updated_at="2025-06-01T00:00:00",
-        ),
-    ]
-    with patch("mcp_guide.discovery.files.list_documents", new=AsyncMock(return_value=records)):
+    with patch("mcp_guide.discovery.files.list_documents", new=AsyncMock(return_value=[])) as mock_list:
         result = await discover_document_stored("docs", ["*.yaml"])
 
     assert result == []
+    patterns = mock_list.call_args.kwargs["patterns"]
+    assert "*.yaml" in patterns
+    assert not any(PurePosixPath("guide.md").full_match(p) for p in patterns)
 
 
 @pytest.mark.anyio
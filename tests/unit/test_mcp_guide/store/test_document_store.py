@@ -3,11 +3,17 @@
 import pytest
 
 from mcp_guide.store.document_store import (
+    _CREATE_TABLE,
+    _get_conn,
     add_document,
     get_document,
     get_document_content,
+    get_documents,
+    get_store_generation,
+    get_store_stats,
     list_documents,
     remove_document,
+    run_maintenance,
     update_document,
 )
 
@@ -45,6 +51,33 @@ async def test_get_document_content_missing_returns_none(db):
     assert await get_document_content("docs", "nonexistent", db_path=db) is None
 
 
+@pytest.mark.anyio
+async def test_get_documents_returns_content_keyed_by_name(db):
+    await add_document("docs", "a", "/a", "file", "A", db_path=db)
+    await add_document("docs", "b", "/b", "file", "B", db_path=db)
+    await add_document("other", "a", "/a", "file", "other A", db_path=db)
+
+    records = await get_documents("docs", ["a", "b", "missing"], db_path=db)
+    assert set(records) == {"a", "b"}
+    assert records["a"].content == "A"
+    assert records["b"].content == "B"
+
+
+@pytest.mark.anyio
+async def test_get_documents_empty_names_returns_empty(db):
+    assert await get_documents("docs", [], db_path=db) == {}
+
+
+@pytest.mark.anyio
+async def test_get_documents_large_batch_uses_temp_table(db, monkeypatch):
+    monkeypatch.setattr("mcp_guide.store.document_store._MAX_IN_PARAMS", 2)
+    for name in ("a", "b", "c"):
+        await add_document("docs", name, f"/{name}", "file", name.upper(), db_path=db)
+
+    records = await get_documents("docs", ["a", "b", "c", "c", "missing"], db_path=db)
+    assert {name: r.content for name, r in records.items()} == {"a": "A", "b": "B", "c": "C"}
+
+
 @pytest.mark.anyio
 async def test_upsert_updates_content_and_timestamp(db):
     first = (await add_document("docs", "readme", "/path/readme.md", "file", "v1", db_path=db)).record
@@ -74,6 +107,25 @@ async def test_remove_missing_returns_false(db):
     assert await remove_document("docs", "nonexistent", db_path=db) is False
 
 
+@pytest.mark.anyio
+async def test_store_generation_reflects_writes_from_other_connections(db):
+    await add_document("docs", "readme", "/path/readme.md", "file", "v1", mtime=1.0, db_path=db)
+    before = await get_store_generation(db)
+
+    # Another server process sharing the store writes through its own connection
+    conn = _get_conn(db)
+    with conn:
+        conn.execute("UPDATE documents SET content = 'v2' WHERE name = 'readme'")
+    conn.close()
+    edited = await get_store_generation(db)
+
+    assert edited != before
+    assert (await add_document("docs", "readme", "/path/readme.md", "file", "v1", mtime=1.0, db_path=db)).skipped
+    assert await get_store_generation(db) == edited
+    await remove_document("docs", "readme", db_path=db)
+    assert await get_store_generation(db) != edited
+
+
 @pytest.mark.anyio
 async def test_list_by_category(db):
     await add_document("docs", "a", "/a", "file", "A", db_path=db)
@@ -302,3 +354,134 @@ async def test_update_multiple_metadata_ops_raises(db):
     await add_document("docs", "file.md", "/path", "file", "content", db_path=db)
     with pytest.raises(ValueError, match="mutually exclusive"):
         await update_document("docs", "file.md", metadata_add={"a": "1"}, metadata_clear=["b"], db_path=db)
+
+
+@pytest.mark.anyio
+async def test_list_documents_patterns_filter_by_segment(db):
+    for name in ("guide.md", "notes.txt", "sub/deep.md", "Upper.MD"):
+        await add_document("docs", name, "x", "file", "c", db_path=db)
+    records = await list_documents("docs", db_path=db, patterns=["*.md"])
+    assert [r.name for r in records] == ["guide.md"]
+
+    records = await list_documents("docs", db_path=db, patterns=["sub/*.md", "*.txt"])
+    assert [r.name for r in records] == ["notes.txt", "sub/deep.md"]
+
+
+@pytest.mark.anyio
+async def test_list_documents_patterns_brackets(db):
+    for name in ("a1.md", "b1.md", "c1.md"):
+        await add_document("docs", name, "x", "file", "c", db_path=db)
+    records = await list_documents("docs", db_path=db, patterns=["[!a]1.md"])
+    assert [r.name for r in records] == ["b1.md", "c1.md"]
+    records = await list_documents("docs", db_path=db, patterns=["[ab]1.md"])
+    assert [r.name for r in records] == ["a1.md", "b1.md"]
+
+
+@pytest.mark.anyio
+async def test_list_documents_recursive_pattern_falls_back(db):
+    for name in ("top.md", "sub/deep.md", "sub/deep.txt"):
+        await add_document("docs", name, "x", "file", "c", db_path=db)
+    records = await list_documents("docs", db_path=db, patterns=["**/*.md"])
+    assert [r.name for r in records] == ["sub/deep.md", "top.md"]
+
+
+@pytest.mark.anyio
+async def test_list_documents_limit(db):
+    for i in range(5):
+        await add_document("docs", f"doc{i}.md", "x", "file", "c", db_path=db)
+    assert len(await list_documents("docs", db_path=db, patterns=["*.md"], limit=3)) == 3
+    assert len(await list_documents("docs", db_path=db, patterns=["**/*.md"], limit=2)) == 2
+
+
+@pytest.mark.anyio
+async def test_list_documents_empty_patterns(db):
+    await add_document("docs", "guide.md", "x", "file", "c", db_path=db)
+    assert await list_documents("docs", db_path=db, patterns=[]) == []
+
+
+@pytest.mark.anyio
+async def test_list_documents_metadata_predicates(db):
+    await add_document(
+        "docs", "a", "x", "file", "c", metadata={"type": "agent/instruction", "description": "A"}, db_path=db
+    )
+    await add_document(
+        "docs", "b", "https://x", "url", "c", metadata={"type": "user/information", "tier": 2}, db_path=db
+    )
+    await add_document("docs", "c", "x", "file", "c", db_path=db)
+
+    by_type = await list_documents("docs", db_path=db, metadata={"type": "user/information"})
+    assert [r.name for r in by_type] == ["b"]
+    assert [r.name for r in await list_documents("docs", db_path=db, source_type="url")] == ["b"]
+    assert [r.name for r in await list_documents("docs", db_path=db, has_description=True)] == ["a"]
+    assert [r.name for r in await list_documents("docs", db_path=db, has_description=False)] == ["b", "c"]
+    assert [r.name for r in await list_documents("docs", db_path=db, metadata={"tier": 2})] == ["b"]
+    assert [r.name for r in await list_documents("docs", db_path=db, metadata={"type": None})] == ["c"]
+
+
+@pytest.mark.anyio
+async def test_list_documents_metadata_rejects_non_scalar(db):
+    with pytest.raises(ValueError, match="scalar"):
+        await list_documents("docs", db_path=db, metadata={"tags": ["a"]})
+
+
+@pytest.mark.anyio
+async def test_metadata_columns_added_to_existing_database(db):
+    import sqlite3
+
+    conn = sqlite3.connect(db)
+    conn.executescript(_CREATE_TABLE)
+    conn.execute(
+        "INSERT INTO documents (category, name, source, source_type, content, metadata, created_at, updated_at)"
+        " VALUES ('docs', 'old', 'x', 'file', 'c', ?, 'now', 'now')",
+        ('{"type": "user/information"}',),
+    )
+    conn.execute(
+        "INSERT INTO documents (category, name, source, source_type, content, metadata, created_at, updated_at)"
+        " VALUES ('docs', 'broken', 'x', 'file', 'c', 'not json', 'now', 'now')"
+    )
+    conn.commit()
+    conn.close()
+
+    records = await list_documents("docs", db_path=db, metadata={"type": "user/information"})
+    assert [r.name for r in records] == ["old"]
+
+    conn = _get_conn(db)
+    try:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM documents WHERE category = ? AND meta_type = ?", ("docs", "x")
+        ).fetchall()
+    finally:
+        conn.close()
+    assert any("idx_documents_meta_type" in row["detail"] for row in plan)
+
+
+@pytest.mark.anyio
+async def test_run_maintenance_reclaims_free_pages(db):
+    for i in range(50):
+        await add_document("docs", f"doc{i}", "x", "file", "x" * 4000, db_path=db)
+    for i in range(50):
+        await remove_document("docs", f"doc{i}", db_path=db)
+    assert (await get_store_stats(db_path=db))["free_pages"] > 0
+
+    summary = await run_maintenance(db_path=db)
+
+    assert summary["pages_freed"] > 0
+    stats = await get_store_stats(db_path=db)
+    assert stats["free_pages"] == 0
+    assert stats["wal_bytes"] == 0
+
+
+@pytest.mark.anyio
+async def test_get_store_stats(db):
+    await add_document("docs", "a", "x", "file", "hello", db_path=db)
+    await add_document("notes", "b", "x", "file", "héllo", db_path=db)
+
+    stats = await get_store_stats(db_path=db)
+
+    assert stats["documents"] == 2
+    assert stats["categories"] == {"docs": 1, "notes": 1}
+    assert stats["content_bytes"] == 11
+    assert stats["file_bytes"] > 0
+    assert 0.0 <= stats["fragmentation"] <= 1.0
+    assert stats["latency"]["samples"] > 0
+    assert stats["latency"]["p50_ms"] <= stats["latency"]["p99_ms"] <= stats["latency"]["max_ms"]
@@ -0,0 +1,72 @@
+"""Tests for StoreMaintenanceTask."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mcp_guide.task_manager.interception import EventType
+from mcp_guide.tasks.store_maintenance_task import StoreMaintenanceTask
+
+_MODULE = "mcp_guide.tasks.store_maintenance_task"
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "documents.db"
+    path.touch()
+    return path
+
+
+@pytest.fixture
+def task(task_manager):
+    return StoreMaintenanceTask(task_manager)
+
+
+def _patched(db, *, operations=1, idle=600.0):
+    return (
+        patch(f"{_MODULE}.get_documents_db", return_value=db),
+        patch(f"{_MODULE}.operation_count", return_value=operations),
+        patch(f"{_MODULE}.seconds_since_activity", return_value=idle),
+        patch(f"{_MODULE}.run_maintenance", new=AsyncMock(return_value={})),
+    )
+
+
+@pytest.mark.anyio
+async def test_ignores_non_timer_events(task):
+    assert await task.handle_event(EventType.FS_FILE_CONTENT, {}) is None
+
+
+@pytest.mark.anyio
+async def test_skips_when_database_missing(task, tmp_path):
+    db, operations, idle, maintain = _patched(tmp_path / "missing.db")
+    with db, operations, idle, maintain as mock_maintain:
+        assert await task.handle_event(EventType.TIMER, {}) is None
+    mock_maintain.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_runs_once_per_burst_of_activity(task, db):
+    db_patch, operations, idle, maintain = _patched(db)
+    with db_patch, operations, idle, maintain as mock_maintain:
+        result = await task.handle_event(EventType.TIMER, {})
+        assert result is not None and result.result is True
+        # No store operations since the last run
+        assert await task.handle_event(EventType.TIMER, {}) is None
+    mock_maintain.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_waits_while_store_recently_active(task, db):
+    db_patch, operations, idle, maintain = _patched(db, idle=1.0)
+    with db_patch, operations, idle, maintain as mock_maintain:
+        assert await task.handle_event(EventType.TIMER, {}) is None
+    mock_maintain.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_waits_while_instructions_queued(task, task_manager, db):
+    await task_manager.queue_instruction("pending")
+    db_patch, operations, idle, maintain = _patched(db)
+    with db_patch, operations, idle, maintain as mock_maintain:
+        assert await task.handle_event(EventType.TIMER, {}) is None
+    mock_maintain.assert_not_awaited()
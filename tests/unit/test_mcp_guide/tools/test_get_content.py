@@ -320,3 +320,331 @@ async def test_get_content_flag_resolution(tmp_path, monkeypatch, project_flags,
         # MimeFormatter behavior - should contain MIME-like structure
         assert "# Test Content" in content
         assert "Some text." in content
+
+
+@pytest.mark.anyio
+async def test_get_content_exported_reads_frontmatter_only(tmp_path, monkeypatch):
+    """Test that an exported expression is answered from frontmatter, without rendering content."""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+
+    from mcp_guide.content.gathering import gather_content
+    from mcp_guide.models.project import ExportedTo
+    from mcp_guide.tools.tool_content import compute_metadata_hash
+
+    category_dir = tmp_path / "guide"
+    category_dir.mkdir()
+    (category_dir / "README.md").write_text("---\ntype: agent/instruction\ninstruction: Follow the guide\n---\n# Test")
+
+    project_data = Project(
+        name="test",
+        categories={"guide": Category(dir="guide", name="guide", patterns=["README"])},
+        collections={},
+        exports={("guide", None): ExportedTo(path="/export.md", metadata_hash="00000000")},
+    )
+    session = create_mock_session(tmp_path, project_data)
+
+    async def mock_get_session(ctx=None):
+        return session
+
+    monkeypatch.setattr("mcp_guide.tools.tool_helpers.get_session", mock_get_session)
+    monkeypatch.setattr(
+        "mcp_guide.tools.tool_content.read_and_render_file_contents",
+        AsyncMock(side_effect=AssertionError("content rendered")),
+    )
+    render_content = AsyncMock(return_value=SimpleNamespace(content="Exported", instruction="Reference it"))
+    monkeypatch.setattr("mcp_guide.render.rendering.render_content", render_content)
+
+    result = json.loads(await get_content(ContentArgs(expression="guide")))
+
+    assert result["success"] is True
+    assert result["value"] == "Exported"
+    export = render_content.call_args.args[2]["export"]
+    assert export["instruction"] == "Follow the guide"
+    assert export["type"] == "agent/instruction"
+    assert export["stale"] is True
+
+    current_hash = compute_metadata_hash(await gather_content(session, project_data, "guide", prefetch=False))
+    project_data.exports[("guide", None)] = ExportedTo(path="/export.md", metadata_hash=current_hash)
+    await get_content(ContentArgs(expression="guide"))
+
+    assert render_content.call_args.args[2]["export"]["stale"] is False
+
+
+@pytest.mark.anyio
+async def test_get_content_etag_and_if_none_match(tmp_path, monkeypatch):
+    """Test that get_content returns an etag and a short reply when the caller's copy is current."""
+    category_dir = tmp_path / "guide"
+    category_dir.mkdir()
+    (category_dir / "README.md").write_text("# Test")
+
+    project_data = Project(
+        name="test",
+        categories={"guide": Category(dir="guide", name="guide", patterns=["README"])},
+        collections={},
+    )
+
+    async def mock_get_session(ctx=None):
+        return create_mock_session(tmp_path, project_data)
+
+    monkeypatch.setattr("mcp_guide.tools.tool_helpers.get_session", mock_get_session)
+
+    first = json.loads(await get_content(ContentArgs(expression="guide")))
+    etag = first["etag"]
+    assert "# Test" in first["value"]
+
+    unchanged = json.loads(await get_content(ContentArgs(expression="guide", if_none_match=etag)))
+    assert unchanged["etag"] == etag
+    assert unchanged["value"] == f"Content unchanged since {etag}"
+
+    stale = json.loads(await get_content(ContentArgs(expression="guide", if_none_match="0000000000000000")))
+    assert "# Test" in stale["value"]
+    assert stale["etag"] == etag
+
+
+@pytest.mark.anyio
+async def test_get_content_response_cached_while_docroot_unchanged(tmp_path, monkeypatch):
+    """Test that a watched docroot answers repeated requests without rendering until a file changes."""
+    from unittest.mock import AsyncMock
+
+    from mcp_guide.content.responses import clear_response_cache, get_response_cache_stats
+    from mcp_guide.watchers.docroot_watcher import stop_docroot_watchers, watch_docroot
+
+    category_dir = tmp_path / "guide"
+    category_dir.mkdir()
+    readme = category_dir / "README.md"
+    readme.write_text("# Test")
+
+    project_data = Project(
+        name="test",
+        categories={"guide": Category(dir="guide", name="guide", patterns=["README"])},
+        collections={},
+    )
+
+    async def mock_get_session(ctx=None):
+        return create_mock_session(tmp_path, project_data)
+
+    monkeypatch.setattr("mcp_guide.tools.tool_helpers.get_session", mock_get_session)
+
+    clear_response_cache()
+    try:
+        watcher = await watch_docroot(tmp_path)
+        assert watcher is not None
+
+        first = json.loads(await get_content(ContentArgs(expression="guide")))
+
+        with monkeypatch.context() as patched:
+            patched.setattr(
+                "mcp_guide.tools.tool_content.read_and_render_file_contents",
+                AsyncMock(side_effect=AssertionError("content rendered")),
+            )
+            second = json.loads(await get_content(ContentArgs(expression="guide")))
+        assert (second["value"], second["etag"]) == (first["value"], first["etag"])
+        assert get_response_cache_stats()["hits"] == 1
+
+        readme.write_text("# Edited")
+        await watcher.has_changed()
+        edited = json.loads(await get_content(ContentArgs(expression="guide", if_none_match=first["etag"])))
+        assert "# Edited" in edited["value"]
+        assert edited["etag"] != first["etag"]
+    finally:
+        await stop_docroot_watchers()
+        clear_response_cache()
+
+
+@pytest.mark.anyio
+async def test_get_content_pages_within_budget(tmp_path, monkeypatch):
+    """Test that the content-budget flag splits content into pages joined by cursors."""
+    category_dir = tmp_path / "guide"
+    category_dir.mkdir()
+    for index in range(4):
+        (category_dir / f"part{index}.md").write_text(f"# Part {index}\n\n" + "x" * 140)
+
+    project_data = Project(
+        name="test",
+        categories={"guide": Category(dir="guide", name="guide", patterns=["*.md"])},
+        collections={},
+    )
+
+    async def mock_get_session(ctx=None):
+        return create_mock_session(tmp_path, project_data, feature_flags_data={"content-budget": "400"})
+
+    monkeypatch.setattr("mcp_guide.tools.tool_helpers.get_session", mock_get_session)
+
+    pages = []
+    cursor = None
+    while True:
+        page = json.loads(await get_content(ContentArgs(expression="guide", cursor=cursor)))
+        assert page["success"] is True
+        assert len(page["value"].encode()) <= 400
+        pages.append(page["value"])
+        cursor = page.get("next_cursor")
+        if cursor is None:
+            break
+
+    assert len(pages) > 1
+    parts = [f"# Part {index}" for index in range(4) for page in pages if f"# Part {index}" in page]
+    assert sorted(parts) == [f"# Part {index}" for index in range(4)]
+
+
+@pytest.mark.anyio
+async def test_get_content_cursor_refused_after_change(tmp_path, monkeypatch):
+    """Test that a cursor is refused once the gathered files change."""
+    category_dir = tmp_path / "guide"
+    category_dir.mkdir()
+    for index in range(3):
+        (category_dir / f"part{index}.md").write_text("x" * 300)
+
+    project_data = Project(
+        name="test",
+        categories={"guide": Category(dir="guide", name="guide", patterns=["*.md"])},
+        collections={},
+    )
+
+    async def mock_get_session(ctx=None):
+        return create_mock_session(tmp_path, project_data, feature_flags_data={"content-budget": "100 tokens"})
+
+    monkeypatch.setattr("mcp_guide.tools.tool_helpers.get_session", mock_get_session)
+
+    first = json.loads(await get_content(ContentArgs(expression="guide")))
+    assert first["next_cursor"]
+
+    (category_dir / "part3.md").write_text("new")
+    refused = json.loads(await get_content(ContentArgs(expression="guide", cursor=first["next_cursor"])))
+
+    assert refused["success"] is False
+    assert refused["error_type"] == "validation_error"
+
+
+@pytest.mark.anyio
+async def test_get_content_response_not_reused_after_store_write_elsewhere(tmp_path, monkeypatch):
+    """Test that a document written by another process sharing the store invalidates cached responses."""
+    from mcp_guide.content.responses import clear_response_cache, get_response_cache_stats
+    from mcp_guide.store.document_store import _get_conn
+    from mcp_guide.watchers.docroot_watcher import stop_docroot_watchers, watch_docroot
+
+    category_dir = tmp_path / "guide"
+    category_dir.mkdir()
+    (category_dir / "README.md").write_text("# Test")
+
+    project_data = Project(
+        name="test",
+        categories={"guide": Category(dir="guide", name="guide", patterns=["README"])},
+        collections={},
+    )
+
+    async def mock_get_session(ctx=None):
+        return create_mock_session(tmp_path, project_data)
+
+    monkeypatch.setattr("mcp_guide.tools.tool_helpers.get_session", mock_get_session)
+
+    clear_response_cache()
+    try:
+        assert await watch_docroot(tmp_path) is not None
+        await get_content(ContentArgs(expression="guide"))
+
+        # Another server process adds a document through its own connection
+        conn = _get_conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO documents (category, name, source, source_type, content, created_at, updated_at) "
+                "VALUES ('guide', 'elsewhere.md', '/elsewhere.md', 'file', 'Elsewhere', '', '')"
+            )
+        conn.close()
+
+        await get_content(ContentArgs(expression="guide"))
+        assert get_response_cache_stats()["hits"] == 0
+    finally:
+        conn = _get_conn()
+        with conn:
+            conn.execute("DELETE FROM documents WHERE category = 'guide' AND name = 'elsewhere.md'")
+        conn.close()
+        await stop_docroot_watchers()
+        clear_response_cache()
+
+
+@pytest.fixture
+async def stored_notes():
+    """Three stored documents in the guide category, removed afterwards."""
+    from mcp_guide.store.document_store import add_document, remove_document
+
+    names = [f"note{index}.md" for index in range(3)]
+    for name in names:
+        await add_document("guide", name, f"/{name}", "file", f"# {name}\n\n" + "x" * 300)
+    yield names
+    for name in names:
+        await remove_document("guide", name)
+
+
+def _record_store_loads(monkeypatch) -> list[str]:
+    """Record the names of stored documents whose content is fetched by prefetch_stored_content."""
+    from mcp_guide.content import gathering
+
+    loaded: list[str] = []
+    get_documents = gathering.get_documents
+
+    async def recording(category, names, db_path=None):
+        loaded.extend(names)
+        return await get_documents(category, names, db_path)
+
+    monkeypatch.setattr(gathering, "get_documents", recording)
+    return loaded
+
+
+@pytest.mark.anyio
+async def test_get_content_cache_hit_loads_no_stored_content(tmp_path, monkeypatch, stored_notes):
+    """Test that stored document bodies are only read when a response is rendered."""
+    from mcp_guide.content.responses import clear_response_cache, get_response_cache_stats
+    from mcp_guide.watchers.docroot_watcher import stop_docroot_watchers, watch_docroot
+
+    (tmp_path / "guide").mkdir()
+    project_data = Project(
+        name="test",
+        categories={"guide": Category(dir="guide", name="guide", patterns=["note*"])},
+        collections={},
+    )
+
+    async def mock_get_session(ctx=None):
+        return create_mock_session(tmp_path, project_data)
+
+    monkeypatch.setattr("mcp_guide.tools.tool_helpers.get_session", mock_get_session)
+    loaded = _record_store_loads(monkeypatch)
+
+    clear_response_cache()
+    try:
+        assert await watch_docroot(tmp_path) is not None
+        first = json.loads(await get_content(ContentArgs(expression="guide")))
+        assert sorted(loaded) == stored_notes
+
+        loaded.clear()
+        unchanged = json.loads(await get_content(ContentArgs(expression="guide", if_none_match=first["etag"])))
+        assert unchanged["value"] == f"Content unchanged since {first['etag']}"
+        assert get_response_cache_stats()["hits"] == 1
+        assert loaded == []
+    finally:
+        await stop_docroot_watchers()
+        clear_response_cache()
+
+
+@pytest.mark.anyio
+async def test_get_content_page_loads_only_its_stored_content(tmp_path, monkeypatch, stored_notes):
+    """Test that a page reads the stored documents it may hold, not the whole selection."""
+    (tmp_path / "guide").mkdir()
+    project_data = Project(
+        name="test",
+        categories={"guide": Category(dir="guide", name="guide", patterns=["note*"])},
+        collections={},
+    )
+
+    async def mock_get_session(ctx=None):
+        return create_mock_session(tmp_path, project_data, feature_flags_data={"content-budget": "400"})
+
+    monkeypatch.setattr("mcp_guide.tools.tool_helpers.get_session", mock_get_session)
+    monkeypatch.setattr("mcp_guide.tools.tool_content.PAGE_PREFETCH_BATCH", 1)
+    loaded = _record_store_loads(monkeypatch)
+
+    page = json.loads(await get_content(ContentArgs(expression="guide")))
+
+    assert page["next_cursor"]
+    assert len(loaded) == 2
+    assert len(set(loaded)) == 2
@@ -38,3 +38,19 @@ async def test_remove_nonexistent_document():
 
     assert result.success is False
     assert "not found" in result.error
+
+
+@pytest.mark.anyio
+async def test_document_stats_reports_store_health():
+    """document_stats returns store statistics with a summary message."""
+    from unittest.mock import AsyncMock, patch
+
+    from mcp_guide.tools.tool_document import DocumentStatsArgs, internal_document_stats
+
+    stats = {"documents": 3, "categories": {"docs": 2, "notes": 1}, "fragmentation": 0.0}
+    with patch("mcp_guide.tools.tool_document.get_store_stats", new=AsyncMock(return_value=stats)):
+        result = await internal_document_stats(DocumentStatsArgs())
+
+    assert result.success is True
+    assert result.value == stats
+    assert "3 documents in 2 categories" in result.message